@@ -99,7 +99,12 @@ class Decoder:
                 message.__class__.__name__,
             )
         )
-        for k_dict, v_dict in message.__dict__.items():
+        names = [name for cls in type(message).__mro__ for name in getattr(cls, "__slots__", ())]
+        names.extend(getattr(message, "__dict__", {}))
+        for k_dict in dict.fromkeys(names):
+            if k_dict.startswith("_") or getattr(message, k_dict, None) is None:
+                continue
+            v_dict = getattr(message, k_dict)
             if isinstance(v_dict, dict):
                 print("%-15s =" % k_dict)  # pylint: disable=consider-using-f-string
                 for k_item, v_item in v_dict.items():
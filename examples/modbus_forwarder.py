@@ -14,7 +14,9 @@ a) server receives a read/write request from external client:
 Both server and client are tcp based, but it can be easily modified to any server/client
 (see client_sync.py and server_sync.py for other communication types)
 
-**WARNING** This example is a simple solution, that do only forward read requests.
+The client is async, and AsyncRemoteSlaveContext coalesces identical concurrent
+reads (optionally caching them for --cache_ttl seconds) and batches adjacent
+writes into one request.
 """
 import asyncio
 import logging
@@ -29,9 +31,9 @@ except ImportError:
           for more information.")
     sys.exit(-1)
 
-from pymodbus_3p3v.client import ModbusTcpClient
+from pymodbus_3p3v.client import AsyncModbusTcpClient
 from pymodbus_3p3v.datastore import ModbusServerContext
-from pymodbus_3p3v.datastore.remote import RemoteSlaveContext
+from pymodbus_3p3v.datastore.remote import AsyncRemoteSlaveContext
 from pymodbus_3p3v.server import StartAsyncTcpServer
 
 
@@ -48,22 +50,24 @@ async def run_forwarder(args):
     txt = f"### start forwarder, listen {args.port}, connect to {args.client_port}"
     _logger.info(txt)
 
-    args.client = ModbusTcpClient(
+    args.client = AsyncModbusTcpClient(
         host="localhost",
         port=args.client_port,
     )
-    args.client.connect()
+    await args.client.connect()
     assert args.client.connected
     # If required to communicate with a specified client use slave=<slave_id>
-    # in RemoteSlaveContext
+    # in AsyncRemoteSlaveContext
     # For e.g to forward the requests to slave with slave address 1 use
-    # store = RemoteSlaveContext(client, slave=1)
+    # store = AsyncRemoteSlaveContext(client, slave=1)
     if args.slaves:
         store = {}
         for i in args.slaves:
-            store[i.to_bytes(1, "big")] = RemoteSlaveContext(args.client, slave=i)
+            store[i.to_bytes(1, "big")] = AsyncRemoteSlaveContext(
+                args.client, slave=i, cache_ttl=args.cache_ttl
+            )
     else:
-        store = RemoteSlaveContext(args.client, slave=1)
+        store = AsyncRemoteSlaveContext(args.client, slave=1, cache_ttl=args.cache_ttl)
     args.context = ModbusServerContext(slaves=store, single=True)
 
     await StartAsyncTcpServer(context=args.context, address=("", args.port))
@@ -82,7 +86,15 @@ async def async_helper():
                     "help": "the port to use",
                     "type": int,
                 },
-            )
+            ),
+            (
+                "--cache_ttl",
+                {
+                    "help": "seconds to cache read values (default 0, no cache)",
+                    "default": 0.0,
+                    "type": float,
+                },
+            ),
         ],
     )
     await run_forwarder(cmd_args)
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Test performance of the checksum backends.
+
+Calculates the crc16 (RTU) of all available backends, and the LRC (ASCII),
+compared with the old implementations, over a workload of 1k, 64k and 1M
+frames (alternating a read request and a response with 64 registers).
+
+The "crcmod" backend is only available with the optional crcmod package::
+
+    pip install pymodbus[crc]
+
+example run:
+
+(pymodbus) % ./performance_checksum.py
+--- 1000 frames
+crc16 old   :     16.60 ms,   16.60 us pr frame
+crc16 crcmod:      0.68 ms,    0.68 us pr frame
+crc16 word  :      3.24 ms,    3.24 us pr frame
+crc16 byte  :      7.13 ms,    7.13 us pr frame
+lrc   old   :      8.74 ms,    8.74 us pr frame
+lrc   new   :      0.83 ms,    0.83 us pr frame
+--- 65536 frames
+crc16 old   :    963.14 ms,   14.70 us pr frame
+crc16 crcmod:     39.43 ms,    0.60 us pr frame
+crc16 word  :    179.06 ms,    2.73 us pr frame
+crc16 byte  :    417.18 ms,    6.37 us pr frame
+lrc   old   :    458.94 ms,    7.00 us pr frame
+lrc   new   :     42.40 ms,    0.65 us pr frame
+--- 1048576 frames
+crc16 old   :  15840.26 ms,   15.11 us pr frame
+crc16 crcmod:    674.48 ms,    0.64 us pr frame
+crc16 word  :   3012.53 ms,    2.87 us pr frame
+crc16 byte  :   7720.65 ms,    7.36 us pr frame
+lrc   old   :   9894.22 ms,    9.44 us pr frame
+lrc   new   :    727.05 ms,    0.69 us pr frame
+"""
+import os
+import time
+from collections.abc import Callable
+
+from pymodbus_3p3v.framer import FramerAscii, FramerRTU
+
+
+FRAME_COUNTS = [1000, 64 * 1024, 1024 * 1024]
+FRAMES = [os.urandom(6), os.urandom(3 + 2 * 64)]
+
+
+def old_compute_CRC(data: bytes) -> int:
+    """Compute crc16, as done before the backends."""
+    crc = 0xFFFF
+    for data_byte in data:
+        idx = FramerRTU.crc16_table[(crc ^ int(data_byte)) & 0xFF]
+        crc = ((crc >> 8) & 0xFF) ^ idx
+    swapped = ((crc << 8) & 0xFF00) | ((crc >> 8) & 0x00FF)
+    return swapped
+
+
+def old_compute_LRC(data: bytes) -> int:
+    """Compute LRC, as done before."""
+    lrc = sum(int(a) for a in data) & 0xFF
+    lrc = (lrc ^ 0xFF) + 1
+    return lrc & 0xFF
+
+
+def run(func: Callable[[bytes], int], frame_count: int) -> float:
+    """Calculate checksum of frame_count frames."""
+    frames = FRAMES * (frame_count // len(FRAMES))
+    start_time = time.perf_counter()
+    for frame in frames:
+        func(frame)
+    return time.perf_counter() - start_time
+
+
+def main():
+    """Run test."""
+    for frame in FRAMES:
+        for func in FramerRTU.crc16_backends.values():
+            assert func(frame) == old_compute_CRC(frame)
+        assert FramerAscii.compute_LRC(frame) == old_compute_LRC(frame)
+    tests = [("crc16 old", old_compute_CRC)]
+    tests += [(f"crc16 {name}", func) for name, func in FramerRTU.crc16_backends.items()]
+    tests += [("lrc   old", old_compute_LRC), ("lrc   new", FramerAscii.compute_LRC)]
+    for frame_count in FRAME_COUNTS:
+        print(f"--- {frame_count} frames")
+        for name, func in tests:
+            run_time = run(func, frame_count)
+            print(f"{name:12}: {run_time * 1000:9.2f} ms, {run_time / frame_count * 1000000:7.2f} us pr frame")
+
+
+if __name__ == "__main__":
+    main()
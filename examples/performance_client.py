@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""Benchmark suite of the clients, results as JSON.
+
+Starts the servers of the package in a background thread (no hardware
+needed):
+
+- tcp on localhost with socket, rtu and ascii framer,
+- udp on localhost with socket framer,
+- serial (rtu framer) on a pty pair (posix only), the 2 pty masters are
+  bridged like a null modem cable,
+- nullmodem (tcp with socket framer, no network, async clients only),
+
+and measures sync and async clients reading 1, 10 and 125 holding
+registers with 1 and 4 concurrent clients (sync clients run in threads),
+async tcp clients are also measured pipelined (max_in_flight=8).
+
+Each scenario is reported with requests/sec and latency (avg, p50, p99,
+max), use --output to save the results as JSON and --baseline to compare
+with an earlier run (e.g. from a previous release)::
+
+    ./performance_client.py --output v3.7.json
+    ...upgrade...
+    ./performance_client.py --baseline v3.7.json --output v3.8.json
+
+example run:
+
+(pymodbus) % ./performance_client.py --requests 1000 --registers 10 --concurrency 1
+scenario                          req/sec  avg ms  p50 ms  p99 ms
+sync/tcp/socket/r10/c1/p1            6166   0.161   0.146   0.370
+sync/tcp/rtu/r10/c1/p1               5002   0.199   0.165   0.801
+...
+sync/serial/rtu/r10/c1/p1             341   2.929   2.365  11.778
+async/tcp/socket/r10/c1/p1           6944   0.144   0.132   0.300
+async/tcp/socket/r10/c1/p8           9640   0.826   0.625   3.771
+...
+async/serial/rtu/r10/c1/p1           2858   0.349   0.227   3.775
+async/nullmodem/socket/r10/c1/p1     9322   0.107   0.103   0.239
+async/nullmodem/socket/r10/c1/p8    11814   0.674   0.568   2.168
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import dataclasses
+import datetime
+import itertools
+import json
+import os
+import platform
+import statistics
+import sys
+import threading
+import time
+
+import pymodbus_3p3v
+from pymodbus_3p3v import FramerType
+from pymodbus_3p3v.client import (
+    AsyncModbusSerialClient,
+    AsyncModbusTcpClient,
+    AsyncModbusUdpClient,
+    ModbusSerialClient,
+    ModbusTcpClient,
+    ModbusUdpClient,
+)
+from pymodbus_3p3v.datastore import (
+    ModbusSequentialDataBlock,
+    ModbusServerContext,
+    ModbusSlaveContext,
+)
+from pymodbus_3p3v.exceptions import ModbusException
+from pymodbus_3p3v.server import ModbusSerialServer, ModbusTcpServer, ModbusUdpServer
+from pymodbus_3p3v.transport import NULLMODEM_HOST
+
+
+HOST = "127.0.0.1"
+BAUDRATE = 115200
+
+# (transport, framer) served, sync clients cannot use nullmodem
+ENDPOINTS = (
+    ("tcp", FramerType.SOCKET),
+    ("tcp", FramerType.RTU),
+    ("tcp", FramerType.ASCII),
+    ("udp", FramerType.SOCKET),
+    ("serial", FramerType.RTU),
+    ("nullmodem", FramerType.SOCKET),
+)
+
+
+@dataclasses.dataclass
+class Scenario:
+    """Benchmark scenario."""
+
+    client: str
+    transport: str
+    framer: FramerType
+    registers: int
+    concurrency: int
+    in_flight: int
+
+    @property
+    def name(self) -> str:
+        """Return unique name (key in the JSON results)."""
+        return (
+            f"{self.client}/{self.transport}/{self.framer.value}/"
+            f"r{self.registers}/c{self.concurrency}/p{self.in_flight}"
+        )
+
+    def valid(self) -> bool:
+        """Return True if the clients support the scenario."""
+        if self.transport == "serial":
+            # 1 master pr. line
+            return hasattr(os, "openpty") and self.concurrency == 1 and self.in_flight == 1
+        if self.client == "sync":
+            return self.transport != "nullmodem" and self.in_flight == 1
+        # pipelining needs tcp with transaction id
+        return self.in_flight == 1 or (self.transport != "udp" and self.framer == FramerType.SOCKET)
+
+
+def build_scenarios(args: argparse.Namespace) -> list[Scenario]:
+    """Return the valid combinations of the requested parameters."""
+    scenarios = [
+        Scenario(client, transport, framer, registers, concurrency, in_flight)
+        for client, (transport, framer), registers, concurrency, in_flight in itertools.product(
+            args.clients, ENDPOINTS, args.registers, args.concurrency, args.in_flight
+        )
+        if transport in args.transports
+    ]
+    return [scenario for scenario in scenarios if scenario.valid()]
+
+
+class ServerThread:
+    """Run the servers in an event loop in a background thread."""
+
+    def __init__(self, port: int) -> None:
+        """Initialize."""
+        self.ports = {endpoint: port + inx for inx, endpoint in enumerate(ENDPOINTS)}
+        self.serial_port = ""
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.server = None
+        self.task: asyncio.Task | None = None
+        self.ptys: list[int] = []
+
+    def run(self, coro):
+        """Run coroutine in the server loop and return the result."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def _bridge(self, source: int, destination: int) -> None:
+        """Copy data between the pty masters."""
+        with contextlib.suppress(OSError):
+            os.write(destination, os.read(source, 1024))
+
+    async def _start(self, transport: str, framer: FramerType) -> None:
+        """Start server."""
+        context = ModbusServerContext(
+            slaves=ModbusSlaveContext(hr=ModbusSequentialDataBlock(0, list(range(200))), zero_mode=True),
+            single=True,
+        )
+        port = self.ports[(transport, framer)]
+        if transport == "tcp":
+            server = ModbusTcpServer(context, framer=framer, address=(HOST, port))
+        elif transport == "udp":
+            server = ModbusUdpServer(context, framer=framer, address=(HOST, port))
+        elif transport == "nullmodem":
+            server = ModbusTcpServer(context, framer=framer, address=(NULLMODEM_HOST, port))
+        else:
+            server_master, server_slave = os.openpty()
+            client_master, client_slave = os.openpty()
+            self.ptys = [server_master, server_slave, client_master, client_slave]
+            self.loop.add_reader(server_master, self._bridge, server_master, client_master)
+            self.loop.add_reader(client_master, self._bridge, client_master, server_master)
+            self.serial_port = os.ttyname(client_slave)
+            server = ModbusSerialServer(context, framer=framer, port=os.ttyname(server_slave), baudrate=BAUDRATE)
+        self.server = server
+        self.task = asyncio.create_task(server.serve_forever())
+        await asyncio.sleep(0.1)
+
+    async def _stop(self) -> None:
+        """Stop server."""
+        await self.server.shutdown()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self.task
+        for fd in self.ptys[::2]:
+            self.loop.remove_reader(fd)
+        for fd in self.ptys:
+            os.close(fd)
+        self.ptys = []
+
+    @contextlib.contextmanager
+    def serve(self, scenario: Scenario):
+        """Run the server of scenario (a fresh server for each scenario)."""
+        self.run(self._start(scenario.transport, scenario.framer))
+        try:
+            yield
+        finally:
+            self.run(self._stop())
+
+    def start(self) -> None:
+        """Start thread."""
+        self.thread.start()
+
+    async def _cancel_tasks(self) -> None:
+        """Cancel tasks left by the servers."""
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stop(self) -> None:
+        """Stop thread."""
+        self.run(self._cancel_tasks())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+
+def sync_client(servers: ServerThread, scenario: Scenario):
+    """Return connected sync client."""
+    port = servers.ports[(scenario.transport, scenario.framer)]
+    if scenario.transport == "tcp":
+        client = ModbusTcpClient(HOST, port=port, framer=scenario.framer)
+    elif scenario.transport == "udp":
+        client = ModbusUdpClient(HOST, port=port, framer=scenario.framer)
+    else:
+        client = ModbusSerialClient(servers.serial_port, framer=scenario.framer, baudrate=BAUDRATE)
+    if not client.connect():
+        raise ModbusException(f"{scenario.name}: cannot connect")
+    return client
+
+
+async def async_client(servers: ServerThread, scenario: Scenario):
+    """Return connected async client."""
+    port = servers.ports[(scenario.transport, scenario.framer)]
+    if scenario.transport in ("tcp", "nullmodem"):
+        host = NULLMODEM_HOST if scenario.transport == "nullmodem" else HOST
+        client = AsyncModbusTcpClient(host, port=port, framer=scenario.framer, max_in_flight=scenario.in_flight)
+    elif scenario.transport == "udp":
+        client = AsyncModbusUdpClient(HOST, port=port, framer=scenario.framer)
+    else:
+        client = AsyncModbusSerialClient(servers.serial_port, framer=scenario.framer, baudrate=BAUDRATE)
+    if not await client.connect():
+        raise ModbusException(f"{scenario.name}: cannot connect")
+    return client
+
+
+def run_sync(servers: ServerThread, scenario: Scenario, requests: int) -> tuple[float, list[float], int]:
+    """Run scenario with sync clients (one thread pr. client)."""
+    clients = [sync_client(servers, scenario) for _ in range(scenario.concurrency)]
+    samples: list[list[float]] = [[] for _ in clients]
+    errors = [0] * len(clients)
+
+    def worker(inx: int) -> None:
+        """Send requests, one at a time."""
+        client = clients[inx]
+        for _ in range(requests // len(clients)):
+            start = time.perf_counter()
+            try:
+                if client.read_holding_registers(0, count=scenario.registers, slave=1).isError():
+                    errors[inx] += 1
+            except ModbusException:
+                errors[inx] += 1
+            samples[inx].append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=worker, args=(inx,)) for inx in range(len(clients))]
+    start_time = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    run_time = time.perf_counter() - start_time
+    for client in clients:
+        client.close()
+    return run_time, [sample for client_samples in samples for sample in client_samples], sum(errors)
+
+
+async def run_async(servers: ServerThread, scenario: Scenario, requests: int) -> tuple[float, list[float], int]:
+    """Run scenario with async clients (in_flight requests pr. client)."""
+    clients = [await async_client(servers, scenario) for _ in range(scenario.concurrency)]
+    samples: list[float] = []
+    errors = 0
+
+    async def worker(client) -> None:
+        """Send requests, one at a time."""
+        nonlocal errors
+        for _ in range(requests // (len(clients) * scenario.in_flight)):
+            start = time.perf_counter()
+            try:
+                if (await client.read_holding_registers(0, count=scenario.registers, slave=1)).isError():
+                    errors += 1
+            except ModbusException:
+                errors += 1
+            samples.append(time.perf_counter() - start)
+
+    start_time = time.perf_counter()
+    await asyncio.gather(*[worker(client) for client in clients for _ in range(scenario.in_flight)])
+    run_time = time.perf_counter() - start_time
+    for client in clients:
+        client.close()
+    return run_time, samples, errors
+
+
+def summarize(scenario: Scenario, run_time: float, samples: list[float], errors: int) -> dict:
+    """Return result of scenario (JSON compatible)."""
+    samples.sort()
+    return {
+        "name": scenario.name,
+        "client": scenario.client,
+        "transport": scenario.transport,
+        "framer": scenario.framer.value,
+        "registers": scenario.registers,
+        "concurrency": scenario.concurrency,
+        "in_flight": scenario.in_flight,
+        "requests": len(samples),
+        "errors": errors,
+        "seconds": round(run_time, 6),
+        "requests_per_sec": round(len(samples) / run_time, 1) if run_time else 0.0,
+        "latency_ms": {
+            "avg": round(statistics.fmean(samples) * 1000, 4) if samples else 0.0,
+            "p50": round(samples[len(samples) // 2] * 1000, 4) if samples else 0.0,
+            "p99": round(samples[int(len(samples) * 0.99)] * 1000, 4) if samples else 0.0,
+            "max": round(samples[-1] * 1000, 4) if samples else 0.0,
+        },
+    }
+
+
+def get_commandline(cmdline: list[str] | None = None) -> argparse.Namespace:
+    """Read and check command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark the clients against local servers.")
+    parser.add_argument("--requests", type=int, default=1000, help="requests pr. scenario")
+    parser.add_argument("--clients", nargs="+", choices=("sync", "async"), default=["sync", "async"])
+    parser.add_argument(
+        "--transports",
+        nargs="+",
+        choices=("tcp", "udp", "serial", "nullmodem"),
+        default=["tcp", "udp", "serial", "nullmodem"],
+    )
+    parser.add_argument("--registers", nargs="+", type=int, default=[1, 10, 125], help="registers pr. request")
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 4], help="concurrent clients")
+    parser.add_argument("--in_flight", nargs="+", type=int, default=[1, 8], help="pipelining depth (async tcp)")
+    parser.add_argument("--port", type=int, default=5020, help="first port used by the servers")
+    parser.add_argument("--output", help="write results as JSON to file ('-' for stdout)")
+    parser.add_argument("--baseline", help="JSON results to compare with")
+    return parser.parse_args(cmdline)
+
+
+def main(cmdline: list[str] | None = None) -> dict:
+    """Run benchmarks and return the report."""
+    args = get_commandline(cmdline)
+    out = sys.stderr if args.output == "-" else sys.stdout
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = {result["name"]: result for result in json.load(file)["results"]}
+    servers = ServerThread(args.port)
+    servers.start()
+    results = []
+    print(f"{'scenario':32} {'req/sec':>8} {'avg ms':>7} {'p50 ms':>7} {'p99 ms':>7}", file=out)
+    try:
+        for scenario in build_scenarios(args):
+            with servers.serve(scenario):
+                if scenario.client == "sync":
+                    measured = run_sync(servers, scenario, args.requests)
+                else:
+                    measured = servers.run(run_async(servers, scenario, args.requests))
+            result = summarize(scenario, *measured)
+            results.append(result)
+            line = (
+                f"{scenario.name:32} {result['requests_per_sec']:8.0f} {result['latency_ms']['avg']:7.3f} "
+                f"{result['latency_ms']['p50']:7.3f} {result['latency_ms']['p99']:7.3f}"
+            )
+            if (old := baseline.get(scenario.name)) and old["requests_per_sec"]:
+                line += f" {(result['requests_per_sec'] / old['requests_per_sec'] - 1) * 100:+6.1f}%"
+            if result["errors"]:
+                line += f" ({result['errors']} errors)"
+            print(line, file=out)
+    finally:
+        servers.stop()
+    report = {
+        "pymodbus": pymodbus_3p3v.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "time": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "results": results,
+    }
+    if args.output == "-":
+        json.dump(report, sys.stdout, indent=2)
+    elif args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Test performance of register to value conversion.
+
+Decodes blocks of 125 registers (a full read_holding_registers response)
+containing a mix of UINT16, INT32 and FLOAT32 tags, converted one value at
+a time (convert_from_registers) and in one pass with RegisterSchema
+(struct and, if installed, numpy, where all blocks are decoded in one call).
+
+example run:
+
+(pymodbus) % ./performance_convert.py
+--- 2000 blocks of 125 registers, 124000 tags
+convert_from_registers      :   337.76 ms,       367123 tags/sec
+RegisterSchema.decode       :    14.95 ms,      8294639 tags/sec
+RegisterSchema.decode_numpy :     8.32 ms,     14904518 tags/sec
+"""
+import time
+
+from pymodbus_3p3v.client.mixin import ModbusClientMixin
+from pymodbus_3p3v.client.schema import NUMPY_MISSING, RegisterSchema
+
+
+DATATYPE = ModbusClientMixin.DATATYPE
+BLOCK_COUNT = 2000
+REGISTERS = list(range(0, 125 * 401, 401))
+FIELDS = [
+    (offset, (DATATYPE.UINT16, DATATYPE.INT32, DATATYPE.FLOAT32)[offset % 5 % 3])
+    for offset in range(0, 123, 2)
+]
+
+
+def convert_single() -> list:
+    """Convert one value at a time."""
+    return [
+        ModbusClientMixin.convert_from_registers(REGISTERS[offset : offset + datatype.value[1]], datatype)
+        for offset, datatype in FIELDS
+    ]
+
+
+def main():
+    """Run test."""
+    schema = RegisterSchema(FIELDS)
+    assert schema.decode(REGISTERS) == convert_single()
+    tests = [
+        ("convert_from_registers", convert_single, BLOCK_COUNT),
+        ("RegisterSchema.decode", lambda: schema.decode(REGISTERS), BLOCK_COUNT),
+    ]
+    if not NUMPY_MISSING:
+        all_blocks = REGISTERS[: schema.size] * BLOCK_COUNT
+        tests.append(("RegisterSchema.decode_numpy", lambda: schema.decode_numpy(all_blocks), 1))
+    tag_count = BLOCK_COUNT * len(FIELDS)
+    print(f"--- {BLOCK_COUNT} blocks of 125 registers, {tag_count} tags")
+    for name, func, loops in tests:
+        start_time = time.perf_counter()
+        for _ in range(loops):
+            func()
+        run_time = time.perf_counter() - start_time
+        print(f"{name:28}: {run_time * 1000:8.2f} ms, {tag_count / run_time:12.0f} tags/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Test performance of disabled debug logging.
+
+"call" is the cost of one disabled Log.debug() in a hot path:
+
+- "unguarded" is calling Log.debug() (classmethod call, argument packing
+  and the level check), as the hot paths did before Log.debug_enabled,
+- "eager" is the same with an argument built before the call,
+- "guarded" is ``if Log.debug_enabled: Log.debug(...)`` with debug
+  logging switched off (level above debug, the default).
+
+"frame" is receiving responses in the async client (transaction added,
+frame received, decoded and matched to the transaction), with the debug
+calls in the hot path checking the level (unguarded) or skipped (guarded).
+
+example run:
+
+(pymodbus) % ./performance_logging.py
+--- call, 1000000 calls
+Log.debug(txt, tid)                   unguarded:  0.330 us, guarded:  0.035 us
+Log.debug(txt, data, ":hex")          unguarded:  0.349 us, guarded:  0.046 us
+Log.debug(txt, hexlify_packets(data)) eager    :  6.170 us, guarded:  0.037 us
+--- frame, 20000 frames
+read_holding_registers(10) response   unguarded: 12.46 us, guarded:  7.65 us, 38.6 %
+"""
+import asyncio
+import logging
+import time
+import timeit
+
+from pymodbus_3p3v import FramerType
+from pymodbus_3p3v.client.modbusclientprotocol import ModbusClientProtocol
+from pymodbus_3p3v.framer import FramerSocket
+from pymodbus_3p3v.logging import Log
+from pymodbus_3p3v.pdu import DecodePDU
+from pymodbus_3p3v.pdu.register_read_message import (
+    ReadHoldingRegistersRequest,
+    ReadHoldingRegistersResponse,
+)
+from pymodbus_3p3v.transport import CommParams, CommType
+from pymodbus_3p3v.utilities import hexlify_packets
+
+
+CALL_COUNT = 1000000
+FRAME_COUNT = 20000
+DATA = bytes(range(24))
+
+
+def measure_call(statement: str) -> float:
+    """Return us pr. statement."""
+    globals_ = {"Log": Log, "hexlify_packets": hexlify_packets, "data": DATA, "tid": 17}
+    return min(timeit.repeat(statement, globals=globals_, number=CALL_COUNT, repeat=3)) / CALL_COUNT * 1e6
+
+
+def build_frames() -> list[bytes]:
+    """Build responses (socket framer)."""
+    framer = FramerSocket(DecodePDU(True))
+    frames = []
+    for tid in range(1, FRAME_COUNT + 1):
+        pdu = ReadHoldingRegistersResponse(list(range(10)))
+        pdu.transaction_id = tid
+        pdu.slave_id = 1
+        frames.append(framer.buildFrame(pdu))
+    return frames
+
+
+async def measure_frames(frames: list[bytes]) -> float:
+    """Return us pr. received frame."""
+    protocol = ModbusClientProtocol(
+        FramerType.SOCKET,
+        CommParams(comm_type=CommType.TCP, host="localhost", port=5020),
+    )
+    loop = asyncio.get_running_loop()
+    requests = []
+    for tid in range(1, FRAME_COUNT + 1):
+        request = ReadHoldingRegistersRequest(0, 10)
+        request.transaction_id = tid
+        request.fut = loop.create_future()
+        requests.append(request)
+    start_time = time.perf_counter()
+    for request, frame in zip(requests, frames):
+        protocol.transaction.addTransaction(request)
+        protocol.data_received(frame)
+    used_time = time.perf_counter() - start_time
+    assert all(request.fut.done() for request in requests)
+    return used_time / FRAME_COUNT * 1e6
+
+
+def switch(guarded: bool) -> None:
+    """Switch debug logging off (guarded) or only disable it by level (unguarded)."""
+    Log.setLevel(logging.INFO)
+    Log.debug_enabled = not guarded
+
+
+async def main():
+    """Run test."""
+    print(f"--- call, {CALL_COUNT} calls")
+    for name, label, statement in (
+        ("Log.debug(txt, tid)", "unguarded", 'Log.debug("Adding transaction {}", tid)'),
+        ('Log.debug(txt, data, ":hex")', "unguarded", 'Log.debug("Processing: {}", data, ":hex")'),
+        ("Log.debug(txt, hexlify_packets(data))", "eager    ", 'Log.debug("Clearing: {}", hexlify_packets(data))'),
+    ):
+        switch(False)
+        unguarded = measure_call(statement)
+        switch(True)
+        guarded = measure_call(f"if Log.debug_enabled: {statement}")
+        print(f"{name:37} {label}: {unguarded:6.3f} us, guarded: {guarded:6.3f} us")
+
+    print(f"--- frame, {FRAME_COUNT} frames")
+    frames = build_frames()
+    results = []
+    for guarded in (False, True):
+        switch(guarded)
+        results.append(min([await measure_frames(frames) for _ in range(3)]))
+    saved = (results[0] - results[1]) / results[0] * 100
+    name = "read_holding_registers(10) response"
+    print(f"{name:37} unguarded: {results[0]:5.2f} us, guarded: {results[1]:5.2f} us, {saved:4.1f} %")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Test memory usage and allocations of decoded PDUs.
+
+"retained" is the memory (tracemalloc) held pr. decoded message while
+the messages are alive (e.g. requests queued in a server, responses
+collected by a client), values (registers/bits) included.
+"dict" is the same PDU class with a __dict__ instead of __slots__ (the
+slot space this variant still reserves is subtracted).
+
+"decode" is decoding and releasing one message at a time, with a new
+pdu object pr. message or with the decoder pool
+(DecodePDU(pool_size=...)), "allocated" is the peak memory allocated
+(tracemalloc), a pooled response still allocates the new values, while
+the previous values are only freed when they are replaced.
+
+example run:
+
+(pymodbus) % ./performance_pdu_memory.py
+--- retained, 10000 PDUs
+server, read_holding_registers request      dict:  128 bytes, slots:  112 bytes,  12.6 %
+server, write_register request              dict:  128 bytes, slots:  112 bytes,  12.6 %
+client, read_holding_registers(10) response dict:  248 bytes, slots:  240 bytes,   3.3 %
+client, read_coils(16) response             dict:  312 bytes, slots:  296 bytes,   5.2 %
+--- decode, 10000 PDUs
+server, read_holding_registers request      new:  2.89 us, pool:  2.06 us, allocated:  312 ->  144 bytes
+server, write_register request              new:  2.53 us, pool:  2.03 us, allocated:  312 ->  144 bytes
+client, read_holding_registers(10) response new:  4.07 us, pool:  2.86 us, allocated:  374 ->  406 bytes
+client, read_coils(16) response             new:  4.16 us, pool:  3.40 us, allocated:  639 ->  655 bytes
+"""
+import time
+import tracemalloc
+
+from pymodbus_3p3v.pdu import DecodePDU, ModbusPDU
+from pymodbus_3p3v.pdu.bit_read_message import ReadCoilsResponse
+from pymodbus_3p3v.pdu.register_read_message import (
+    ReadHoldingRegistersRequest,
+    ReadHoldingRegistersResponse,
+)
+from pymodbus_3p3v.pdu.register_write_message import WriteSingleRegisterRequest
+
+
+PDU_COUNT = 10000
+POOL_SIZE = 16
+
+
+def frame(pdu: ModbusPDU) -> bytes:
+    """Return frame (function code + data)."""
+    return bytes([pdu.function_code]) + pdu.encode()
+
+
+TESTS = (
+    ("server, read_holding_registers request", True, frame(ReadHoldingRegistersRequest(10, 10))),
+    ("server, write_register request", True, frame(WriteSingleRegisterRequest(10, 17))),
+    ("client, read_holding_registers(10) response", False, frame(ReadHoldingRegistersResponse(list(range(10))))),
+    ("client, read_coils(16) response", False, frame(ReadCoilsResponse([True, False] * 8))),
+)
+
+
+def with_dict(pdu_class: type[ModbusPDU]) -> type[ModbusPDU]:
+    """Return pdu_class with the slot attributes stored in a __dict__."""
+    names = {
+        name
+        for cls in pdu_class.__mro__
+        for name in getattr(cls, "__slots__", ())
+        if not isinstance(getattr(pdu_class, name), property)
+    }
+    return type(pdu_class.__name__, (pdu_class,), dict.fromkeys(names))
+
+
+def retained(decoder: DecodePDU, data: bytes) -> float:
+    """Return bytes pr. decoded pdu kept alive."""
+    pdus: list = [None] * PDU_COUNT
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    for inx in range(PDU_COUNT):
+        pdus[inx] = decoder.decode(data)
+    size = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    return size / PDU_COUNT
+
+
+def decode(decoder: DecodePDU, data: bytes) -> tuple[float, float]:
+    """Return us and bytes allocated pr. decoded (and released) pdu."""
+    used_time = float("inf")
+    for _ in range(3):
+        start_time = time.perf_counter()
+        for _ in range(PDU_COUNT):
+            decoder.release(decoder.decode(data))
+        used_time = min(used_time, time.perf_counter() - start_time)
+    tracemalloc.start()
+    for _ in range(PDU_COUNT):
+        decoder.release(decoder.decode(data))
+    allocated = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return used_time / PDU_COUNT * 1e6, allocated
+
+
+def main():
+    """Run test."""
+    print(f"--- retained, {PDU_COUNT} PDUs")
+    for name, is_server, data in TESTS:
+        decoder = DecodePDU(is_server)
+        pdu_class = decoder.lookup[data[0]]
+        slots_size = retained(decoder, data)
+        decoder.register(with_dict(pdu_class))
+        dict_size = retained(decoder, data) - (pdu_class.__basicsize__ - object.__basicsize__)
+        saved = (dict_size - slots_size) / dict_size * 100
+        print(f"{name:43} dict: {dict_size:4.0f} bytes, slots: {slots_size:4.0f} bytes, {saved:5.1f} %")
+
+    print(f"--- decode, {PDU_COUNT} PDUs")
+    for name, is_server, data in TESTS:
+        new_time, new_allocated = decode(DecodePDU(is_server), data)
+        pool_time, pool_allocated = decode(DecodePDU(is_server, pool_size=POOL_SIZE), data)
+        print(
+            f"{name:43} new: {new_time:5.2f} us, pool: {pool_time:5.2f} us, "
+            f"allocated: {new_allocated:4.0f} -> {pool_allocated:4.0f} bytes"
+        )
+
+
+if __name__ == "__main__":
+    main()
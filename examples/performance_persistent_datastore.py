@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Test performance of the persistent (memory mapped) datablock.
+
+Writes blocks of 10 registers at random addresses (like write_registers)
+to an in memory datablock and to ModbusPersistentDataBlock with different
+policies, and measures the startup time of a full address space (65536
+registers), loaded from a json file into a sequential datablock compared
+to mapping the persistent file.
+
+example run:
+
+(pymodbus) % ./performance_persistent_datastore.py
+--- writes of 10 registers
+ModbusSequentialDataBlock        :     43.70 ms,    2288214 writes/sec (100000 writes)
+ModbusCompactDataBlock           :    128.49 ms,     778269 writes/sec (100000 writes)
+persistent, no flush             :    506.02 ms,     197620 writes/sec (100000 writes)
+persistent, flush_interval=1     :    499.27 ms,     200293 writes/sec (100000 writes)
+persistent, snapshot_interval=1  :    461.35 ms,     216754 writes/sec (100000 writes)
+persistent, flush_interval=0     :    265.95 ms,       3760 writes/sec (1000 writes)
+--- startup, 65536 registers
+json load, sequential            :      7.66 ms
+persistent, map file             :      0.14 ms
+"""
+import json
+import os
+import random
+import tempfile
+import time
+
+from pymodbus_3p3v.datastore import (
+    ModbusCompactDataBlock,
+    ModbusPersistentDataBlock,
+    ModbusSequentialDataBlock,
+)
+
+
+WRITE_COUNT = 100000
+SYNC_WRITE_COUNT = 1000
+ADDRESS_COUNT = 65536
+
+
+def run_writes(name, block, count):
+    """Write blocks of 10 registers."""
+    random.seed(1)
+    addresses = [random.randrange(ADDRESS_COUNT - 10) for _ in range(count)]
+    values = list(range(10))
+    start_time = time.perf_counter()
+    for address in addresses:
+        block.setValues(address, values)
+    run_time = time.perf_counter() - start_time
+    print(f"{name:33}: {run_time * 1000:9.2f} ms, {count / run_time:10.0f} writes/sec ({count} writes)")
+
+
+def main():
+    """Run test."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        print("--- writes of 10 registers")
+        run_writes("ModbusSequentialDataBlock", ModbusSequentialDataBlock(0, [0] * ADDRESS_COUNT), WRITE_COUNT)
+        run_writes("ModbusCompactDataBlock", ModbusCompactDataBlock(0, [0] * ADDRESS_COUNT), WRITE_COUNT)
+        for name, kwargs, count in (
+            ("persistent, no flush", {}, WRITE_COUNT),
+            ("persistent, flush_interval=1", {"flush_interval": 1.0}, WRITE_COUNT),
+            ("persistent, snapshot_interval=1", {"snapshot_interval": 1.0}, WRITE_COUNT),
+            ("persistent, flush_interval=0", {"flush_interval": 0}, SYNC_WRITE_COUNT),
+        ):
+            block = ModbusPersistentDataBlock(os.path.join(tmp_dir, "hr.dat"), 0, [0] * ADDRESS_COUNT, **kwargs)
+            run_writes(name, block, count)
+            block.unlink()
+
+        print(f"--- startup, {ADDRESS_COUNT} registers")
+        json_path = os.path.join(tmp_dir, "hr.json")
+        with open(json_path, "w", encoding="utf-8") as file:
+            json.dump(list(range(ADDRESS_COUNT)), file)
+        start_time = time.perf_counter()
+        with open(json_path, encoding="utf-8") as file:
+            ModbusSequentialDataBlock(0, json.load(file))
+        print(f"{'json load, sequential':33}: {(time.perf_counter() - start_time) * 1000:9.2f} ms")
+        path = os.path.join(tmp_dir, "hr.dat")
+        ModbusPersistentDataBlock(path, 0, list(range(ADDRESS_COUNT))).close()
+        start_time = time.perf_counter()
+        block = ModbusPersistentDataBlock(path)
+        print(f"{'persistent, map file':33}: {(time.perf_counter() - start_time) * 1000:9.2f} ms")
+        block.unlink()
+
+
+if __name__ == "__main__":
+    main()
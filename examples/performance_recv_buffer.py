@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Test performance of the transport receive buffer.
+
+Compares the old receive buffer handling (bytes, sliced after every frame)
+with the current (bytearray, consumed in place, framers decode from a
+memoryview), by feeding a stream of pipelined responses to the client
+protocol.
+
+Bytes copied are counted for the buffer handling only (the decoded
+frame payload is copied in both cases).
+
+example run:
+
+(pymodbus) % ./performance_recv_buffer.py
+--- 1000 frames, 1 chunk(s)
+old:  33.18 ms,    68842 bytes copied pr frame
+new:  30.37 ms,      137 bytes copied pr frame
+--- 1000 frames, 268 chunk(s)
+old:  31.43 ms,      721 bytes copied pr frame
+new:  32.69 ms,      137 bytes copied pr frame
+--- 1000 frames, 94 chunk(s)
+old:  33.92 ms,     1160 bytes copied pr frame
+new:  31.74 ms,      137 bytes copied pr frame
+"""
+import asyncio
+import time
+
+from pymodbus_3p3v import FramerType
+from pymodbus_3p3v.client.modbusclientprotocol import ModbusClientProtocol
+from pymodbus_3p3v.framer import FramerSocket
+from pymodbus_3p3v.pdu import DecodePDU
+from pymodbus_3p3v.pdu.register_read_message import ReadHoldingRegistersResponse
+from pymodbus_3p3v.transport import CommParams, CommType
+
+
+FRAME_COUNT = 1000
+REGISTER_COUNT = 64
+CHUNK_SIZES = [0, 512, 1460]
+
+
+def build_stream() -> bytes:
+    """Build a stream of pipelined responses."""
+    framer = FramerSocket(DecodePDU(True))
+    stream = b""
+    for tid in range(1, FRAME_COUNT + 1):
+        pdu = ReadHoldingRegistersResponse(list(range(REGISTER_COUNT)))
+        pdu.transaction_id = tid
+        pdu.slave_id = 1
+        stream += framer.buildFrame(pdu)
+    return stream
+
+
+def split_stream(stream: bytes, chunk_size: int) -> list[bytes]:
+    """Split stream in chunks, as a socket would deliver it."""
+    if not chunk_size:
+        return [stream]
+    return [stream[i : i + chunk_size] for i in range(0, len(stream), chunk_size)]
+
+
+class OldClientProtocol(ModbusClientProtocol):
+    """Client protocol, receiving like the old transport (bytes, sliced per frame)."""
+
+    copied = 0
+
+    def datagram_received(self, data: bytes, addr: tuple | None) -> None:
+        """Receive data."""
+        self.copied += len(self.recv_buffer) + len(data)
+        self.recv_buffer = bytes(self.recv_buffer) + data
+        cut = self.callback_data(self.recv_buffer, addr=addr)
+        self.copied += len(self.recv_buffer) - cut
+        self.recv_buffer = self.recv_buffer[cut:]  # type: ignore[assignment]
+
+    def callback_data(self, data: bytes, addr: tuple | None = None) -> int:
+        """Handle received data."""
+        used_len = 0
+        while True:
+            self.copied += len(data) - used_len
+            data_len, pdu = self.framer.processIncomingFrame(data[used_len:])
+            used_len += data_len
+            if not pdu:
+                return used_len
+            self._handle_response(pdu)
+
+
+class NewClientProtocol(ModbusClientProtocol):
+    """Client protocol, receiving with the current transport (bytearray, memoryview)."""
+
+    copied = 0
+
+
+async def run(protocol_class, chunks: list[bytes]) -> tuple[float, int]:
+    """Feed chunks to protocol."""
+    protocol = protocol_class(
+        FramerType.SOCKET,
+        CommParams(comm_type=CommType.TCP, host="localhost", port=5020),
+    )
+    protocol.copied = sum(len(data) for data in chunks)
+    start_time = time.perf_counter()
+    for data in chunks:
+        protocol.data_received(data)
+    return time.perf_counter() - start_time, protocol.copied
+
+
+async def main():
+    """Run test."""
+    stream = build_stream()
+    for chunk_size in CHUNK_SIZES:
+        chunks = split_stream(stream, chunk_size)
+        print(f"--- {FRAME_COUNT} frames, {len(chunks)} chunk(s)")
+        old_time, old_copied = await run(OldClientProtocol, chunks)
+        new_time, new_copied = await run(NewClientProtocol, chunks)
+        print(f"old: {old_time * 1000:6.2f} ms, {old_copied // FRAME_COUNT:8} bytes copied pr frame")
+        print(f"new: {new_time * 1000:6.2f} ms, {new_copied // FRAME_COUNT:8} bytes copied pr frame")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Test performance of register PDU encode/decode.
+
+Encodes and decodes 125 register responses (read_holding_registers) and
+123 register requests (write_registers), client side (request encode,
+response decode) and server side (request decode, response encode).
+
+"loop" is the previous implementation (struct.pack/unpack pr. register
+and bytes concatenation), "bulk" is the PDU (one cached struct.Struct for
+all registers, pymodbus.utilities.pack_registers/unpack_registers).
+
+example run:
+
+(pymodbus) % ./performance_register_pdu.py
+--- 20000 PDUs
+client, encode write_registers(123)        loop:  33.93 us, bulk:   2.96 us,  11.4 x
+client, decode read_holding_registers(125) loop:  46.83 us, bulk:   5.10 us,   9.2 x
+server, decode write_registers(123)        loop:  49.88 us, bulk:   5.27 us,   9.5 x
+server, encode read_holding_registers(125) loop:  30.76 us, bulk:   3.21 us,   9.6 x
+"""
+import struct
+import time
+
+from pymodbus_3p3v.pdu.register_read_message import ReadHoldingRegistersResponse
+from pymodbus_3p3v.pdu.register_write_message import WriteMultipleRegistersRequest
+
+
+PDU_COUNT = 20000
+
+
+def loop_encode(header: bytes, registers: list[int]) -> bytes:
+    """Encode as before, one register at a time."""
+    result = header
+    for register in registers:
+        result += struct.pack(">H", register)
+    return result
+
+
+def loop_decode(data: bytes, offset: int, count: int) -> list[int]:
+    """Decode as before, one register at a time."""
+    registers = []
+    for i in range(offset, offset + count * 2, 2):
+        registers.append(struct.unpack(">H", data[i : i + 2])[0])
+    return registers
+
+
+def measure(func) -> float:
+    """Return us pr. call."""
+    start_time = time.perf_counter()
+    for _ in range(PDU_COUNT):
+        func()
+    return (time.perf_counter() - start_time) / PDU_COUNT * 1e6
+
+
+def main():
+    """Run test."""
+    request = WriteMultipleRegistersRequest(0, list(range(0, 123 * 500, 500)))
+    request_data = request.encode()
+    response = ReadHoldingRegistersResponse(list(range(0, 125 * 500, 500)))
+    response_data = response.encode()
+    request_header = struct.pack(">HHB", request.address, request.count, request.byte_count)
+    response_header = struct.pack(">B", len(response.registers) * 2)
+    assert loop_encode(request_header, request.values) == request_data
+    assert loop_decode(response_data, 1, 125) == response.registers
+
+    tests = (
+        (
+            "client, encode write_registers(123)",
+            lambda: loop_encode(request_header, request.values),
+            request.encode,
+        ),
+        (
+            "client, decode read_holding_registers(125)",
+            lambda: loop_decode(response_data, 1, 125),
+            lambda: response.decode(response_data),
+        ),
+        (
+            "server, decode write_registers(123)",
+            lambda: loop_decode(request_data, 5, 123),
+            lambda: request.decode(request_data),
+        ),
+        (
+            "server, encode read_holding_registers(125)",
+            lambda: loop_encode(response_header, response.registers),
+            response.encode,
+        ),
+    )
+    print(f"--- {PDU_COUNT} PDUs")
+    for name, loop, bulk in tests:
+        loop_time = measure(loop)
+        bulk_time = measure(bulk)
+        print(f"{name:42} loop: {loop_time:6.2f} us, bulk: {bulk_time:6.2f} us, {loop_time / bulk_time:5.1f} x")
+
+
+if __name__ == "__main__":
+    main()
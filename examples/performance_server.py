@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Test performance of the server request dispatch.
+
+Runs a tcp server and client connected with the NullModem transport (no
+network), and measures requests/sec served with the default dispatch
+(received data queued to a handler task, every request executed in a
+separate task) and with direct_dispatch=True (decoded and executed
+directly when received).
+
+Requests are sent one at a time and pipelined (max_in_flight=16).
+
+example run:
+
+(pymodbus) % ./performance_server.py
+--- 10000 read_holding_registers(0, 10)
+queued dispatch, sequential :   1256.59 ms,     7958 requests/sec
+direct dispatch, sequential :   1013.32 ms,     9869 requests/sec
+queued dispatch, pipelined  :    713.72 ms,    14011 requests/sec
+direct dispatch, pipelined  :    599.28 ms,    16687 requests/sec
+
+The client dominates the run time, direct dispatch removes the queue, the
+handler task wakeup and the execute task pr. request on the server side.
+"""
+import asyncio
+import time
+
+from pymodbus_3p3v.client import AsyncModbusTcpClient
+from pymodbus_3p3v.datastore import (
+    ModbusSequentialDataBlock,
+    ModbusServerContext,
+    ModbusSlaveContext,
+)
+from pymodbus_3p3v.server import ModbusTcpServer
+from pymodbus_3p3v.transport import NULLMODEM_HOST
+
+
+REQUEST_COUNT = 10000
+IN_FLIGHT = 16
+
+
+async def run_requests(client: AsyncModbusTcpClient, in_flight: int) -> None:
+    """Send all requests, in_flight at a time."""
+    for _ in range(REQUEST_COUNT // in_flight):
+        await asyncio.gather(*[client.read_holding_registers(0, count=10) for _ in range(in_flight)])
+
+
+async def run_test(port: int, direct_dispatch: bool, in_flight: int) -> float:
+    """Start server/client and return run time."""
+    context = ModbusServerContext(
+        slaves=ModbusSlaveContext(hr=ModbusSequentialDataBlock(0, list(range(100))), zero_mode=True),
+        single=True,
+    )
+    server = ModbusTcpServer(context, address=(NULLMODEM_HOST, port), direct_dispatch=direct_dispatch)
+    server_task = asyncio.create_task(server.serve_forever())
+    await asyncio.sleep(0.1)
+    client = AsyncModbusTcpClient(NULLMODEM_HOST, port=port, max_in_flight=in_flight)
+    assert await client.connect()
+    assert (await client.read_holding_registers(0, count=10)).registers == list(range(10))
+    start_time = time.perf_counter()
+    await run_requests(client, in_flight)
+    run_time = time.perf_counter() - start_time
+    client.close()
+    await server.shutdown()
+    await server_task
+    return run_time
+
+
+async def main():
+    """Run test."""
+    print(f"--- {REQUEST_COUNT} read_holding_registers(0, 10)")
+    port = 5020
+    for in_flight, mode in ((1, "sequential"), (IN_FLIGHT, "pipelined")):
+        for direct_dispatch in (False, True):
+            port += 1
+            run_time = await run_test(port, direct_dispatch, in_flight)
+            name = f"{'direct' if direct_dispatch else 'queued'} dispatch, {mode}"
+            print(f"{name:28}: {run_time * 1000:9.2f} ms, {REQUEST_COUNT / run_time:8.0f} requests/sec")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
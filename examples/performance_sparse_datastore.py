@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Test performance of ModbusSparseDataBlock validate/getValues.
+
+Builds a sparse datablock with 100000 addresses (runs of 10 addresses
+separated by gaps of 5) and serves read requests of 10 values, validated
+with the old set based check (a set of all addresses is built pr. request)
+and with the address runs index (bisect lookup).
+
+example run:
+
+(pymodbus) % ./performance_sparse_datastore.py
+--- 100000 sparse addresses, requests of 10 values
+set based validate  :  2942.35 ms,          340 requests/sec
+indexed validate    :     1.50 ms,       664840 requests/sec
+"""
+import random
+import time
+
+from pymodbus_3p3v.datastore import ModbusSparseDataBlock
+
+
+ADDRESS_COUNT = 100000
+RUN_LENGTH = 10
+GAP = 5
+REQUEST_COUNT = 1000
+
+
+class SetValidateDataBlock(ModbusSparseDataBlock):
+    """Sparse datablock with the set based validate."""
+
+    def validate(self, address, count=1):
+        """Check to see if the request is in range."""
+        if not count:
+            return False
+        handle = set(range(address, address + count))
+        return handle.issubset(set(iter(self.values.keys())))
+
+
+def serve(block: ModbusSparseDataBlock, requests: list[int]) -> None:
+    """Validate and read all requests."""
+    for address in requests:
+        if block.validate(address, RUN_LENGTH):
+            block.getValues(address, RUN_LENGTH)
+
+
+def main():
+    """Run test."""
+    values = {
+        address: [address & 0xFFFF] * RUN_LENGTH
+        for address in range(0, ADDRESS_COUNT // RUN_LENGTH * (RUN_LENGTH + GAP), RUN_LENGTH + GAP)
+    }
+    random.seed(1)
+    requests = [random.randrange(ADDRESS_COUNT) for _ in range(REQUEST_COUNT)]
+    tests = [
+        ("set based validate", SetValidateDataBlock(values)),
+        ("indexed validate", ModbusSparseDataBlock(values)),
+    ]
+    for _, block in tests:
+        assert len(block.values) == ADDRESS_COUNT
+    assert [tests[0][1].validate(address, RUN_LENGTH) for address in requests] == [
+        tests[1][1].validate(address, RUN_LENGTH) for address in requests
+    ]
+    print(f"--- {ADDRESS_COUNT} sparse addresses, requests of {RUN_LENGTH} values")
+    for name, block in tests:
+        start_time = time.perf_counter()
+        serve(block, requests)
+        run_time = time.perf_counter() - start_time
+        print(f"{name:20}: {run_time * 1000:8.2f} ms, {REQUEST_COUNT / run_time:12.0f} requests/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Pymodbus Server with values updated by another process.
+
+The holding registers are stored in a ModbusSharedMemoryDataBlock, an
+acquisition process (started here with multiprocessing, but it can be any
+python process knowing the name of the shared memory) attaches to the
+block and writes new values 10 times a second, without locks or IPC.
+
+usage::
+
+    server_shared_memory.py
+
+The corresponding client can be started as:
+    python3 client_sync.py
+"""
+import asyncio
+import logging
+import multiprocessing
+import time
+
+from pymodbus_3p3v.datastore import (
+    ModbusServerContext,
+    ModbusSharedMemoryDataBlock,
+    ModbusSlaveContext,
+)
+from pymodbus_3p3v.server import StartAsyncTcpServer
+
+
+_logger = logging.getLogger(__name__)
+
+
+def acquisition_process(name: str) -> None:
+    """Write measurements to the shared datablock."""
+    block = ModbusSharedMemoryDataBlock.attach(name)
+    counter = 0
+    while True:
+        counter = (counter + 1) & 0xFFFF
+        # all 10 registers are updated as one write, readers never see a mix.
+        block.setValues(block.address, [counter] * 10)
+        time.sleep(0.1)
+
+
+async def main() -> None:
+    """Start acquisition process and server."""
+    block = ModbusSharedMemoryDataBlock(0x00, [0] * 10)
+    context = ModbusServerContext(slaves=ModbusSlaveContext(hr=block, zero_mode=True), single=True)
+    process = multiprocessing.Process(target=acquisition_process, args=(block.name,), daemon=True)
+    process.start()
+    _logger.info(f"acquisition process writing to shared memory {block.name}")
+    try:
+        await StartAsyncTcpServer(context=context, address=("", 5020))
+    finally:
+        process.terminate()
+        block.unlink()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
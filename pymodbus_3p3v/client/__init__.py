@@ -1,18 +1,29 @@
 """Client."""
 
 __all__ = [
+    "AdaptivePolicy",
     "AsyncModbusSerialClient",
     "AsyncModbusTcpClient",
     "AsyncModbusTlsClient",
     "AsyncModbusUdpClient",
+    "BusScheduler",
     "ModbusBaseClient",
     "ModbusSerialClient",
     "ModbusTcpClient",
     "ModbusTlsClient",
     "ModbusUdpClient",
+    "PollGroup",
+    "PollTable",
+    "PollTag",
+    "RegisterSchema",
+    "RetryPolicy",
 ]
 
 from pymodbus_3p3v.client.base import ModbusBaseClient
+from pymodbus_3p3v.client.policy import AdaptivePolicy, RetryPolicy
+from pymodbus_3p3v.client.pollgroup import PollGroup, PollTable, PollTag
+from pymodbus_3p3v.client.scheduler import BusScheduler
+from pymodbus_3p3v.client.schema import RegisterSchema
 from pymodbus_3p3v.client.serial import AsyncModbusSerialClient, ModbusSerialClient
 from pymodbus_3p3v.client.tcp import AsyncModbusTcpClient, ModbusTcpClient
 from pymodbus_3p3v.client.tls import AsyncModbusTlsClient, ModbusTlsClient
@@ -3,12 +3,21 @@ from __future__ import annotations
 
 import asyncio
 import socket
+import time
 from abc import abstractmethod
 from collections.abc import Awaitable, Callable
 
 from pymodbus_3p3v.client.mixin import ModbusClientMixin
-from pymodbus_3p3v.client.modbusclientprotocol import ModbusClientProtocol
-from pymodbus_3p3v.exceptions import ConnectionException, ModbusIOException
+from pymodbus_3p3v.client.modbusclientprotocol import (
+    FRAME_CACHE_SIZE,
+    ModbusClientProtocol,
+)
+from pymodbus_3p3v.client.policy import RetryPolicy
+from pymodbus_3p3v.exceptions import (
+    ConnectionException,
+    ModbusIOException,
+    ParameterException,
+)
 from pymodbus_3p3v.framer import FRAMER_NAME_TO_CLASS, FramerBase, FramerType
 from pymodbus_3p3v.logging import Log
 from pymodbus_3p3v.pdu import DecodePDU, ExceptionResponse, ModbusPDU
@@ -29,6 +38,8 @@ class ModbusBaseClient(ModbusClientMixin[Awaitable[ModbusPDU]]):
         retries: int,
         on_connect_callback: Callable[[bool], None] | None,
         comm_params: CommParams | None = None,
+        max_in_flight: int = 1,
+        policy: RetryPolicy | None = None,
     ) -> None:
         """Initialize a client instance.
 
@@ -37,19 +48,30 @@ class ModbusBaseClient(ModbusClientMixin[Awaitable[ModbusPDU]]):
         ModbusClientMixin.__init__(self)  # type: ignore[arg-type]
         if comm_params:
             self.comm_params = comm_params
+        if max_in_flight < 1:
+            raise ParameterException(f"max_in_flight must be >= 1, got {max_in_flight}")
+        if max_in_flight > 1 and framer != FramerType.SOCKET:
+            raise ParameterException(
+                "max_in_flight > 1 requires FramerType.SOCKET (transaction id needed)"
+            )
         self.retries = retries
+        self.policy = policy or RetryPolicy()
+        self.max_in_flight = max_in_flight
         self.ctx = ModbusClientProtocol(
             framer,
             self.comm_params,
             on_connect_callback,
         )
+        if max_in_flight > 1:
+            # responses to earlier requests may be partially received
+            self.ctx.flush_recv_on_send = False
 
         # Common variables.
         self.use_udp = False
         self.state = ModbusTransactionState.IDLE
         self.last_frame_end: float | None = 0
         self.silent_interval: float = 0
-        self._lock = asyncio.Lock()
+        self._lock = asyncio.Semaphore(max_in_flight)
         self.accept_no_response_limit = 3
         self.count_no_responses = 0
 
@@ -58,6 +80,16 @@ class ModbusBaseClient(ModbusClientMixin[Awaitable[ModbusPDU]]):
         """Return state of connection."""
         return self.ctx.is_active()
 
+    @property
+    def policy(self) -> RetryPolicy:
+        """Return timeout/retry policy."""
+        return self._policy
+
+    @policy.setter
+    def policy(self, policy: RetryPolicy) -> None:
+        """Set timeout/retry policy (one policy instance pr. client)."""
+        self._policy = policy.bind(self)
+
     async def connect(self) -> bool:
         """Call transport connect."""
         self.ctx.reset_delay()
@@ -95,34 +127,49 @@ class ModbusBaseClient(ModbusClientMixin[Awaitable[ModbusPDU]]):
     async def async_execute(self, no_response_expected: bool, request) -> ModbusPDU | None:
         """Execute requests asynchronously.
 
+        Up to max_in_flight requests are sent without waiting for the
+        previous response (pipelining), each request has its own
+        response timeout and retry count (from self.policy), responses
+        are matched by transaction id and may arrive in any order.
+
         :meta private:
         """
+        slave_id = request.slave_id
+        self.policy.allow(slave_id)
         request.transaction_id = self.ctx.transaction.getNextTID()
         packet = self.ctx.framer.buildFrame(request)
 
         count = 0
-        while count <= self.retries:
+        retries = self.policy.retries(slave_id)
+        while count <= retries:
+            if count and (delay := self.policy.backoff(slave_id, count)):
+                await asyncio.sleep(delay)
             async with self._lock:
                 req = self.build_response(request)
+                sent = time.monotonic()
                 self.ctx.send(packet)
                 if no_response_expected:
                     resp = None
                     break
                 try:
                     resp = await asyncio.wait_for(
-                        req, timeout=self.ctx.comm_params.timeout_connect
+                        req, timeout=self.policy.timeout(slave_id, count)
                     )
+                    self.policy.on_response(slave_id, time.monotonic() - sent, count)
                     break
                 except asyncio.exceptions.TimeoutError:
+                    self.policy.on_timeout(slave_id, count)
                     count += 1
-        if count > self.retries:
+        if count > retries:
+            self.ctx.transaction.delTransaction(request.transaction_id)
+            self.policy.on_failure(slave_id)
             if self.count_no_responses >= self.accept_no_response_limit:
                 self.ctx.connection_lost(asyncio.TimeoutError("Server not responding"))
                 raise ModbusIOException(
                     f"ERROR: No response received of the last {self.accept_no_response_limit} request, CLOSING CONNECTION."
                 )
             self.count_no_responses += 1
-            Log.error(f"No response received after {self.retries} retries, continue with next request")
+            Log.error(f"No response received after {retries} retries, continue with next request")
             return ExceptionResponse(request.function_code)
 
         self.count_no_responses = 0
@@ -176,6 +223,7 @@ class ModbusBaseSyncClient(ModbusClientMixin[ModbusPDU]):
         framer: FramerType,
         retries: int,
         comm_params: CommParams | None = None,
+        policy: RetryPolicy | None = None,
     ) -> None:
         """Initialize a client instance.
 
@@ -185,10 +233,13 @@ class ModbusBaseSyncClient(ModbusClientMixin[ModbusPDU]):
         if comm_params:
             self.comm_params = comm_params
         self.retries = retries
+        self.policy = policy or RetryPolicy()
         self.slaves: list[int] = []
 
         # Common variables.
-        self.framer: FramerBase = (FRAMER_NAME_TO_CLASS[framer])(DecodePDU(False))
+        self.framer: FramerBase = (FRAMER_NAME_TO_CLASS[framer])(
+            DecodePDU(False), frame_cache_size=FRAME_CACHE_SIZE.get(framer, 0)
+        )
         self.transaction = SyncModbusTransactionManager(
             self,
             self.retries,
@@ -203,6 +254,16 @@ class ModbusBaseSyncClient(ModbusClientMixin[ModbusPDU]):
     # ----------------------------------------------------------------------- #
     # Client external interface
     # ----------------------------------------------------------------------- #
+    @property
+    def policy(self) -> RetryPolicy:
+        """Return timeout/retry policy."""
+        return self._policy
+
+    @policy.setter
+    def policy(self, policy: RetryPolicy) -> None:
+        """Set timeout/retry policy (one policy instance pr. client)."""
+        self._policy = policy.bind(self)
+
     def register(self, custom_response_class: type[ModbusPDU]) -> None:
         """Register a custom response class with the decoder.
 
@@ -247,7 +308,8 @@ class ModbusBaseSyncClient(ModbusClientMixin[ModbusPDU]):
         :meta private:
         """
         if self.state != ModbusTransactionState.RETRYING:
-            Log.debug('New Transaction state "SENDING"')
+            if Log.debug_enabled:
+                Log.debug('New Transaction state "SENDING"')
             self.state = ModbusTransactionState.SENDING
 
     @abstractmethod
@@ -485,6 +485,9 @@ class ModbusClientMixin(Generic[T]):  # pylint: disable=too-many-public-methods
         :param data_type: data type to convert to
         :returns: int, float or str depending on "data_type"
         :raises ModbusException: when size of registers is not 1, 2 or 4
+
+        .. tip::
+            Use :class:`pymodbus.client.schema.RegisterSchema` to convert many values in one pass.
         """
         byte_list = bytearray()
         for x in registers:
@@ -14,6 +14,11 @@ from pymodbus_3p3v.transaction import ModbusTransactionManager
 from pymodbus_3p3v.transport import CommParams, ModbusProtocol
 
 
+# encoded requests cached by the client framer,
+# socket/tls encoding is as fast as a cache lookup.
+FRAME_CACHE_SIZE = {FramerType.ASCII: 256, FramerType.RTU: 256}
+
+
 class ModbusClientProtocol(ModbusProtocol):
     """**ModbusClientProtocol**.
 
@@ -35,7 +40,9 @@ class ModbusClientProtocol(ModbusProtocol):
         self.on_connect_callback = on_connect_callback
 
         # Common variables.
-        self.framer: FramerBase = (FRAMER_NAME_TO_CLASS[framer])(DecodePDU(False))
+        self.framer: FramerBase = (FRAMER_NAME_TO_CLASS[framer])(
+            DecodePDU(False), frame_cache_size=FRAME_CACHE_SIZE.get(framer, 0)
+        )
         self.transaction = ModbusTransactionManager()
 
     def _handle_response(self, reply):
@@ -67,11 +74,21 @@ class ModbusClientProtocol(ModbusProtocol):
         """Handle received data.
 
         returns number of bytes consumed
+
+        Pipelined responses might arrive in one packet, so all
+        complete frames are handled, the responses before a bad
+        frame are handled before the bad frame raises.
         """
-        used_len, pdu = self.framer.processIncomingFrame(data)
-        if pdu:
-            self._handle_response(pdu)
-        return used_len
+        used_len = 0
+        with memoryview(data) as view:
+            while True:
+                with view[used_len:] as rest:
+                    data_len, pdus = self.framer.processIncomingFrames(rest)
+                used_len += data_len
+                for pdu in pdus:
+                    self._handle_response(pdu)
+                if not pdus or used_len == len(data):
+                    return used_len
 
     def __str__(self):
         """Build a string representation of the connection.
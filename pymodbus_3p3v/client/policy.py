@@ -0,0 +1,246 @@
+"""Timeout and retry policies.
+
+A client asks its policy (``client.policy``) how long to wait for a
+response, how often and when to retry, and whether a slave should be
+contacted at all.
+
+:class:`RetryPolicy` (the default) is the classic behaviour: the client
+timeout and retry count, retries are sent immediately.
+
+:class:`AdaptivePolicy` learns the round trip time pr. slave:
+
+- the timeout is the smoothed rtt + 4 * rtt variance (like the TCP
+  retransmission timeout), doubled for each retry, limited to
+  [min_timeout, max_timeout], only first attempts are sampled (Karn),
+- retries are delayed with jittered exponential backoff,
+- a circuit breaker opens after ``failure_threshold`` requests without
+  response, while open requests to the slave fail immediately, after
+  ``reset_timeout`` one probe (without retries) is allowed (half open),
+  which closes the circuit if answered, other requests fail until the
+  probe is answered or failed (a probe without result, e.g. cancelled,
+  is replaced after ``reset_timeout``).
+
+Example::
+
+    client = AsyncModbusTcpClient("gateway")
+    client.policy = AdaptivePolicy(min_timeout=0.05, max_timeout=2)
+    ...
+    print(client.policy.state(1))  # SlavePolicyState(rtt=..., timeout=..., circuit=...)
+"""
+from __future__ import annotations
+
+import dataclasses
+import enum
+import random
+import time
+
+from pymodbus_3p3v.exceptions import ModbusIOException, ParameterException
+
+
+class CircuitState(str, enum.Enum):
+    """Circuit breaker state."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclasses.dataclass
+class SlavePolicyState:
+    """Learned state of a slave.
+
+    :param rtt: Smoothed round trip time, None until first response
+    :param rtt_var: Smoothed round trip time variance
+    :param timeout: Timeout of the first attempt
+    :param failures: Number of requests in a row without response
+    :param circuit: Circuit breaker state
+    :param open_until: Time (time.monotonic) the circuit is half opened (the probe is replaced)
+    :param probe_in_flight: The probe of the half open circuit is sent, without result yet
+    """
+
+    rtt: float | None = None
+    rtt_var: float = 0.0
+    timeout: float = 0.0
+    failures: int = 0
+    circuit: CircuitState = CircuitState.CLOSED
+    open_until: float = 0.0
+    probe_in_flight: bool = False
+
+
+class RetryPolicy:
+    """Fixed timeout and retry count (default policy).
+
+    :param timeout: Response timeout in seconds, default client timeout
+    :param retries: Number of retries, default client retries
+
+    Subclass to implement other policies, the client calls:
+
+    - check() before queueing a request (e.g. BusScheduler),
+    - allow() before sending a request,
+    - timeout()/retries()/backoff() for each attempt,
+    - on_response()/on_timeout() with the result of each attempt.
+    """
+
+    def __init__(self, timeout: float | None = None, retries: int | None = None) -> None:
+        """Initialize policy."""
+        self._timeout = timeout
+        self._retries = retries
+        self.client = None
+
+    def bind(self, client) -> RetryPolicy:
+        """Attach policy to client (supplies the default timeout/retries)."""
+        self.client = client
+        return self
+
+    @property
+    def default_timeout(self) -> float:
+        """Return timeout used when nothing is learned."""
+        if self._timeout is not None:
+            return self._timeout
+        return self.client.comm_params.timeout_connect if self.client else 3.0
+
+    def check(self, slave_id: int) -> None:
+        """Check request to slave may be queued, allow() is called when it is sent.
+
+        :raises ModbusIOException: slave must not be contacted now
+        """
+
+    def allow(self, slave_id: int) -> None:
+        """Check request to slave may be sent.
+
+        :raises ModbusIOException: slave must not be contacted now
+        """
+
+    def retries(self, slave_id: int) -> int:  # pylint: disable=unused-argument
+        """Return number of retries for a request to slave."""
+        if self._retries is not None:
+            return self._retries
+        return self.client.retries if self.client else 3
+
+    def timeout(self, slave_id: int, attempt: int) -> float:  # pylint: disable=unused-argument
+        """Return response timeout of attempt (0 is the first attempt)."""
+        return self.default_timeout
+
+    def backoff(self, slave_id: int, attempt: int) -> float:  # pylint: disable=unused-argument
+        """Return delay before retry attempt (>= 1)."""
+        return 0.0
+
+    def poll_interval(self, slave_id: int) -> float:  # pylint: disable=unused-argument
+        """Return delay between partial reads (sync clients)."""
+        return 0.1
+
+    def on_response(self, slave_id: int, rtt: float, attempt: int) -> None:
+        """Register response received rtt seconds after sending attempt."""
+
+    def on_timeout(self, slave_id: int, attempt: int) -> None:
+        """Register attempt without response."""
+
+    def on_failure(self, slave_id: int) -> None:
+        """Register request failed (all attempts without response)."""
+
+
+class AdaptivePolicy(RetryPolicy):
+    """Learn timeouts pr. slave, backoff retries and break the circuit to dead slaves.
+
+    :param min_timeout: Lower limit of the timeout in seconds
+    :param max_timeout: Upper limit of the timeout (and initial timeout), default client timeout
+    :param retries: Number of retries, default client retries
+    :param backoff_base: Delay before first retry in seconds (doubled for each retry)
+    :param backoff_max: Max delay before a retry in seconds
+    :param jitter: Random part of the backoff (0 - 1)
+    :param failure_threshold: Number of failed requests in a row before the circuit opens
+    :param reset_timeout: Seconds the circuit stays open
+    :raises ParameterException: illegal limits
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        min_timeout: float = 0.02,
+        max_timeout: float | None = None,
+        retries: int | None = None,
+        backoff_base: float = 0.05,
+        backoff_max: float = 2.0,
+        jitter: float = 0.5,
+        failure_threshold: int = 3,
+        reset_timeout: float = 10.0,
+    ) -> None:
+        """Initialize policy."""
+        super().__init__(timeout=max_timeout, retries=retries)
+        if min_timeout <= 0 or (max_timeout is not None and max_timeout < min_timeout):
+            raise ParameterException(f"need 0 < min_timeout ({min_timeout}) <= max_timeout ({max_timeout})")
+        if not 0 <= jitter <= 1 or failure_threshold < 1:
+            raise ParameterException("need 0 <= jitter <= 1 and failure_threshold >= 1")
+        self.min_timeout = min_timeout
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.slaves: dict[int, SlavePolicyState] = {}
+
+    def state(self, slave_id: int) -> SlavePolicyState:
+        """Return learned state of slave (created if unknown)."""
+        if (state := self.slaves.get(slave_id)) is None:
+            state = self.slaves[slave_id] = SlavePolicyState(timeout=self.default_timeout)
+        return state
+
+    def check(self, slave_id: int) -> None:
+        """Fail fast while the circuit is open or its probe is in flight."""
+        state = self.state(slave_id)
+        if state.circuit == CircuitState.CLOSED or time.monotonic() >= state.open_until:
+            return
+        if state.circuit == CircuitState.OPEN:
+            raise ModbusIOException(f"circuit open for slave {slave_id}, {state.failures} failed requests")
+        if state.probe_in_flight:
+            raise ModbusIOException(f"circuit half open for slave {slave_id}, probe in flight")
+
+    def allow(self, slave_id: int) -> None:
+        """Fail fast while the circuit is open, let one probe through when half open."""
+        self.check(slave_id)
+        state = self.state(slave_id)
+        if state.circuit != CircuitState.CLOSED:
+            state.circuit = CircuitState.HALF_OPEN
+            state.probe_in_flight = True
+            state.open_until = time.monotonic() + self.reset_timeout
+
+    def retries(self, slave_id: int) -> int:
+        """Return retries, 0 for the probe of a half open circuit."""
+        if self.state(slave_id).circuit != CircuitState.CLOSED:
+            return 0
+        return super().retries(slave_id)
+
+    def timeout(self, slave_id: int, attempt: int) -> float:
+        """Return learned timeout, doubled pr. retry."""
+        return min(self.state(slave_id).timeout * (1 << attempt), self.default_timeout)
+
+    def backoff(self, slave_id: int, attempt: int) -> float:
+        """Return jittered exponential backoff."""
+        delay = min(self.backoff_base * (1 << (attempt - 1)), self.backoff_max)
+        return delay * (1 - self.jitter * random.random())
+
+    def poll_interval(self, slave_id: int) -> float:
+        """Return a quarter of the learned timeout (max 0.1s)."""
+        return min(self.state(slave_id).timeout / 4, 0.1)
+
+    def on_response(self, slave_id: int, rtt: float, attempt: int) -> None:
+        """Sample rtt (first attempts only) and close the circuit."""
+        state = self.state(slave_id)
+        if not attempt:
+            if state.rtt is None:
+                state.rtt, state.rtt_var = rtt, rtt / 2
+            else:
+                state.rtt_var = 0.75 * state.rtt_var + 0.25 * abs(state.rtt - rtt)
+                state.rtt = 0.875 * state.rtt + 0.125 * rtt
+            state.timeout = min(max(state.rtt + 4 * state.rtt_var, self.min_timeout), self.default_timeout)
+        state.failures = 0
+        state.circuit = CircuitState.CLOSED
+        state.probe_in_flight = False
+
+    def on_failure(self, slave_id: int) -> None:
+        """Count failure and open the circuit."""
+        state = self.state(slave_id)
+        state.failures += 1
+        state.probe_in_flight = False
+        if state.circuit == CircuitState.HALF_OPEN or state.failures >= self.failure_threshold:
+            state.circuit = CircuitState.OPEN
+            state.open_until = time.monotonic() + self.reset_timeout
@@ -0,0 +1,252 @@
+"""Poll group, read many tags with few requests.
+
+A plant is typically defined as thousands of individual tags, reading each
+tag with its own request is slow (each request costs a round trip).
+
+:class:`PollGroup` groups the tags (per period, slave and table), sorts them
+and coalesces neighbouring addresses into read blocks, respecting the
+protocol limits (125 registers / 2000 bits pr request). Addresses between
+tags are read (and discarded) if the gap is not larger than ``gap``.
+
+Example::
+
+    tags = [
+        PollTag(1, PollTable.HOLDING_REGISTERS, 100, ModbusClientMixin.DATATYPE.UINT16, 1.0),
+        PollTag(1, PollTable.HOLDING_REGISTERS, 101, ModbusClientMixin.DATATYPE.FLOAT32, 1.0),
+        PollTag(1, PollTable.COILS, 7, None, 5.0),
+    ]
+    group = PollGroup(tags, gap=10)
+    await group.async_poll(client)  # or group.poll(client) with a sync client
+    print(tags[1].value)
+"""
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import math
+import time
+from collections.abc import Awaitable
+from enum import Enum
+from typing import Any
+
+from pymodbus_3p3v.client.mixin import ModbusClientMixin
+from pymodbus_3p3v.client.schema import RegisterSchema
+from pymodbus_3p3v.exceptions import ParameterException
+from pymodbus_3p3v.pdu import ModbusPDU
+
+
+class PollTable(str, Enum):
+    """Modbus table of a tag."""
+
+    COILS = "coils"
+    DISCRETE_INPUTS = "discrete_inputs"
+    HOLDING_REGISTERS = "holding_registers"
+    INPUT_REGISTERS = "input_registers"
+
+
+BIT_TABLES = (PollTable.COILS, PollTable.DISCRETE_INPUTS)
+
+
+@dataclasses.dataclass(eq=False)
+class PollTag:  # pylint: disable=too-many-instance-attributes
+    """Define a single tag.
+
+    :param slave: Modbus slave ID
+    :param table: Modbus table
+    :param address: Start address
+    :param datatype: Data type (ignored for coils/discrete inputs)
+    :param period: Poll period in seconds (0 means poll every time)
+    :param count: Number of registers, only used for DATATYPE.STRING
+    """
+
+    slave: int
+    table: PollTable
+    address: int
+    datatype: ModbusClientMixin.DATATYPE | None = None
+    period: float = 0.0
+    count: int = 0
+    value: Any = None
+    error: ModbusPDU | None = None
+
+    @property
+    def size(self) -> int:
+        """Return number of bits/registers of tag."""
+        if self.table in BIT_TABLES:
+            return 1
+        if self.datatype is None:
+            return 1
+        if self.datatype == ModbusClientMixin.DATATYPE.STRING:
+            return self.count
+        return self.datatype.value[1]
+
+
+@dataclasses.dataclass(eq=False)
+class PollBlock:
+    """A single read request, covering one or more tags."""
+
+    slave: int
+    table: PollTable
+    address: int
+    count: int
+    period: float
+    tags: list[PollTag]
+    next_time: float = 0.0
+    schema: RegisterSchema | None = None
+
+
+class PollGroup:
+    """Read tags with coalesced requests.
+
+    :param tags: List of tags
+    :param gap: Max number of unused bits/registers read between 2 tags in the same block
+    :param max_registers: Max number of registers pr request (protocol limit 125)
+    :param max_bits: Max number of bits pr request (protocol limit 2000)
+    :raises ParameterException: tag cannot be read in one request
+
+    The tags are updated (value or error) when their block is read.
+    """
+
+    MAX_REGISTERS = 125
+    MAX_BITS = 2000
+
+    def __init__(
+        self,
+        tags: list[PollTag],
+        gap: int = 0,
+        max_registers: int = MAX_REGISTERS,
+        max_bits: int = MAX_BITS,
+    ) -> None:
+        """Initialize poll group."""
+        if not 0 < max_registers <= self.MAX_REGISTERS or not 0 < max_bits <= self.MAX_BITS:
+            raise ParameterException(
+                f"max_registers (1-{self.MAX_REGISTERS}) / max_bits (1-{self.MAX_BITS}) outside protocol limits"
+            )
+        self.gap = gap
+        self.max_registers = max_registers
+        self.max_bits = max_bits
+        self.tags = tags
+        self.blocks = self.build_blocks(tags)
+
+    def build_blocks(self, tags: list[PollTag]) -> list[PollBlock]:
+        """Coalesce tags into read blocks.
+
+        Tags are grouped by (period, slave, table) and sorted by address,
+        a block is extended with the next tag as long as the gap and
+        block size allows it.
+        """
+        groups: dict[tuple[float, int, PollTable], list[PollTag]] = {}
+        for tag in tags:
+            if tag.size < 1:
+                raise ParameterException(f"tag {tag} has no size (missing count ?)")
+            groups.setdefault((tag.period, tag.slave, tag.table), []).append(tag)
+        blocks: list[PollBlock] = []
+        for (period, slave, table), group in groups.items():
+            limit = self.max_bits if table in BIT_TABLES else self.max_registers
+            block: PollBlock | None = None
+            for tag in sorted(group, key=lambda tag: tag.address):
+                if tag.size > limit:
+                    raise ParameterException(f"tag {tag} larger than {limit}")
+                tag_end = tag.address + tag.size
+                if (
+                    block
+                    and tag.address - (block.address + block.count) <= self.gap
+                    and tag_end - block.address <= limit
+                ):
+                    block.count = max(block.count, tag_end - block.address)
+                    block.tags.append(tag)
+                    continue
+                block = PollBlock(slave, table, tag.address, tag.size, period, [tag])
+                blocks.append(block)
+        for block in blocks:
+            if block.table not in BIT_TABLES:
+                block.schema = RegisterSchema([
+                    (
+                        tag.address - block.address,
+                        tag.datatype or ModbusClientMixin.DATATYPE.UINT16,
+                        tag.count,
+                    )
+                    for tag in block.tags
+                ])
+        return blocks
+
+    def due_blocks(self, now: float | None = None) -> list[PollBlock]:
+        """Return blocks to be read now (and schedule next read)."""
+        if now is None:
+            now = time.monotonic()
+        blocks = []
+        for block in self.blocks:
+            if block.next_time <= now:
+                block.next_time += block.period
+                if block.next_time <= now:
+                    block.next_time = now + block.period
+                blocks.append(block)
+        return blocks
+
+    def next_due(self) -> float:
+        """Return time (monotonic) of next due block (math.inf if the group has no tags)."""
+        return min((block.next_time for block in self.blocks), default=math.inf)
+
+    @classmethod
+    def read_block(cls, client: ModbusClientMixin, block: PollBlock) -> Any:
+        """Send read request of block (returns the response or an awaitable)."""
+        call = {
+            PollTable.COILS: client.read_coils,
+            PollTable.DISCRETE_INPUTS: client.read_discrete_inputs,
+            PollTable.HOLDING_REGISTERS: client.read_holding_registers,
+            PollTable.INPUT_REGISTERS: client.read_input_registers,
+        }[block.table]
+        return call(block.address, count=block.count, slave=block.slave)
+
+    @classmethod
+    def update_tags(cls, block: PollBlock, response: ModbusPDU) -> None:
+        """Fan out the block response to the tags."""
+        if response.isError():
+            for tag in block.tags:
+                tag.error = response
+            return
+        if block.schema:
+            values = block.schema.decode(response.registers)
+        else:
+            values = [response.bits[tag.address - block.address] for tag in block.tags]
+        for tag, value in zip(block.tags, values):
+            tag.error = None
+            tag.value = value
+
+    def poll(self, client: ModbusClientMixin[ModbusPDU], now: float | None = None) -> list[PollBlock]:
+        """Read due blocks with a sync client.
+
+        :param client: sync client
+        :param now: time (monotonic), default time.monotonic()
+        :returns: blocks read
+        :raises ModbusException:
+        """
+        blocks = self.due_blocks(now)
+        for block in blocks:
+            self.update_tags(block, self.read_block(client, block))
+        return blocks
+
+    async def async_poll(self, client: ModbusClientMixin[Awaitable[ModbusPDU]], now: float | None = None) -> list[PollBlock]:
+        """Read due blocks with an async client.
+
+        The requests are sent concurrently (pipelined if the client allows max_in_flight > 1).
+
+        :param client: async client
+        :param now: time (monotonic), default time.monotonic()
+        :returns: blocks read
+        :raises ModbusException:
+        """
+        blocks = self.due_blocks(now)
+        responses = await asyncio.gather(*[self.read_block(client, block) for block in blocks])
+        for block, response in zip(blocks, responses):
+            self.update_tags(block, response)
+        return blocks
+
+    async def run(self, client: ModbusClientMixin[Awaitable[ModbusPDU]]) -> None:
+        """Poll the tags forever (cancel the task to stop).
+
+        :param client: async client
+        :raises ModbusException:
+        """
+        while True:
+            await self.async_poll(client)
+            await asyncio.sleep(max(self.next_due() - time.monotonic(), 0))
@@ -0,0 +1,209 @@
+"""Bus scheduler, arbitration of a serial bus with many slaves.
+
+An RTU master sends one request at a time, the client serializes callers
+first come first served, and a slave that does not respond occupies the
+bus for timeout * (retries + 1) on every request.
+
+:class:`BusScheduler` wraps an async client and decides which request is
+sent next:
+
+- requests are sent in order of priority (lowest first), then deadline
+  (earliest first), then arrival,
+- a request whose deadline has passed is not sent,
+- a request to a slave the client policy does not allow (circuit open)
+  fails immediately instead of waiting for its turn,
+- the next request is sent as soon as the inter frame gap (3.5 character
+  times, fixed 1.75 ms above 19200 baud) has passed.
+
+Requests are sent with client.async_execute(), the response timeout,
+retries and the backoff of dead slaves are decided by the client policy,
+use :class:`~pymodbus.client.AdaptivePolicy` to learn the timeout pr.
+slave and to fail fast on slaves that do not respond::
+
+    client = AsyncModbusSerialClient("/dev/ttyUSB0", baudrate=19200)
+    client.policy = AdaptivePolicy(min_timeout=0.02, failure_threshold=2)
+    await client.connect()
+    bus = BusScheduler(client, priorities={1: 0, 2: 5})
+    rr = await bus.read_holding_registers(0, count=10, slave=1)
+    rr = await bus.submit(ReadCoilsRequest(0, count=8, slave=2), deadline=0.5)
+
+``bus.stats`` counts requests, timeouts..., ``bus.stats.utilisation`` is
+the fraction of the time the bus was in use that was spent transmitting.
+"""
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import heapq
+import itertools
+
+from pymodbus_3p3v.client.base import ModbusBaseClient
+from pymodbus_3p3v.client.mixin import ModbusClientMixin
+from pymodbus_3p3v.exceptions import ModbusIOException
+from pymodbus_3p3v.pdu import ModbusPDU
+
+
+# max size of a rtu frame, used when the response size is unknown
+MAX_FRAME_SIZE = 256
+
+
+@dataclasses.dataclass
+class BusStats:
+    """Bus statistics.
+
+    :param requests: Number of requests sent
+    :param responses: Number of responses received
+    :param timeouts: Number of requests without response (after retries)
+    :param expired: Number of requests not sent, deadline passed
+    :param rejected: Number of requests not sent, not allowed by the client policy
+    :param wire_time: Seconds spent transmitting frames (theoretical)
+    :param busy_time: Seconds the bus was in use (gaps and latency included)
+    """
+
+    requests: int = 0
+    responses: int = 0
+    timeouts: int = 0
+    expired: int = 0
+    rejected: int = 0
+    wire_time: float = 0.0
+    busy_time: float = 0.0
+
+    @property
+    def utilisation(self) -> float:
+        """Return fraction of busy_time spent transmitting."""
+        return self.wire_time / self.busy_time if self.busy_time else 0.0
+
+
+class BusScheduler(ModbusClientMixin):
+    """Schedule requests of an async (serial) client.
+
+    :param client: Async client (normally AsyncModbusSerialClient with rtu framer)
+    :param priorities: Default priority pr. slave id (default 0, lowest is sent first)
+
+    Timeouts, retries and dead slaves are handled by client.policy.
+    """
+
+    def __init__(self, client: ModbusBaseClient, priorities: dict[int, int] | None = None) -> None:
+        """Initialize scheduler."""
+        super().__init__()
+        self.client = client
+        self.priorities: dict[int, int] = dict(priorities or {})
+        self.char_time, self.frame_gap = self.bus_timing(
+            client.ctx.comm_params.baudrate,
+            client.ctx.comm_params.bytesize,
+            client.ctx.comm_params.parity,
+            client.ctx.comm_params.stopbits,
+        )
+        self.stats = BusStats()
+        self._queue: list[tuple[int, float, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._busy = False
+        self._bus_free_at = 0.0
+
+    @classmethod
+    def bus_timing(cls, baudrate: int, bytesize: int, parity: str, stopbits: float) -> tuple[float, float]:
+        """Return (character time, inter frame gap) in seconds.
+
+        A character is start bit + data bits + parity bit + stop bits,
+        the gap is 3.5 characters, fixed 1.75 ms above 19200 baud.
+        Without a baudrate (tcp) both are 0.
+        """
+        if not baudrate or baudrate < 0:
+            return 0.0, 0.0
+        bits = 1 + (bytesize if bytesize > 0 else 8) + (1 if parity in ("E", "O") else 0) + (stopbits if stopbits > 0 else 1)
+        char_time = bits / baudrate
+        return char_time, 0.00175 if baudrate > 19200 else 3.5 * char_time
+
+    def execute(self, no_response_expected: bool, request: ModbusPDU):
+        """Schedule request with the default priority of the slave (used by the request methods).
+
+        :meta private:
+        """
+        return self.submit(request, no_response_expected=no_response_expected)
+
+    async def submit(
+        self,
+        request: ModbusPDU,
+        priority: int | None = None,
+        deadline: float | None = None,
+        no_response_expected: bool = False,
+    ) -> ModbusPDU | None:
+        """Schedule request and wait for the response.
+
+        :param request: Request
+        :param priority: Priority (lowest is sent first), default the priority of the slave
+        :param deadline: Seconds from now the request must be sent within, None for no deadline
+        :param no_response_expected: True for broadcast/no response
+        :returns: response as client.execute() (None if no_response_expected)
+        :raises ModbusIOException: not allowed by the client policy or deadline passed
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            self.client.policy.check(request.slave_id)
+        except ModbusIOException:
+            self.stats.rejected += 1
+            raise
+        expires = loop.time() + deadline if deadline is not None else float("inf")
+        if self._busy or self._queue:
+            turn = loop.create_future()
+            heapq.heappush(
+                self._queue,
+                (self.priorities.get(request.slave_id, 0) if priority is None else priority, expires, next(self._sequence), turn),
+            )
+            try:
+                await turn
+            except asyncio.CancelledError:
+                if turn.done() and not turn.cancelled():
+                    self._release()  # the bus was handed to us
+                raise
+        elif loop.time() > expires:
+            self.stats.expired += 1
+            raise ModbusIOException("deadline passed before request was sent", request.function_code)
+        self._busy = True
+        started = loop.time()
+        try:
+            return await self._transact(request, no_response_expected)
+        finally:
+            self.stats.busy_time += loop.time() - started
+            self._release()
+
+    def _release(self) -> None:
+        """Hand the bus to the next (not expired) request."""
+        now = asyncio.get_running_loop().time()
+        while self._queue:
+            _, expires, _, turn = heapq.heappop(self._queue)
+            if turn.done():
+                continue  # cancelled
+            if now > expires:
+                self.stats.expired += 1
+                turn.set_exception(ModbusIOException("deadline passed before request was sent"))
+                continue
+            turn.set_result(None)
+            return
+        self._busy = False
+
+    def _wire_time(self, request: ModbusPDU, size: int) -> float:
+        """Return wire time of request and expected response."""
+        response_size = request.get_response_pdu_size()
+        response_size = response_size + 3 if response_size else MAX_FRAME_SIZE
+        return (size + response_size) * self.char_time
+
+    async def _transact(self, request: ModbusPDU, no_response_expected: bool) -> ModbusPDU | None:
+        """Send request with the client, after the inter frame gap."""
+        loop = asyncio.get_running_loop()
+        if (delay := self._bus_free_at - loop.time()) > 0:
+            await asyncio.sleep(delay)
+        self.stats.requests += 1
+        try:
+            response = await self.client.async_execute(no_response_expected, request)
+        finally:
+            self._bus_free_at = loop.time() + self.frame_gap
+        size = len(request.encode()) + 4  # slave id, function code and crc
+        if response is None:
+            self.stats.wire_time += size * self.char_time
+        elif response.isError() and not response.exception_code:
+            self.stats.timeouts += 1
+        else:
+            self.stats.responses += 1
+            self.stats.wire_time += self._wire_time(request, size)
+        return response
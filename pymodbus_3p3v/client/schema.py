@@ -0,0 +1,181 @@
+"""Register schema, bulk conversion of registers to values.
+
+convert_from_registers() converts one value at a time, which is slow when
+decoding thousands of tags. :class:`RegisterSchema` is compiled once from a
+list of fields (offset, datatype) and decodes all values of a register
+list in one struct pass::
+
+    schema = RegisterSchema([
+        (0, ModbusClientMixin.DATATYPE.UINT16),
+        (1, ModbusClientMixin.DATATYPE.FLOAT32),
+        (3, ModbusClientMixin.DATATYPE.STRING, 4),  # 4 registers
+    ])
+    values = schema.decode(response.registers)
+
+Optionally the values can be returned as a numpy structured array (one
+record pr. schema size registers), this requires numpy to be installed.
+"""
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from operator import itemgetter
+from typing import Any
+
+from pymodbus_3p3v.client.mixin import ModbusClientMixin
+from pymodbus_3p3v.constants import Endian
+from pymodbus_3p3v.exceptions import ParameterException
+
+
+try:
+    import numpy
+
+    NUMPY_MISSING = False
+except ImportError:
+    NUMPY_MISSING = True
+
+
+class RegisterSchema:
+    """Decode many values from registers in one pass.
+
+    :param fields: list of (offset, datatype) or (offset, datatype, count), count is number of registers for STRING
+    :param word_order: order of registers in values > 16 bit
+    :param byte_order: order of bytes in a register
+    :raises ParameterException: on illegal fields
+
+    Fields may be in any order and may overlap (e.g. the same registers
+    decoded as UINT32 and FLOAT32), values are returned in field order.
+    """
+
+    def __init__(
+        self,
+        fields: list[tuple],
+        word_order: Endian = Endian.BIG,
+        byte_order: Endian = Endian.BIG,
+    ) -> None:
+        """Compile schema."""
+        self.fields: list[tuple[int, ModbusClientMixin.DATATYPE, int]] = []
+        for field in fields:
+            offset, datatype = field[0], field[1]
+            if datatype == ModbusClientMixin.DATATYPE.STRING:
+                if len(field) < 3 or field[2] < 1:
+                    raise ParameterException(f"field {field}: STRING needs a count")
+                count = field[2]
+            else:
+                count = datatype.value[1]
+            if offset < 0:
+                raise ParameterException(f"field {field}: negative offset")
+            self.fields.append((offset, datatype, count))
+        self.size = max((offset + count for offset, _, count in self.fields), default=0)
+
+        # bytes are unpacked in word order, registers byteswapped if the byte order differs.
+        self.prefix = ">" if word_order == Endian.BIG else "<"
+        self.swap = word_order != byte_order
+        self.native_swap = (sys.byteorder == "little") != self.swap
+
+        layers, strings = self._build_layers()
+        self.structs = [struct.Struct(self.prefix + "".join(fmt)) for fmt, _, _ in layers]
+        self.strings = [(self.fields[inx][0] * 2, (self.fields[inx][0] + self.fields[inx][2]) * 2) for inx in strings]
+        decoded_order = [inx for _, indexes, _ in layers for inx in indexes] + strings
+        position = [0] * len(decoded_order)
+        for pos, inx in enumerate(decoded_order):
+            position[inx] = pos
+        if position == list(range(len(position))):
+            self._reorder = tuple
+        elif len(position) == 1:
+            self._reorder = lambda values: (values[0],)
+        else:
+            self._reorder = itemgetter(*position)
+
+    def _build_layers(self) -> tuple[list[tuple[list[str], list[int], list[int]]], list[int]]:
+        """Split fields in layers of non overlapping numeric fields (each decoded by one struct).
+
+        returns:
+            layers (struct format, field indexes, end offset),
+            string field indexes
+        """
+        layers: list[tuple[list[str], list[int], list[int]]] = []
+        strings: list[int] = []
+        for inx in sorted(range(len(self.fields)), key=lambda inx: self.fields[inx][0]):
+            offset, datatype, count = self.fields[inx]
+            if datatype == ModbusClientMixin.DATATYPE.STRING:
+                strings.append(inx)
+                continue
+            for layer in layers:
+                if layer[2][0] <= offset:
+                    break
+            else:
+                layer = ([], [], [0])
+                layers.append(layer)
+            fmt, indexes, end = layer
+            if offset > end[0]:
+                fmt.append(f"{(offset - end[0]) * 2}x")  # pad bytes
+            fmt.append(datatype.value[0])
+            indexes.append(inx)
+            end[0] = offset + count
+        return layers, strings
+
+    def _to_bytes(self, registers: list[int] | array, swap: bool) -> bytes:
+        """Convert registers to bytes (native order swapped if swap)."""
+        if isinstance(registers, array) and registers.typecode == "H":
+            if not swap:
+                return registers.tobytes()
+            registers = array("H", registers)
+        else:
+            registers = array("H", registers)
+        if swap:
+            registers.byteswap()
+        return registers.tobytes()
+
+    def decode(self, registers: list[int] | array) -> list[Any]:
+        """Decode registers.
+
+        :param registers: list of registers (or array("H")) e.g. from read_holding_registers()
+        :returns: list of values (int, float or str depending on datatype) in field order
+        :raises ParameterException: when there are too few registers
+        """
+        if len(registers) < self.size:
+            raise ParameterException(f"{len(registers)} registers, schema needs {self.size}")
+        data = self._to_bytes(registers, self.native_swap)
+        values: tuple = ()
+        for layer in self.structs:
+            values += layer.unpack_from(data)
+        if self.strings:
+            if self.swap:
+                data = self._to_bytes(registers, sys.byteorder == "little")
+            for start, end in self.strings:
+                text = data[start:end]
+                if text[-1:] == b"\00":
+                    text = text[:-1]
+                values += (text.decode("utf-8"),)
+        return list(self._reorder(values))
+
+    def decode_numpy(self, registers: list[int] | array, names: list[str] | None = None) -> numpy.ndarray:
+        """Decode registers to a numpy structured array.
+
+        :param registers: list of registers (or array("H")), a multiple of schema size (one record pr. size registers)
+        :param names: field names, default "f0", "f1"...
+        :returns: numpy structured array
+        :raises ParameterException: illegal size
+        :raises RuntimeError: numpy is not installed
+
+        STRING fields are returned as bytes (numpy "S" type).
+        """
+        if NUMPY_MISSING:
+            raise RuntimeError("numpy is not installed")
+        if not self.size or len(registers) % self.size:
+            raise ParameterException(f"{len(registers)} registers, not a multiple of schema size {self.size}")
+        if self.swap and self.strings:
+            raise ParameterException("STRING fields need word_order == byte_order")
+        formats = [
+            f"S{count * 2}" if datatype == ModbusClientMixin.DATATYPE.STRING else self.prefix + datatype.value[0]
+            for _, datatype, count in self.fields
+        ]
+        dtype = numpy.dtype({
+            "names": names or [f"f{inx}" for inx in range(len(self.fields))],
+            "formats": formats,
+            "offsets": [offset * 2 for offset, _, _ in self.fields],
+            "itemsize": self.size * 2,
+        })
+        return numpy.frombuffer(self._to_bytes(registers, self.native_swap), dtype=dtype)
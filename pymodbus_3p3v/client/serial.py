@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import contextlib
+import select
 import sys
 import time
 from collections.abc import Callable
@@ -9,7 +10,7 @@ from functools import partial
 
 from pymodbus_3p3v.client.base import ModbusBaseClient, ModbusBaseSyncClient
 from pymodbus_3p3v.exceptions import ConnectionException
-from pymodbus_3p3v.framer import FramerType
+from pymodbus_3p3v.framer import FramerRTU, FramerType
 from pymodbus_3p3v.logging import Log
 from pymodbus_3p3v.transport import CommParams, CommType
 from pymodbus_3p3v.utilities import ModbusTransactionState
@@ -268,11 +269,12 @@ class ModbusSerialClient(ModbusBaseSyncClient):
         while self.state != ModbusTransactionState.IDLE:
             if self.state == ModbusTransactionState.TRANSACTION_COMPLETE:
                 timestamp = round(time.time(), 6)
-                Log.debug(
-                    "Changing state to IDLE - Last Frame End - {} Current Time stamp - {}",
-                    self.last_frame_end,
-                    timestamp,
-                )
+                if Log.debug_enabled:
+                    Log.debug(
+                        "Changing state to IDLE - Last Frame End - {} Current Time stamp - {}",
+                        self.last_frame_end,
+                        timestamp,
+                    )
                 if self.last_frame_end:
                     idle_time = self.idle_time()
                     if round(timestamp - idle_time, 6) <= self.silent_interval:
@@ -322,15 +324,65 @@ class ModbusSerialClient(ModbusBaseSyncClient):
             time.sleep(self._recv_interval)
         return size
 
+    def _fileno(self) -> int | None:
+        """Return file descriptor of port (None if not selectable, e.g. url ports or windows)."""
+        try:
+            fileno = self.socket.fileno()  # type: ignore[union-attr]
+        except (AttributeError, OSError, ValueError):
+            return None
+        return fileno if isinstance(fileno, int) else None
+
+    def _rtu_frame_size(self, data: bytes) -> int | None:
+        """Return size of the rtu frame starting with data, None if unknown (yet)."""
+        if len(data) < 2 or not isinstance(self.framer, FramerRTU):
+            return None
+        decoder = self.framer.decoder
+        if decoder.rtu_frame_size[data[1]] is None:
+            return None
+        with contextlib.suppress(IndexError):
+            return decoder.lookupPduClass(data[1]).calculateRtuFrameSize(data) or None
+        return None
+
+    def _read_frame(self, fileno: int, size: int | None) -> bytes:
+        """Read size bytes (None: a frame) blocking on the port.
+
+        With a size, reads until size bytes are received or timeout expires.
+        Without a size, the size of a rtu frame is calculated as soon as the
+        header is received, a frame of unknown size ends with a silence
+        longer than silent_interval (3.5 characters) after the first byte.
+        """
+        result = b""
+        deadline = time.monotonic() + self.comm_params.timeout_connect
+        while True:
+            if size is None:
+                size = self._rtu_frame_size(result)
+            if size is not None and len(result) >= size:
+                break
+            timeout = deadline - time.monotonic()
+            if result and size is None:
+                timeout = min(timeout, self.silent_interval)
+            if timeout <= 0 or not select.select([fileno], [], [], timeout)[0]:
+                break
+            available = self._in_waiting() or 1
+            result += self.socket.read(available if size is None else min(available, size - len(result)))  # type: ignore[union-attr]
+        return result
+
     def recv(self, size: int | None) -> bytes:
-        """Read data from the underlying descriptor."""
+        """Read data from the underlying descriptor.
+
+        A selectable port is read as soon as data arrives, otherwise the
+        port is polled.
+        """
         if not self.socket:
             raise ConnectionException(str(self))
-        if size is None:
-            size = self._wait_for_data()
-        if size > self._in_waiting():
-            self._wait_for_data()
-        result = self.socket.read(size)
+        if (fileno := self._fileno()) is not None:
+            result = self._read_frame(fileno, size)
+        else:
+            if size is None:
+                size = self._wait_for_data()
+            if size > self._in_waiting():
+                self._wait_for_data()
+            result = self.socket.read(size)
         self.last_frame_end = round(time.time(), 6)
         return result
 
@@ -31,12 +31,17 @@ class AsyncModbusTcpClient(ModbusBaseClient):
     :param timeout: Timeout for connecting and receiving data, in seconds.
     :param retries: Max number of retries per request.
     :param on_connect_callback: Function that will be called just before a connection attempt.
+    :param max_in_flight: Max number of requests sent without waiting for a response (pipelining).
 
     .. tip::
         **reconnect_delay** doubles automatically with each unsuccessful connect, from
         **reconnect_delay** to **reconnect_delay_max**.
         Set `reconnect_delay=0` to avoid automatic reconnection.
 
+    .. tip::
+        **max_in_flight** > 1 requires FramerType.SOCKET, responses are matched
+        by transaction id, and the server must accept multiple outstanding requests.
+
     Example::
 
         from pymodbus_3p3v.client import AsyncModbusTcpClient
@@ -63,6 +68,7 @@ class AsyncModbusTcpClient(ModbusBaseClient):
         timeout: float = 3,
         retries: int = 3,
         on_connect_callback: Callable[[bool], None] | None = None,
+        max_in_flight: int = 1,
     ) -> None:
         """Initialize Asyncio Modbus TCP Client."""
         if not hasattr(self,"comm_params"):
@@ -81,6 +87,7 @@ class AsyncModbusTcpClient(ModbusBaseClient):
             framer,
             retries,
             on_connect_callback,
+            max_in_flight=max_in_flight,
         )
 
 
@@ -2,7 +2,10 @@
 
 __all__ = [
     "ModbusBaseSlaveContext",
+    "ModbusCompactDataBlock",
+    "ModbusPersistentDataBlock",
     "ModbusSequentialDataBlock",
+    "ModbusSharedMemoryDataBlock",
     "ModbusSparseDataBlock",
     "ModbusSlaveContext",
     "ModbusServerContext",
@@ -16,6 +19,9 @@ from pymodbus_3p3v.datastore.context import (
 )
 from pymodbus_3p3v.datastore.simulator import ModbusSimulatorContext
 from pymodbus_3p3v.datastore.store import (
+    ModbusCompactDataBlock,
+    ModbusPersistentDataBlock,
     ModbusSequentialDataBlock,
+    ModbusSharedMemoryDataBlock,
     ModbusSparseDataBlock,
 )
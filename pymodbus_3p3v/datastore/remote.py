@@ -1,6 +1,12 @@
 """Remote datastore."""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
 from pymodbus_3p3v.datastore import ModbusBaseSlaveContext
-from pymodbus_3p3v.exceptions import NotImplementedException
+from pymodbus_3p3v.exceptions import ModbusIOException, NotImplementedException
 from pymodbus_3p3v.logging import Log
 
 
@@ -127,3 +133,212 @@ class RemoteSlaveContext(ModbusBaseSlaveContext):
         else:
             return result
         return None
+
+
+class AsyncRemoteSlaveContext(ModbusBaseSlaveContext):
+    """Remote slave context, using an async client.
+
+    Made for forwarders/gateways (see examples/modbus_forwarder.py), where
+    many upstream clients are served by one downstream device:
+
+    - read results are cached for cache_ttl seconds pr. (table, address, count),
+    - concurrent identical reads are sent downstream once,
+    - writes are held for write_delay seconds (default: until the next loop
+      iteration), adjacent/overlapping writes to the same table are sent as
+      one request (a later write wins where writes overlap).
+
+    Reads wait for pending writes of the same table, and writes invalidate
+    the cached reads of the table. Each write increments the generation of
+    the table, the result of a read started in an older generation (i.e. sent
+    before the write) is returned to its caller, but neither cached nor shared
+    with reads started later.
+
+    Only async_getValues/async_setValues are supported (as used by the server),
+    an error response from the remote device is raised as ModbusIOException.
+    """
+
+    WRITE_FC = (0x05, 0x06, 0x0F, 0x10)
+    MAX_WRITE = {"c": 0x7B0, "h": 0x7B}
+
+    def __init__(self, client, slave=1, cache_ttl=0.0, write_delay=0.0):
+        """Initialize the datastores.
+
+        :param client: The async client to retrieve values with
+        :param slave: Unit ID of the remote slave
+        :param cache_ttl: Seconds a read result is reused, 0 for no cache
+        :param write_delay: Seconds writes are held to be batched
+        """
+        self._client = client
+        self.slave = slave
+        self.cache_ttl = cache_ttl
+        self.write_delay = write_delay
+        self._cache: dict[tuple[str, int, int], tuple[float, list]] = {}
+        self._reads: dict[tuple[str, int, int], tuple[int, asyncio.Future]] = {}
+        self._generation: dict[str, int] = {}
+        self._writes: dict[str, list[tuple[int, list, int, asyncio.Future]]] = {}
+        self._flush_tasks: dict[str, asyncio.Task] = {}
+        self._written: dict[tuple[str, int], list] = {}
+
+    def reset(self):
+        """Clear the read cache."""
+        self._cache.clear()
+
+    def validate(self, _fc_as_hex, _address, _count):
+        """Validate the request to make sure it is in range.
+
+        :returns: True
+        """
+        return True
+
+    def getValues(self, fc_as_hex, _address, _count=1):
+        """Not supported, use async_getValues."""
+        raise NotImplementedException("AsyncRemoteSlaveContext needs async_getValues")
+
+    def setValues(self, fc_as_hex, address, values):
+        """Not supported, use async_setValues."""
+        raise NotImplementedException("AsyncRemoteSlaveContext needs async_setValues")
+
+    async def async_getValues(self, fc_as_hex, address, count=1):
+        """Get values from the remote device (or the cache).
+
+        :param fc_as_hex: The function we are working with
+        :param address: The starting address
+        :param count: The number of values to retrieve
+        :returns: The requested values from a:a+c
+        :raises ModbusIOException: error response from the remote device
+        """
+        table = self.decode(fc_as_hex)
+        if fc_as_hex in self.WRITE_FC:
+            # response of write single coil/register, echo the written value.
+            return self._written.pop((table, address), [0] * count)
+        if table in self._flush_tasks:
+            await asyncio.shield(self._flush_tasks[table])
+        key = (table, address, count)
+        if (cached := self._cache.get(key)) and cached[0] > time.monotonic():
+            return list(cached[1])
+        generation = self._generation.get(table, 0)
+        if (read := self._reads.get(key)) and read[0] == generation:
+            return list(await asyncio.shield(read[1]))
+        future = asyncio.get_running_loop().create_future()
+        self._reads[key] = (generation, future)
+        try:
+            values = await self._read(table, address, count)
+        except BaseException as exc:
+            if isinstance(exc, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(exc)
+                future.exception()  # retrieved, the caller gets the exception.
+            raise
+        finally:
+            if self._reads.get(key, (0, None))[1] is future:
+                del self._reads[key]
+        if self.cache_ttl and generation == self._generation.get(table, 0):
+            self._cache[key] = (time.monotonic() + self.cache_ttl, values)
+        future.set_result(values)
+        return list(values)
+
+    async def async_setValues(self, fc_as_hex, address, values):
+        """Set values in the remote device (batched with other writes).
+
+        :param fc_as_hex: The function we are working with
+        :param address: The starting address
+        :param values: The new values to be set
+        :raises ModbusIOException: error response from the remote device
+        """
+        table = self.decode(fc_as_hex)
+        if fc_as_hex not in self.WRITE_FC:
+            raise ValueError(f"setValues() called with an non-write function code {fc_as_hex}")
+        self._generation[table] = self._generation.get(table, 0) + 1
+        for key in [key for key in self._cache if key[0] == table]:
+            del self._cache[key]
+        if fc_as_hex in (0x05, 0x06):
+            self._written[(table, address)] = list(values)
+        future = asyncio.get_running_loop().create_future()
+        self._writes.setdefault(table, []).append((address, list(values), fc_as_hex, future))
+        if table not in self._flush_tasks:
+            self._flush_tasks[table] = asyncio.create_task(self._flush(table))
+        await asyncio.shield(future)
+
+    async def _read(self, table: str, address: int, count: int) -> list:
+        """Read from the remote device."""
+        call = {
+            "d": self._client.read_discrete_inputs,
+            "c": self._client.read_coils,
+            "h": self._client.read_holding_registers,
+            "i": self._client.read_input_registers,
+        }[table]
+        response = await call(address, count=count, slave=self.slave)
+        if response.isError():
+            raise ModbusIOException(f"remote read {table}{address}[{count}] failed: {response}")
+        if table in ("d", "c"):
+            return response.bits[:count]
+        return response.registers
+
+    async def _write(self, table: str, address: int, values: list, single: bool) -> None:
+        """Write to the remote device."""
+        if single:
+            call = self._client.write_coil if table == "c" else self._client.write_register
+            response = await call(address, values[0], slave=self.slave)
+        else:
+            call = self._client.write_coils if table == "c" else self._client.write_registers
+            response = await call(address, values, slave=self.slave)
+        if response.isError():
+            raise ModbusIOException(f"remote write {table}{address}[{len(values)}] failed: {response}")
+
+    async def _flush(self, table: str) -> None:
+        """Send pending writes of table, merged in as few requests as possible.
+
+        If cancelled, the writes not sent (popped or pending) fail, instead
+        of leaving their callers waiting.
+        """
+        writes: list[tuple[int, list, int, asyncio.Future]] = []
+        try:
+            await asyncio.sleep(self.write_delay)
+            writes = self._writes.pop(table)
+            await self._send_writes(table, writes)
+        except asyncio.CancelledError:
+            for address, values, _, future in writes + self._writes.pop(table, []):
+                if not future.done():
+                    future.set_exception(ModbusIOException(f"remote write {table}{address}[{len(values)}] cancelled"))
+                    future.exception()  # retrieved, the caller gets the exception.
+            raise
+        finally:
+            del self._flush_tasks[table]
+            if table in self._writes:
+                # written while sending.
+                self._flush_tasks[table] = asyncio.create_task(self._flush(table))
+
+    async def _send_writes(self, table: str, writes: list[tuple[int, list, int, asyncio.Future]]) -> None:
+        """Send writes merged in as few requests as possible, and resolve the futures."""
+        merged: dict[int, Any] = {}
+        singles = set()
+        for address, values, fc_as_hex, _ in writes:
+            merged.update(zip(range(address, address + len(values)), values))
+            if fc_as_hex in (0x05, 0x06):
+                singles.add(address)
+        runs: list[tuple[int, list]] = []
+        for address in sorted(merged):
+            start, values = runs[-1] if runs else (-1, [])
+            if address == start + len(values) and len(values) < self.MAX_WRITE[table]:
+                values.append(merged[address])
+            else:
+                runs.append((address, [merged[address]]))
+        errors: list[tuple[int, int, Exception]] = []
+        for start, values in runs:
+            try:
+                await self._write(table, start, values, len(values) == 1 and start in singles)
+            except Exception as exc:  # pylint: disable=broad-except
+                errors.append((start, start + len(values), exc))
+        for address, values, _, future in writes:
+            error = next(
+                (exc for start, end, exc in errors if start < address + len(values) and address < end),
+                None,
+            )
+            if future.done():
+                continue
+            if error:
+                future.set_exception(error)
+                future.exception()  # retrieved, the caller gets the exception.
+            else:
+                future.set_result(None)
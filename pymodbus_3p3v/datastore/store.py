@@ -47,18 +47,36 @@ based on their preference.
 # pylint: disable=missing-type-doc
 from __future__ import annotations
 
+import mmap
+import os
+import shutil
+import struct
+import sys
+import threading
+import time
+import zlib
 from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left, bisect_right
 from collections.abc import Iterable
+from contextlib import suppress
+from multiprocessing import resource_tracker, shared_memory
 from typing import Any, Generic, TypeVar
 
-from pymodbus_3p3v.exceptions import ParameterException
+from pymodbus_3p3v.exceptions import ModbusIOException, ParameterException
+from pymodbus_3p3v.logging import Log
+from pymodbus_3p3v.utilities import PackedBits, pack_bitstring
+
+
+with suppress(ImportError):
+    import fcntl
 
 
 # ---------------------------------------------------------------------------#
 #  Datablock Storage
 # ---------------------------------------------------------------------------#
 
-V = TypeVar('V', list, dict[int, Any])
+V = TypeVar('V', list, dict[int, Any], array)
 class BaseModbusDataBlock(ABC, Generic[V]):
     """Base class for a modbus datastore.
 
@@ -218,6 +236,571 @@ class ModbusSequentialDataBlock(BaseModbusDataBlock[list]):
         self.values[start : start + len(values)] = values
 
 
+class ModbusCompactDataBlock(BaseModbusDataBlock[array]):
+    """Creates a sequential modbus datastore, stored compact.
+
+    Registers are stored in an array("H") (2 bytes pr register), bits are packed
+    8 pr byte (array("B")), a full address space needs 128K (registers) or 8K (bits)
+    compared to 512K pointers for ModbusSequentialDataBlock.
+
+    getValues returns an array slice (registers) or :class:`PackedBits` (bits),
+    both are read by index like a list, and are serialized by the response
+    encoders without converting each value.
+    """
+
+    def __init__(self, address, values, bits=None):
+        """Initialize the datastore.
+
+        :param address: The starting address of the datastore
+        :param values: Either a list of values or a single value
+        :param bits: True for coils/discrete inputs, default is bool values (registers if no values)
+        """
+        self.address = address
+        if not hasattr(values, "__iter__"):
+            values = [values]
+        values = list(values)
+        self.bits = bool(values) and isinstance(values[0], bool) if bits is None else bits
+        self.default_value = False if self.bits else 0
+        self._store(values)
+
+    def _store(self, values):
+        """Replace all values."""
+        self.count = len(values)
+        if self.bits:
+            self.values = array("B", pack_bitstring(values))
+        else:
+            self.values = array("H", values)
+
+    @classmethod
+    def create(cls, bits=False):
+        """Create a datastore.
+
+        With the full address space initialized to 0x00
+
+        :param bits: True for coils/discrete inputs
+        :returns: An initialized datastore
+        """
+        return cls(0x00, [False] * 65536 if bits else [0x00] * 65536, bits=bits)
+
+    def default(self, count, value=False):
+        """Use to initialize a store to one value.
+
+        :param count: The number of fields to set
+        :param value: The default value to set to the fields
+        """
+        self.default_value = value
+        self.address = 0x00
+        self._store([value] * count)
+
+    def reset(self):
+        """Reset the datastore to the initialized default value."""
+        self._store([self.default_value] * self.count)
+
+    def validate(self, address, count=1):
+        """Check to see if the request is in range.
+
+        :param address: The starting address
+        :param count: The number of values to test for
+        :returns: True if the request in within range, False otherwise
+        """
+        return self.address <= address and address + count <= self.address + self.count
+
+    def getValues(self, address, count=1):
+        """Return the requested values of the datastore.
+
+        :param address: The starting address
+        :param count: The number of values to retrieve
+        :returns: The requested values from a:a+c (array or PackedBits)
+        """
+        start = address - self.address
+        if self.bits:
+            return PackedBits.from_buffer(self.values, start, count)
+        return self.values[start : start + count]
+
+    def setValues(self, address, values):
+        """Set the requested values of the datastore.
+
+        :param address: The starting address
+        :param values: The new values to be set
+        """
+        if not hasattr(values, "__iter__"):
+            values = [values]
+        start = address - self.address
+        if not self.bits:
+            self.values[start : start + len(values)] = array("H", values)
+            return
+        for inx, value in enumerate(values, start):
+            if value:
+                self.values[inx >> 3] |= 1 << (inx & 7)
+            else:
+                self.values[inx >> 3] &= ~(1 << (inx & 7))
+
+    def __str__(self):
+        """Build a representation of the datastore.
+
+        :returns: A string representation of the datastore
+        """
+        return f"DataStore({self.count}, {self.default_value})"
+
+    def __iter__(self):
+        """Iterate over the data block data.
+
+        :returns: An iterator of the data block data
+        """
+        return enumerate(self.getValues(self.address, self.count), self.address)
+
+
+class ModbusSharedMemoryDataBlock(ModbusCompactDataBlock):
+    """Creates a compact modbus datastore in shared memory.
+
+    The values are stored like :class:`ModbusCompactDataBlock`, but in a
+    multiprocessing.shared_memory segment, allowing several processes to
+    serve and update the same values without locks or IPC, e.g. an
+    acquisition process writing values, served by one or more servers.
+
+    The segment starts with a header (address, count, bits and a sequence
+    counter) followed by the values. Writes are protected by a seqlock: the
+    writer makes the sequence odd while writing and even when done, readers
+    copy the values and retry if the sequence changed meanwhile, so a read
+    never returns a partly written block.
+
+    Writers are serialized by a lock (a thread lock and, on Unix, a fcntl
+    record lock on the segment), so any number of threads and processes
+    may write. Reads do not lock.
+
+    Processes forked after the block is created share it directly, other
+    processes use :meth:`attach` with the name of the segment (pickling the
+    block, e.g. as a multiprocessing argument, attaches by name).
+
+    The creating process owns the segment, and should call :meth:`unlink`
+    when it is no longer needed.
+    """
+
+    # magic, version, bits, address, count, sequence, checked sequence, crc
+    HEADER = struct.Struct("<4sBBxxIIQQI4x")
+    MAGIC = b"MBSD"
+    VERSION = 2
+    SEQUENCE_OFFSET = 16
+    CHECK = struct.Struct("<QI")
+    CHECK_OFFSET = 24
+    READ_RETRIES = 10000
+
+    def __init__(self, address, values, bits=None, name=None):
+        """Initialize the datastore.
+
+        :param address: The starting address of the datastore
+        :param values: Either a list of values or a single value
+        :param bits: True for coils/discrete inputs, default is bool values
+        :param name: Name of the shared memory segment, default a random name
+        """
+        self.shm: shared_memory.SharedMemory | None = None
+        self.owner = True
+        self._name = name
+        super().__init__(address, values, bits)
+
+    @classmethod
+    def attach(cls, name):
+        """Attach to an existing shared datastore.
+
+        :param name: Name of the shared memory segment
+        :returns: An initialized datastore
+        :raises ParameterException: segment is not a shared datastore
+        """
+        block = cls.__new__(cls)
+        block.owner = False
+        block._name = name  # pylint: disable=protected-access
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=name, track=False)  # pylint: disable=unexpected-keyword-arg
+        else:
+            shm = shared_memory.SharedMemory(name=name)
+            # only the owner may unlink the segment (at exit).
+            resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]  # pylint: disable=protected-access
+        block._attach(shm)  # pylint: disable=protected-access
+        return block
+
+    def _attach(self, shm):
+        """Use an existing segment (address, count and bits from the header)."""
+        try:
+            magic, version, bits, self.address, self.count, _, _, _ = self.HEADER.unpack_from(shm.buf)
+        except struct.error:
+            magic = b""
+        self.bits = bool(bits) if magic else False
+        if magic != self.MAGIC or version != self.VERSION or len(shm.buf) < self.HEADER.size + self._size(self.count):
+            shm.close()
+            raise ParameterException(f"{self._name} is not a shared datastore (version {self.VERSION})")
+        self.shm = shm
+        self.default_value = False if self.bits else 0
+        self._map()
+
+    def _create(self, size):
+        """Create segment."""
+        return shared_memory.SharedMemory(name=self._name, create=True, size=size)
+
+    @property
+    def name(self) -> str:
+        """Return name of the shared memory segment."""
+        return self.shm.name  # type: ignore[union-attr]
+
+    @property
+    def sequence(self) -> int:
+        """Return write sequence (incremented by 2 pr. write), allows readers to detect changes."""
+        return self._sequence[0]
+
+    def _size(self, count):
+        """Return number of bytes needed for count values."""
+        return (count + 7) >> 3 if self.bits else count * 2
+
+    def _map(self):
+        """Map sequence and values to the shared memory."""
+        self._thread_lock = threading.Lock()
+        self._fd = getattr(self.shm, "_fd", -1) if "fcntl" in globals() else -1
+        buf = self.shm.buf  # type: ignore[union-attr]
+        self._sequence = buf[self.SEQUENCE_OFFSET : self.SEQUENCE_OFFSET + 8].cast("Q")
+        self._buffer = buf[self.HEADER.size : self.HEADER.size + self._size(self.count)]
+        self.values = self._buffer.cast("B" if self.bits else "H")  # type: ignore[assignment]
+
+    def _store(self, values):
+        """Replace all values (size cannot be changed)."""
+        if self.shm is None:
+            self.count = len(values)
+            self.shm = self._create(self.HEADER.size + self._size(self.count))
+            self.HEADER.pack_into(self.shm.buf, 0, self.MAGIC, self.VERSION, self.bits, self.address, self.count, 0, 0, 0)
+            self._map()
+        elif len(values) != self.count:
+            raise ParameterException("The size of a shared datablock cannot be changed")
+        self._lock()
+        try:
+            self._sequence[0] += 1
+            if self.bits:
+                self._buffer[:] = pack_bitstring(values)
+            else:
+                self.values[:] = array("H", values)
+            self._sequence[0] += 1
+        finally:
+            self._unlock()
+
+    def _lock(self):
+        """Lock out other writers (threads in this process and other processes)."""
+        self._thread_lock.acquire()
+        if self._fd >= 0:
+            try:
+                fcntl.lockf(self._fd, fcntl.LOCK_EX, 8, self.SEQUENCE_OFFSET)
+            except BaseException:
+                self._thread_lock.release()
+                raise
+
+    def _unlock(self):
+        """Allow other writers."""
+        if self._fd >= 0:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, 8, self.SEQUENCE_OFFSET)
+        self._thread_lock.release()
+
+    def getValues(self, address, count=1):
+        """Return the requested values of the datastore.
+
+        :param address: The starting address
+        :param count: The number of values to retrieve
+        :returns: The requested values from a:a+c (array or PackedBits), copied
+        :raises ModbusIOException: a write did not finish (writer died ?)
+        """
+        start = address - self.address
+        for _ in range(self.READ_RETRIES):
+            sequence = self._sequence[0]
+            if sequence & 1:
+                time.sleep(0)
+                continue
+            if self.bits:
+                values = PackedBits.from_buffer(self._buffer, start, count)
+            else:
+                values = array("H")
+                values.frombytes(self._buffer[start * 2 : (start + count) * 2])
+            if self._sequence[0] == sequence:
+                return values
+        raise ModbusIOException(f"shared datastore {self.name}: write not finished")
+
+    def setValues(self, address, values):
+        """Set the requested values of the datastore.
+
+        :param address: The starting address
+        :param values: The new values to be set
+        """
+        self._lock()
+        try:
+            self._sequence[0] += 1
+            try:
+                super().setValues(address, values)
+            finally:
+                self._sequence[0] += 1
+        finally:
+            self._unlock()
+
+    def close(self):
+        """Close the shared memory (in this process)."""
+        if self.shm is not None:
+            self.values.release()  # type: ignore[attr-defined]
+            self._buffer.release()
+            self._sequence.release()
+            self.shm.close()
+            self.shm = None
+
+    def unlink(self):
+        """Close and remove the shared memory segment (owner only)."""
+        shm = self.shm
+        self.close()
+        if self.owner and shm is not None:
+            shm.unlink()
+
+    def __reduce__(self):
+        """Pickle as name (the unpickled block attaches to the segment)."""
+        return (self.attach, (self.name,))
+
+
+class _MmapFile:
+    """File mapped in memory, used like a shared memory segment.
+
+    :meta private:
+    """
+
+    def __init__(self, path, size=0):
+        """Map file (created with size if size > 0), the file is kept open for locking."""
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT if size else os.O_RDWR)
+        try:
+            if size:
+                os.ftruncate(self._fd, size)
+            self.mmap = mmap.mmap(self._fd, 0)
+        except BaseException:
+            os.close(self._fd)
+            raise
+        self.buf = memoryview(self.mmap)
+        self.name = path
+
+    def flush(self):
+        """Write changes to disk."""
+        self.mmap.flush()
+
+    def close(self):
+        """Unmap and close file."""
+        self.buf.release()
+        self.mmap.close()
+        os.close(self._fd)
+
+    def unlink(self):
+        """Remove file."""
+        os.unlink(self.name)
+
+
+class ModbusPersistentDataBlock(ModbusSharedMemoryDataBlock):
+    """Creates a compact modbus datastore persisted in a memory mapped file.
+
+    The file has the same layout as :class:`ModbusSharedMemoryDataBlock`,
+    a write only touches the written values (O(1) pr. value), the operating
+    system writes the changed pages to disk. Starting with an existing file
+    maps it (values, address and bits are taken from the file), nothing is
+    loaded.
+
+    Values survive a restart or a crash of the process, to survive a crash
+    of the machine use a policy:
+
+    - flush_interval, the file is flushed (msync) at most flush_interval
+      seconds after a write (0 = as soon as possible).
+    - snapshot_interval, a consistent copy is written to <path>.snapshot
+      (via a temporary file and rename, so the snapshot is never partly
+      written) at most snapshot_interval seconds after a write.
+
+    Flush and snapshot run in a timer thread, never in the writer (e.g. the
+    event loop of a server). A flush (and close) stores a crc32 of the values
+    with the write sequence in the header, a snapshot is checked the same way.
+
+    On startup the file is damaged if a write did not finish (odd sequence),
+    or the values do not match the crc (e.g. a page only partly written when
+    the machine crashed). Writes after the last flush cannot be checked, after
+    a crash they are used as found (with a warning). A damaged file is
+    restored from the snapshot, without a (valid) snapshot it is recreated
+    from values if given, otherwise the values are used as found (with an
+    error logged).
+
+    Several processes may open the same file, reads and writes are protected
+    by the seqlock and writer lock of :class:`ModbusSharedMemoryDataBlock`.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        path,
+        address=0,
+        values=None,
+        bits=None,
+        flush_interval=None,
+        snapshot_interval=None,
+    ):
+        """Initialize the datastore.
+
+        :param path: File name
+        :param address: The starting address of the datastore (new or damaged file)
+        :param values: Either a list of values or a single value (needed for a new file)
+        :param bits: True for coils/discrete inputs, default is bool values (new or damaged file)
+        :param flush_interval: Max seconds from a write to the flush to disk, None for no flush
+        :param snapshot_interval: Max seconds from a write to the snapshot, None for no snapshots
+        :raises ParameterException: file is not a datastore file, and no values to recreate it
+        """
+        self.flush_interval = flush_interval
+        self.snapshot_interval = snapshot_interval
+        self.snapshot_path = f"{path}.snapshot"
+        self._last_flush = self._last_snapshot = time.monotonic()
+        self._timers: dict[str, threading.Timer | None] = {"flush": None, "snapshot": None}
+        self._sync_lock = threading.Lock()
+        if not os.path.exists(path):
+            if values is None:
+                raise ParameterException(f"{path} does not exist, values needed to create it")
+            super().__init__(address, values, bits, name=path)
+            self._check_point()
+            return
+        self.shm = None
+        self.owner = True
+        self._name = path
+        self._open(address, values, bits)
+
+    def _open(self, address, values, bits):
+        """Map existing file, restore snapshot (or recreate) if the file is damaged."""
+        found = False
+        with suppress(ParameterException, ValueError, OSError):
+            self._attach(_MmapFile(self._name))
+            found = True
+            if self._verify(self._buffer, self.sequence, self.CHECK.unpack_from(self.shm.buf, self.CHECK_OFFSET)):  # type: ignore[union-attr]
+                return
+            # unmap without storing a crc of the damaged values
+            super().close()
+        if self._valid_snapshot():
+            Log.warning("datastore {} damaged, restoring {}", self._name, self.snapshot_path)
+            shutil.copyfile(self.snapshot_path, self._name)
+            self._attach(_MmapFile(self._name))
+            return
+        if values is not None:
+            Log.error("datastore {} damaged and no snapshot, recreated from values", self._name)
+            os.unlink(self._name)
+            super().__init__(address, values, bits, name=self._name)
+            self._check_point()
+            return
+        if not found:
+            raise ParameterException(f"{self._name} is damaged or not a datastore file, and no snapshot")
+        Log.error("datastore {} damaged and no snapshot, values used as found", self._name)
+        self._attach(_MmapFile(self._name))
+        self._sequence[0] += self._sequence[0] & 1
+        self._check_point()
+
+    def _verify(self, payload, sequence: int, check: tuple[int, int]) -> bool:
+        """Return True if payload is consistent with sequence and check (checked sequence, crc)."""
+        if sequence & 1:
+            return False
+        if check[0] != sequence:
+            Log.warning("datastore {} not closed, writes after the last flush are not checked", self._name)
+            return True
+        return zlib.crc32(payload) == check[1]
+
+    def _valid_snapshot(self) -> bool:
+        """Return True if the snapshot exists and is consistent."""
+        try:
+            with open(self.snapshot_path, "rb") as file:
+                data = file.read()
+            magic, version, bits, _, count, sequence, checked, crc = self.HEADER.unpack_from(data)
+        except (OSError, struct.error):
+            return False
+        size = (count + 7) >> 3 if bits else count * 2
+        if magic != self.MAGIC or version != self.VERSION or len(data) < self.HEADER.size + size or checked != sequence:
+            return False
+        return self._verify(data[self.HEADER.size : self.HEADER.size + size], sequence, (checked, crc))
+
+    def _check_point(self) -> bytes:
+        """Store crc of the values (with the sequence) in the header, return the file content."""
+        self._lock()
+        try:
+            data = bytearray(self.shm.buf[: self.HEADER.size + self._size(self.count)])  # type: ignore[union-attr]
+            check = (self.sequence, zlib.crc32(memoryview(data)[self.HEADER.size :]))
+            self.CHECK.pack_into(self.shm.buf, self.CHECK_OFFSET, *check)  # type: ignore[union-attr]
+        finally:
+            self._unlock()
+        self.CHECK.pack_into(data, self.CHECK_OFFSET, *check)
+        return bytes(data)
+
+    def _create(self, size):
+        """Create file."""
+        return _MmapFile(self._name, size)
+
+    def setValues(self, address, values):
+        """Set the requested values of the datastore.
+
+        Flush/snapshot (if configured) are scheduled in a timer thread.
+
+        :param address: The starting address
+        :param values: The new values to be set
+        """
+        super().setValues(address, values)
+        if self.flush_interval is not None and not self._timers["flush"]:
+            self._schedule("flush", self._last_flush + self.flush_interval, self.flush)
+        if self.snapshot_interval is not None and not self._timers["snapshot"]:
+            self._schedule("snapshot", self._last_snapshot + self.snapshot_interval, self.snapshot)
+
+    def _schedule(self, name, due, call):
+        """Start timer calling call at due (monotonic)."""
+        timer = threading.Timer(max(due - time.monotonic(), 0.0), self._run_timer, (name, call))
+        timer.daemon = True
+        self._timers[name] = timer
+        timer.start()
+
+    def _run_timer(self, name, call):
+        """Call flush/snapshot (timer thread)."""
+        with self._sync_lock:
+            self._timers[name] = None
+            if self.shm is None:
+                return
+            try:
+                call()
+            except (OSError, ModbusIOException) as exc:
+                Log.error("datastore {} {} failed: {}", self._name, name, exc)
+
+    def flush(self):
+        """Store crc of the values in the header and write changes to disk."""
+        self._check_point()
+        self.shm.flush()  # type: ignore[union-attr]
+        self._last_flush = time.monotonic()
+
+    def snapshot(self):
+        """Write a consistent copy of the file (with crc) to snapshot_path."""
+        data = self._check_point()
+        temp_path = f"{self.snapshot_path}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self.snapshot_path)
+        self._last_snapshot = time.monotonic()
+
+    def close(self):
+        """Stop timers, store crc (flush if flush_interval is set) and unmap the file."""
+        for timer in self._timers.values():
+            if timer:
+                timer.cancel()
+        with self._sync_lock:
+            if self.shm is not None:
+                if self.flush_interval is not None:
+                    self.flush()
+                else:
+                    self._check_point()
+            super().close()
+
+    def unlink(self):
+        """Close and remove the file and snapshot."""
+        super().unlink()
+        with suppress(FileNotFoundError):
+            os.unlink(self.snapshot_path)
+
+    def __reduce__(self):
+        """Pickle as path (the unpickled block maps the file)."""
+        return (
+            self.__class__,
+            (self._name, self.address, None, self.bits, self.flush_interval, self.snapshot_interval),
+        )
+
+
 class ModbusSparseDataBlock(BaseModbusDataBlock[dict[int, Any]]):
     """A sparse modbus datastore.
 
@@ -236,6 +819,10 @@ class ModbusSparseDataBlock(BaseModbusDataBlock[dict[int, Any]]):
 
     Unless 'mutable' is set to True during initialization, the datablock cannot be altered with
     setValues (new datablocks cannot be added)
+
+    The addresses are indexed as sorted runs of contiguous addresses (merged
+    when blocks touch), so validate() is a bisect lookup (O(log n)) and not
+    dependent on the size of the datablock.
     """
 
     def __init__(self, values=None, mutable=True):
@@ -255,7 +842,10 @@ class ModbusSparseDataBlock(BaseModbusDataBlock[dict[int, Any]]):
 
         """
         self.values = {}
+        self._starts: list[int] = []
+        self._ends: list[int] = []
         self._process_values(values)
+        self._build_index()
         self.mutable = mutable
         self.default_value = self.values.copy()
 
@@ -273,6 +863,29 @@ class ModbusSparseDataBlock(BaseModbusDataBlock[dict[int, Any]]):
     def reset(self):
         """Reset the store to the initially provided defaults."""
         self.values = self.default_value.copy()
+        self._build_index()
+
+    def _build_index(self):
+        """Build index of contiguous address runs."""
+        self._starts = []
+        self._ends = []
+        for address in sorted(self.values):
+            if self._ends and self._ends[-1] == address:
+                self._ends[-1] += 1
+            else:
+                self._starts.append(address)
+                self._ends.append(address + 1)
+
+    def _add_index(self, address, count):
+        """Add address run to index (merged with overlapping/touching runs)."""
+        end = address + count
+        first = bisect_left(self._ends, address)
+        last = bisect_right(self._starts, end)
+        if first < last:
+            address = min(address, self._starts[first])
+            end = max(end, self._ends[last - 1])
+        self._starts[first:last] = [address]
+        self._ends[first:last] = [end]
 
     def validate(self, address, count=1):
         """Check to see if the request is in range.
@@ -283,8 +896,8 @@ class ModbusSparseDataBlock(BaseModbusDataBlock[dict[int, Any]]):
         """
         if not count:
             return False
-        handle = set(range(address, address + count))
-        return handle.issubset(set(iter(self.values.keys())))
+        inx = bisect_right(self._starts, address) - 1
+        return inx >= 0 and address + count <= self._ends[inx]
 
     def getValues(self, address, count=1):
         """Return the requested values of the datastore.
@@ -296,19 +909,26 @@ class ModbusSparseDataBlock(BaseModbusDataBlock[dict[int, Any]]):
         return [self.values[i] for i in range(address, address + count)]
 
     def _process_values(self, values):
-        """Process values."""
+        """Process values.
+
+        :returns: The address runs set, as (address, count)
+        """
 
         def _process_as_dict(values):
+            runs = []
             for idx, val in iter(values.items()):
                 if isinstance(val, (list, tuple)):
                     for i, v_item in enumerate(val):
                         self.values[idx + i] = v_item
+                    if val:
+                        runs.append((idx, len(val)))
                 else:
                     self.values[idx] = int(val)
+                    runs.append((idx, 1))
+            return runs
 
         if isinstance(values, dict):
-            _process_as_dict(values)
-            return
+            return _process_as_dict(values)
         if hasattr(values, "__iter__"):
             values = dict(enumerate(values))
         elif values is None:
@@ -317,7 +937,7 @@ class ModbusSparseDataBlock(BaseModbusDataBlock[dict[int, Any]]):
             raise ParameterException(
                 "Values for datastore must be a list or dictionary"
             )
-        _process_as_dict(values)
+        return _process_as_dict(values)
 
     def setValues(self, address, values, use_as_default=False):
         """Set the requested values of the datastore.
@@ -331,7 +951,8 @@ class ModbusSparseDataBlock(BaseModbusDataBlock[dict[int, Any]]):
             new_offsets = list(set(values.keys()) - set(self.values.keys()))
             if new_offsets and not self.mutable:
                 raise ParameterException(f"Offsets {new_offsets} not in range")
-            self._process_values(values)
+            for run in self._process_values(values):
+                self._add_index(*run)
         else:
             if not isinstance(values, list):
                 values = [values]
@@ -339,6 +960,8 @@ class ModbusSparseDataBlock(BaseModbusDataBlock[dict[int, Any]]):
                 if address + idx not in self.values and not self.mutable:
                     raise ParameterException("Offset {address+idx} not in range")
                 self.values[address + idx] = val
+            if values:
+                self._add_index(address, len(values))
         if use_as_default:
             for idx, val in iter(self.values.items()):
                 self.default_value[idx] = val
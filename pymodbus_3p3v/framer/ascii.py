@@ -6,6 +6,7 @@ ModbusMessage provides a unified interface to send/receive Modbus requests/respo
 """
 from __future__ import annotations
 
+import re
 from binascii import a2b_hex, b2a_hex
 
 from pymodbus_3p3v.framer.base import FramerBase
@@ -31,30 +32,36 @@ class FramerAscii(FramerBase):
     START = b':'
     END = b'\r\n'
     MIN_SIZE = 10
+    _start = re.compile(re.escape(START))
+    _end = re.compile(re.escape(END))
 
 
     def decode(self, data: bytes) -> tuple[int, int, int, bytes]:
-        """Decode ADU."""
+        """Decode ADU.
+
+        data is searched in place (it may be a memoryview of the receive
+        buffer), only the located frame is copied.
+        """
         used_len = 0
         data_len = len(data)
         while True:
             if data_len - used_len < self.MIN_SIZE:
                 Log.debug("Short frame: {} wait for more data", data, ":hex")
                 return used_len, 0, 0, self.EMPTY
-            buffer = data[used_len:]
-            if buffer[0:1] != self.START:
-                if (i := buffer.find(self.START)) == -1:
+            if data[used_len] != self.START[0]:
+                if not (start := self._start.search(data, used_len)):
                     Log.debug("No frame start in data: {}, wait for data", data, ":hex")
                     return data_len, 0, 0, self.EMPTY
-                used_len += i
+                used_len = start.start()
                 continue
-            if (end := buffer.find(self.END)) == -1:
+            if not (end := self._end.search(data, used_len)):
                 Log.debug("Incomplete frame: {} wait for more data", data, ":hex")
                 return used_len, 0, 0, self.EMPTY
-            dev_id = int(buffer[1:3], 16)
-            lrc = int(buffer[end - 2: end], 16)
-            msg = a2b_hex(buffer[1 : end - 2])
-            used_len += end + 2
+            frame = bytes(data[used_len + 1 : end.start()])
+            used_len = end.end()
+            dev_id = int(frame[0:2], 16)
+            lrc = int(frame[-2:], 16)
+            msg = a2b_hex(frame[:-2])
             if not self.check_LRC(msg, lrc):
                 Log.debug("LRC wrong in frame: {} skipping", data, ":hex")
                 continue
@@ -75,10 +82,11 @@ class FramerAscii(FramerBase):
 
     @classmethod
     def compute_LRC(cls, data: bytes) -> int:
-        """Use to compute the longitudinal redundancy check against a string."""
-        lrc = sum(int(a) for a in data) & 0xFF
-        lrc = (lrc ^ 0xFF) + 1
-        return lrc & 0xFF
+        """Use to compute the longitudinal redundancy check against a string.
+
+        sum() of bytes is done in C, no need for a generator.
+        """
+        return -sum(data) & 0xFF
 
     @classmethod
     def check_LRC(cls, data: bytes, check: int) -> bool:
@@ -7,6 +7,7 @@ According to the selected type of modbus frame a prefix/suffix is added/removed
 from __future__ import annotations
 
 from enum import Enum
+from typing import NamedTuple
 
 from pymodbus_3p3v.exceptions import ModbusIOException
 from pymodbus_3p3v.logging import Log
@@ -22,6 +23,15 @@ class FramerType(str, Enum):
     TLS = "tls"
 
 
+class FrameCacheInfo(NamedTuple):
+    """Frame cache statistics (like functools.lru_cache cache_info)."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
 class FramerBase:
     """Intern base."""
 
@@ -31,14 +41,25 @@ class FramerBase:
     def __init__(
         self,
         decoder: DecodePDU,
+        frame_cache_size: int = 0,
     ) -> None:
-        """Initialize a ADU (framer) instance."""
+        """Initialize a ADU (framer) instance.
+
+        :param decoder: PDU decoder
+        :param frame_cache_size: max number of encoded frames to cache (0 disables the cache)
+        """
         self.decoder = decoder
         self.databuffer = b""
+        self.frame_cache: dict[tuple[int, bytes], bytes] = {}
+        self.frame_cache_size = frame_cache_size
+        self.frame_cache_hits = 0
+        self.frame_cache_misses = 0
 
     def decode(self, _data: bytes) -> tuple[int, int, int, bytes]:
         """Decode ADU.
 
+        data might be a memoryview, so only use indexing and slicing.
+
         returns:
             used_len (int) or 0 to read more
             dev_id,
@@ -55,14 +76,56 @@ class FramerBase:
         """
         return data
 
+    def set_frame_tid(self, frame: bytes, _tid: int) -> bytes:
+        """Set transaction id in an encoded ADU (cached frames are encoded with tid 0).
+
+        returns:
+            modbus ADU (bytes)
+        """
+        return frame
+
     def buildFrame(self, message: ModbusPDU) -> bytes:
         """Create a ready to send modbus packet.
 
+        Polling sends the same requests again and again, so the encoded frames
+        are kept in a LRU cache (if frame_cache_size > 0), keyed by (slave, PDU).
+
         :param message: The populated request/response to send
         """
         data = message.function_code.to_bytes(1,'big') + message.encode()
-        frame = self.encode(data, message.slave_id, message.transaction_id)
-        return frame
+        if not self.frame_cache_size:
+            return self.encode(data, message.slave_id, message.transaction_id)
+        key = (message.slave_id, data)
+        if (frame := self.frame_cache.pop(key, None)) is None:
+            self.frame_cache_misses += 1
+            frame = self.encode(data, message.slave_id, 0)
+            if len(self.frame_cache) >= self.frame_cache_size:
+                del self.frame_cache[next(iter(self.frame_cache))]
+        else:
+            self.frame_cache_hits += 1
+        self.frame_cache[key] = frame
+        return self.set_frame_tid(frame, message.transaction_id)
+
+    def set_frame_cache_size(self, frame_cache_size: int) -> None:
+        """Change max number of cached frames (0 disables and clears the cache)."""
+        self.frame_cache_size = frame_cache_size
+        while len(self.frame_cache) > frame_cache_size:
+            del self.frame_cache[next(iter(self.frame_cache))]
+
+    def frame_cache_info(self) -> FrameCacheInfo:
+        """Return frame cache statistics."""
+        return FrameCacheInfo(
+            self.frame_cache_hits,
+            self.frame_cache_misses,
+            self.frame_cache_size,
+            len(self.frame_cache),
+        )
+
+    def frame_cache_clear(self) -> None:
+        """Clear frame cache and statistics."""
+        self.frame_cache.clear()
+        self.frame_cache_hits = 0
+        self.frame_cache_misses = 0
 
     def processIncomingFrame(self, data: bytes) -> tuple[int, ModbusPDU | None]:
         """Process new packet pattern.
@@ -71,15 +134,59 @@ class FramerBase:
         packet stream, and performs framing on it. That is, checks
         for complete messages, and once found, will process all that
         exist.
+
+        data is accessed through a memoryview, so hunting for a frame
+        does not copy the buffer, the views are released before returning,
+        so the caller can resize data (e.g. a bytearray receive buffer).
+        """
+        used_len = 0
+        with memoryview(data) as view:
+            while True:
+                data_len, pdu = self._processFrameView(view, used_len)
+                used_len += data_len
+                if not data_len:
+                    return used_len, None
+                if pdu:
+                    return used_len, pdu
+
+    def processIncomingFrames(self, data: bytes) -> tuple[int, list[ModbusPDU]]:
+        """Process all complete frames in data.
+
+        Unlike processIncomingFrame, which returns after the first PDU,
+        this decodes every complete frame in one pass (e.g. pipelined
+        responses received in one segment).
+
+        A frame that cannot be decoded ends the pass, the frames decoded
+        before it are returned (used_len stops at the bad frame), the next
+        call raises ModbusIOException for the bad frame.
+
+        returns:
+            used_len (int) for all decoded frames,
+            list of PDUs in order of arrival
         """
         used_len = 0
-        while True:
-            data_len, pdu = self._processIncomingFrame(data[used_len:])
-            used_len += data_len
-            if not data_len:
-                return used_len, None
-            if pdu:
-                return used_len, pdu
+        pdus: list[ModbusPDU] = []
+        with memoryview(data) as view:
+            while True:
+                try:
+                    data_len, pdu = self._processFrameView(view, used_len)
+                except ModbusIOException:
+                    if not pdus:
+                        raise
+                    return used_len, pdus
+                used_len += data_len
+                if not data_len:
+                    return used_len, pdus
+                if pdu:
+                    pdus.append(pdu)
+
+    def _processFrameView(self, view: memoryview, start: int) -> tuple[int, ModbusPDU | None]:
+        """Process view[start:], and release the slice even if decoding fails."""
+        frame = view[start:]
+        try:
+            return self._processIncomingFrame(frame)
+        finally:
+            frame.release()
 
     def _processIncomingFrame(self, data: bytes) -> tuple[int, ModbusPDU | None]:
         """Process new packet pattern.
@@ -89,15 +196,20 @@ class FramerBase:
         for complete messages, and once found, will process all that
         exist.
         """
-        Log.debug("Processing: {}", data, ":hex")
+        if Log.debug_enabled:
+            Log.debug("Processing: {}", data, ":hex")
         if not data:
             return 0, None
         used_len, dev_id, tid, frame_data = self.decode(data)
         if not frame_data:
             return used_len, None
-        if (result := self.decoder.decode(frame_data)) is None:
+        frame = bytes(frame_data)
+        if isinstance(frame_data, memoryview):
+            frame_data.release()
+        if (result := self.decoder.decode(frame)) is None:
             raise ModbusIOException("Unable to decode request")
         result.slave_id = dev_id
         result.transaction_id = tid
-        Log.debug("Frame advanced, resetting header!!")
+        if Log.debug_enabled:
+            Log.debug("Frame advanced, resetting header!!")
         return used_len, result
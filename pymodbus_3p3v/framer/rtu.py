@@ -1,10 +1,22 @@
 """Modbus RTU frame implementation."""
 from __future__ import annotations
 
+import sys
+from collections.abc import Callable
+
+from pymodbus_3p3v.exceptions import ParameterException
 from pymodbus_3p3v.framer.base import FramerBase
 from pymodbus_3p3v.logging import Log
 
 
+try:
+    from crcmod import mkCrcFun
+
+    CRCMOD_MISSING = False
+except ImportError:
+    CRCMOD_MISSING = True
+
+
 class FramerRTU(FramerBase):
     """Modbus RTU frame type.
 
@@ -76,6 +88,7 @@ class FramerRTU(FramerBase):
     """
 
     MIN_SIZE = 4  # <slave id><function code><crc 2 bytes>
+    MAX_SIZE = 256  # <slave id><pdu 253 bytes><crc 2 bytes>
 
     @classmethod
     def generate_crc16_table(cls) -> list[int]:
@@ -95,33 +108,100 @@ class FramerRTU(FramerBase):
             result.append(crc)
         return result
     crc16_table: list[int] = [0]
+    crc16_word_table: list[int] = []
+    crc16_shift_tables: list[tuple[list[int], list[int]]] = []
+    crc16_backends: dict[str, Callable[[bytes], int]] = {}
+    crc16_backend: str = ""
+    _crc16: Callable[[bytes], int]
+    _crcmod_crc16: Callable[[bytes], int]
+
+    @classmethod
+    def generate_crc16_word_table(cls) -> list[int]:
+        """Generate a crc16 lookup table for 2 bytes (64K entries).
 
+        entry is the crc register after feeding 2 zero bytes to register index,
+        so the register after feeding a (little endian) word is table[crc ^ word].
+        """
+        table = cls.crc16_table
+        low = [((crc >> 8) & 0xFF) ^ table[crc & 0xFF] for crc in range(0x10000)]
+        return [((crc >> 8) & 0xFF) ^ table[crc & 0xFF] for crc in low]
+
+    @classmethod
+    def set_crc16_backend(cls, backend: str = "") -> None:
+        """Select the crc16 implementation used by compute_CRC.
 
-    def decode(self, data: bytes) -> tuple[int, int, int, bytes]:
-        """Decode ADU."""
+        Backends (crc16_backends) in order of speed:
+
+        - "crcmod", C extension in the optional crcmod package (pip install pymodbus[crc])
+        - "word", pure python, 2 bytes pr table lookup (table is generated at first call)
+        - "byte", pure python, 1 byte pr table lookup
+
+        :param backend: name of backend, default is the fastest available
+        :raises ParameterException: unknown backend
+        """
+        if not backend:
+            backend = next(iter(cls.crc16_backends))
+        if backend not in cls.crc16_backends:
+            raise ParameterException(f"Unknown crc16 backend {backend}, use one of {list(cls.crc16_backends)}")
+        cls.crc16_backend = backend
+        cls._crc16 = staticmethod(cls.crc16_backends[backend])  # type: ignore[assignment]
+
+
+    def decode(self, data: bytes) -> tuple[int, int, int, bytes]:  # noqa: C901
+        """Decode ADU.
+
+        Each offset costs a lookup in the decoder frame size table, the
+        CRC is only calculated for candidates with a known function code
+        and a possible frame size.
+
+        When hunting (the frame at the current offset is not valid), the
+        buffer is translated once to a function code mask, and the next
+        candidate is found with bytes.find() instead of stepping byte by byte.
+        The CRC of candidates is calculated from a running CRC over the
+        buffer (see check_CRC_prefix), so hunting calculates the CRC of
+        each byte once, instead of once pr candidate.
+        """
         data_len = len(data)
-        for used_len in range(data_len):
+        frame_size_table = self.decoder.rtu_frame_size
+        used_len = 0
+        candidates = None
+        prefix: list[int] = [0]
+        while True:
             if data_len - used_len < self.MIN_SIZE:
                 Log.debug("Short frame: {} wait for more data", data, ":hex")
                 return used_len, 0, 0, self.EMPTY
-            dev_id = int(data[used_len])
-            func_code = int(data[used_len + 1])
-            if func_code & 0x7F not in self.decoder.lookup:
-                continue
-            pdu_class = self.decoder.lookupPduClass(func_code)
-            if not (size := pdu_class.calculateRtuFrameSize(data[used_len:])):
-                size = data_len +1
-            if data_len < used_len +size:
-                Log.debug("Frame - not ready")
-                return used_len, dev_id, 0, self.EMPTY
-            start_crc = used_len + size -2
-            crc = data[start_crc : start_crc + 2]
-            crc_val = (int(crc[0]) << 8) + int(crc[1])
-            if not FramerRTU.check_CRC(data[used_len : start_crc], crc_val):
-                Log.debug("Frame check failed, ignoring!!")
-                continue
-            return start_crc + 2, dev_id, 0, data[used_len + 1 : start_crc]
-        return 0, 0, 0, self.EMPTY
+            if (entry := frame_size_table[data[used_len + 1]]):
+                dev_id = int(data[used_len])
+                size, byte_count_pos = entry
+                if not size:
+                    if byte_count_pos:
+                        if data_len - used_len > byte_count_pos:
+                            size = int(data[used_len + byte_count_pos]) + byte_count_pos + 3
+                    else:
+                        pdu_class = self.decoder.lookupPduClass(int(data[used_len + 1]))
+                        size = pdu_class.calculateRtuFrameSize(data[used_len:])
+                    if not size:
+                        Log.debug("Frame - not ready")
+                        return used_len, dev_id, 0, self.EMPTY
+                if size <= self.MAX_SIZE:
+                    if data_len < used_len + size:
+                        Log.debug("Frame - not ready")
+                        return used_len, dev_id, 0, self.EMPTY
+                    start_crc = used_len + size -2
+                    crc_val = (int(data[start_crc]) << 8) + int(data[start_crc + 1])
+                    if candidates is None:
+                        crc_ok = FramerRTU.check_CRC(data[used_len : start_crc], crc_val)
+                    else:
+                        crc_ok = FramerRTU.check_CRC_prefix(data, prefix, used_len, start_crc, crc_val)
+                    if crc_ok:
+                        return start_crc + 2, dev_id, 0, data[used_len + 1 : start_crc]
+                    Log.debug("Frame check failed, ignoring!!")
+            if candidates is None:
+                candidates = bytes(data).translate(self.decoder.rtu_function_code_mask)
+            if (next_code := candidates.find(1, used_len + 2)) == -1:
+                used_len = max(used_len + 1, data_len - self.MIN_SIZE + 1)
+            else:
+                used_len = next_code - 1
 
 
     def encode(self, pdu: bytes, device_id: int, _tid: int) -> bytes:
@@ -139,6 +219,51 @@ class FramerRTU(FramerBase):
         """
         return cls.compute_CRC(data) == check
 
+    @classmethod
+    def check_CRC_prefix(cls, data: bytes, prefix: list[int], start: int, end: int, check: int) -> bool:
+        """Check if data[start:end] matches the passed in CRC, using a running CRC.
+
+        prefix[k] is the crc register (initial value 0) after data[:k],
+        it is extended as needed, and reused between calls with the same data.
+
+        The crc is linear, so the crc register of data[start:end] is
+        shift(prefix[start] ^ 0xFFFF, end - start) ^ prefix[end], where
+        shift() feeds zero bytes to the register (see crc16_shift).
+
+        :param data: The data to create a crc16 of
+        :param prefix: The running crc registers
+        :param start: The first byte of the frame
+        :param end: The byte after the frame (the CRC position)
+        :param check: The CRC to validate
+        :returns: True if matched, False otherwise
+        """
+        if len(prefix) <= end:
+            crc = prefix[-1]
+            table = cls.crc16_table
+            for data_byte in data[len(prefix) - 1 : end]:
+                crc = ((crc >> 8) & 0xFF) ^ table[(crc ^ int(data_byte)) & 0xFF]
+                prefix.append(crc)
+        crc = cls.crc16_shift(prefix[start] ^ 0xFFFF, end - start) ^ prefix[end]
+        return (((crc << 8) & 0xFF00) | ((crc >> 8) & 0x00FF)) == check
+
+    @classmethod
+    def crc16_shift(cls, crc: int, length: int) -> int:
+        """Return crc register after feeding length zero bytes.
+
+        The shift is linear, so it is calculated with a low and a high
+        byte table pr length, the tables are generated once.
+        """
+        tables = cls.crc16_shift_tables
+        while len(tables) <= length:
+            low, high = tables[-1]
+            table = cls.crc16_table
+            tables.append((
+                [((crc >> 8) & 0xFF) ^ table[crc & 0xFF] for crc in low],
+                [((crc >> 8) & 0xFF) ^ table[crc & 0xFF] for crc in high],
+            ))
+        low, high = tables[length]
+        return low[crc & 0xFF] ^ high[crc >> 8]
+
     @classmethod
     def compute_CRC(cls, data: bytes) -> int:
         """Compute a crc16 on the passed in bytes.
@@ -146,14 +271,64 @@ class FramerRTU(FramerBase):
         The difference between modbus's crc16 and a normal crc16
         is that modbus starts the crc value out at 0xffff.
 
+        The calculation is done by the selected backend (see set_crc16_backend).
+
+        :param data: The data to create a crc16 of
+        :returns: The calculated CRC
+        """
+        return cls._crc16(data)
+
+    @classmethod
+    def compute_CRC_byte(cls, data: bytes) -> int:
+        """Compute a crc16, 1 byte pr table lookup ("byte" backend).
+
         :param data: The data to create a crc16 of
         :returns: The calculated CRC
         """
         crc = 0xFFFF
+        table = cls.crc16_table
         for data_byte in data:
-            idx = cls.crc16_table[(crc ^ int(data_byte)) & 0xFF]
-            crc = ((crc >> 8) & 0xFF) ^ idx
-        swapped = ((crc << 8) & 0xFF00) | ((crc >> 8) & 0x00FF)
-        return swapped
+            crc = (crc >> 8) ^ table[(crc ^ data_byte) & 0xFF]
+        return ((crc << 8) & 0xFF00) | (crc >> 8)
+
+    @classmethod
+    def compute_CRC_word(cls, data: bytes) -> int:
+        """Compute a crc16, 2 bytes pr table lookup ("word" backend).
+
+        Short frames are calculated bytewise, the cost of
+        making a word view is higher than the lookups saved.
+
+        :param data: The data to create a crc16 of
+        :returns: The calculated CRC
+        """
+        if (data_len := len(data)) < 16:
+            return cls.compute_CRC_byte(data)
+        if not (word_table := cls.crc16_word_table):
+            word_table = cls.crc16_word_table = cls.generate_crc16_word_table()
+        crc = 0xFFFF
+        for word in memoryview(data)[: data_len & ~1].cast("H"):
+            crc = word_table[crc ^ word]
+        if data_len & 1:
+            crc = (crc >> 8) ^ cls.crc16_table[(crc ^ data[-1]) & 0xFF]
+        return ((crc << 8) & 0xFF00) | (crc >> 8)
+
+    @classmethod
+    def compute_CRC_crcmod(cls, data: bytes) -> int:
+        """Compute a crc16 with the crcmod C extension ("crcmod" backend).
+
+        :param data: The data to create a crc16 of
+        :returns: The calculated CRC
+        """
+        crc = cls._crcmod_crc16(data)
+        return ((crc << 8) & 0xFF00) | (crc >> 8)
+
 
 FramerRTU.crc16_table = FramerRTU.generate_crc16_table()
+if not CRCMOD_MISSING:
+    FramerRTU._crcmod_crc16 = staticmethod(mkCrcFun(0x18005, initCrc=0xFFFF, rev=True, xorOut=0))  # type: ignore[assignment]
+    FramerRTU.crc16_backends["crcmod"] = FramerRTU.compute_CRC_crcmod
+if sys.byteorder == "little":
+    FramerRTU.crc16_backends["word"] = FramerRTU.compute_CRC_word
+FramerRTU.crc16_backends["byte"] = FramerRTU.compute_CRC_byte
+FramerRTU.set_crc16_backend()
+FramerRTU.crc16_shift_tables = [(list(range(256)), [value << 8 for value in range(256)])]
@@ -44,3 +44,7 @@ class FramerSocket(FramerBase):
            pdu
         )
         return frame
+
+    def set_frame_tid(self, frame: bytes, tid: int) -> bytes:
+        """Set transaction id in an encoded ADU."""
+        return tid.to_bytes(2, 'big') + frame[2:]
@@ -35,10 +35,24 @@ def pymodbus_apply_logging_config(
 class Log:
     """Class to hide logging complexity.
 
+    Hot paths guard debug logging with ``if Log.debug_enabled:``, when
+    False they pay nothing (no call, no argument packing/building).
+    debug_enabled is set from the effective level of the pymodbus logger
+    at import, and refreshed by setLevel() / pymodbus_apply_logging_config().
+    Levels changed otherwise (getLogger("pymodbus_3p3v").setLevel(), the
+    root level, basicConfig(), dictConfig()...) are not seen by the hot
+    paths until update_debug_enabled() (or setLevel()) is called.
+
     :meta private:
     """
 
     _logger = logging.getLogger(__name__)
+    debug_enabled: bool = _logger.isEnabledFor(logging.DEBUG)
+
+    @classmethod
+    def update_debug_enabled(cls):
+        """Set debug_enabled from the effective level of the logger (call after changing levels)."""
+        cls.debug_enabled = cls._logger.isEnabledFor(logging.DEBUG)
 
     @classmethod
     def apply_logging_config(cls, level, log_file_name):
@@ -63,6 +77,7 @@ class Log:
     def setLevel(cls, level):
         """Apply basic logging level."""
         cls._logger.setLevel(level)
+        cls.update_debug_enabled()
 
     @classmethod
     def build_msg(cls, txt, *args):
@@ -99,7 +114,7 @@ class Log:
     @classmethod
     def debug(cls, txt, *args):
         """Log debug messages."""
-        if cls._logger.isEnabledFor(logging.DEBUG):
+        if cls.debug_enabled and cls._logger.isEnabledFor(logging.DEBUG):
             cls._logger.debug(cls.build_msg(txt, *args), stacklevel=2)
 
     @classmethod
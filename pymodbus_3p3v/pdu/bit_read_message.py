@@ -5,12 +5,14 @@ import struct
 
 from pymodbus_3p3v.pdu.pdu import ModbusExceptions as merror
 from pymodbus_3p3v.pdu.pdu import ModbusPDU
-from pymodbus_3p3v.utilities import pack_bitstring, unpack_bitstring
+from pymodbus_3p3v.utilities import PackedBits, pack_bitstring, unpack_bitstring
 
 
 class ReadBitsRequestBase(ModbusPDU):
     """Base class for Messages Requesting bit values."""
 
+    __slots__ = ("address", "count")
+
     _rtu_frame_size = 8
 
     def __init__(self, address, count, slave, transaction, skip_encode):
@@ -61,8 +63,16 @@ class ReadBitsResponseBase(ModbusPDU):
     """Base class for Messages responding to bit-reading values.
 
     The requested bits can be found in the .bits list.
+
+    With packed_bits=True (set by DecodePDU(packed_bits=True)) .bits is
+    decoded as a :class:`~pymodbus.utilities.PackedBits` instead of a list,
+    the bits are then only unpacked when accessed (and not at all when
+    the response is encoded again, e.g. by a gateway). setBit()/resetBit()
+    convert PackedBits to a list.
     """
 
+    __slots__ = ("_bits", "byte_count", "packed_bits")
+
     _rtu_byte_count_pos = 2
 
     def __init__(self, values, slave, transaction, skip_encode):
@@ -73,26 +83,59 @@ class ReadBitsResponseBase(ModbusPDU):
         """
         super().__init__()
         super().setData(slave, transaction, skip_encode)
+        self.packed_bits = False
 
         #: A list of booleans representing bit values
         self.bits = values or []
 
+    @property
+    def bits(self) -> list[bool] | PackedBits:
+        """Return bit values (decoded on first access after decode_lazy())."""
+        if self._bits is None:
+            self._unpack(self._payload)
+        return self._bits  # type: ignore[return-value]
+
+    @bits.setter
+    def bits(self, values: list[bool] | PackedBits) -> None:
+        """Set bit values."""
+        self._bits = values
+        self._payload = None
+
     def encode(self):
         """Encode response pdu.
 
         :returns: The encoded packet message
         """
-        result = pack_bitstring(self.bits)
+        if self._bits is None:
+            return bytes(self._payload)  # type: ignore[arg-type]
+        result = pack_bitstring(self._bits)
         packet = struct.pack(">B", len(result)) + result
         return packet
 
+    def _unpack(self, data) -> None:
+        """Unpack bits (as list or PackedBits)."""
+        if self.packed_bits:
+            self._bits = PackedBits(bytes(data[1:]), (len(data) - 1) * 8)
+        else:
+            self._bits = unpack_bitstring(data[1:])
+
     def decode(self, data):
         """Decode response pdu.
 
         :param data: The packet data to decode
         """
         self.byte_count = int(data[0])  # pylint: disable=attribute-defined-outside-init
-        self.bits = unpack_bitstring(data[1:])
+        self._unpack(data)
+        self._payload = None
+
+    def decode_lazy(self, data):
+        """Decode response pdu header, bits are decoded on first access.
+
+        :param data: The packet data to decode
+        """
+        self.byte_count = int(data[0])  # pylint: disable=attribute-defined-outside-init
+        self._bits = None
+        self._payload = data
 
     def setBit(self, address, value=1):
         """Set the specified bit.
@@ -100,7 +143,10 @@ class ReadBitsResponseBase(ModbusPDU):
         :param address: The bit to set
         :param value: The value to set the bit to
         """
-        self.bits[address] = bool(value)
+        if not isinstance(bits := self.bits, list):
+            # PackedBits are read only
+            bits = self.bits = list(bits)
+        bits[address] = bool(value)
 
     def resetBit(self, address):
         """Set the specified bit to 0.
@@ -131,7 +177,10 @@ class ReadCoilsRequest(ReadBitsRequestBase):
     numbered 1-16 are addressed as 0-15.
     """
 
+    __slots__ = ()
+
     function_code = 1
+    inline_safe = True
     function_code_name = "read_coils"
 
     def __init__(self, address=None, count=None, slave=1, transaction=0, skip_encode=False):
@@ -179,6 +228,8 @@ class ReadCoilsResponse(ReadBitsResponseBase):
     The requested coils can be found in boolean form in the .bits list.
     """
 
+    __slots__ = ()
+
     function_code = 1
 
     def __init__(self, values=None, slave=1, transaction=0, skip_encode=False):
@@ -199,7 +250,10 @@ class ReadDiscreteInputsRequest(ReadBitsRequestBase):
     zero. Therefore Discrete inputs numbered 1-16 are addressed as 0-15.
     """
 
+    __slots__ = ()
+
     function_code = 2
+    inline_safe = True
     function_code_name = "read_discrete_input"
 
     def __init__(self, address=None, count=None, slave=1, transaction=0, skip_encode=False):
@@ -247,6 +301,8 @@ class ReadDiscreteInputsResponse(ReadBitsResponseBase):
     The requested coils can be found in boolean form in the .bits list.
     """
 
+    __slots__ = ()
+
     function_code = 2
 
     def __init__(self, values=None, slave=1, transaction=0, skip_encode=False):
@@ -38,7 +38,10 @@ class WriteSingleCoilRequest(ModbusPDU):
     will not affect the coil.
     """
 
+    __slots__ = ("address", "value")
+
     function_code = 5
+    inline_safe = True
     function_code_name = "write_coil"
 
     _rtu_frame_size = 8
@@ -108,6 +111,8 @@ class WriteSingleCoilResponse(ModbusPDU):
     Returned after the coil state has been written.
     """
 
+    __slots__ = ("address", "value")
+
     function_code = 5
     _rtu_frame_size = 8
 
@@ -162,7 +167,10 @@ class WriteMultipleCoilsRequest(ModbusPDU):
     corresponding output to be ON. A logical "0" requests it to be OFF."
     """
 
+    __slots__ = ("address", "byte_count", "values")
+
     function_code = 15
+    inline_safe = True
     function_code_name = "write_coils"
     _rtu_byte_count_pos = 6
 
@@ -240,6 +248,8 @@ class WriteMultipleCoilsResponse(ModbusPDU):
     Starting address, and quantity of coils forced.
     """
 
+    __slots__ = ("address", "count")
+
     function_code = 15
     _rtu_frame_size = 8
 
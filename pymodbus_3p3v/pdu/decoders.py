@@ -15,7 +15,20 @@ from pymodbus_3p3v.logging import Log
 
 
 class DecodePDU:
-    """Decode pdu requests/responses (server/client)."""
+    """Decode pdu requests/responses (server/client).
+
+    With lazy=True the pdu keeps a view of the received data
+    (pdu.raw_payload), responses with values (registers/bits) are only
+    decoded when the values are accessed, and encoded as received if the
+    values are not accessed (e.g. a gateway forwarding responses).
+
+    With packed_bits=True bit responses (coils/discrete inputs) are decoded
+    with .bits as a (read only) PackedBits instead of a list.
+
+    With pool_size > 0 decoded pdu objects can be handed back with
+    release(), decode() then reuses them (up to pool_size free objects
+    pr. pdu type) instead of allocating new ones.
+    """
 
     _pdu_class_table: set[tuple[type[base.ModbusPDU], type[base.ModbusPDU]]] = {
         (reg_r_msg.ReadHoldingRegistersRequest, reg_r_msg.ReadHoldingRegistersResponse),
@@ -60,13 +73,45 @@ class DecodePDU:
         (mei_msg.ReadDeviceInformationRequest, mei_msg.ReadDeviceInformationResponse),
     }
 
-    def __init__(self, is_server: bool) -> None:
+    def __init__(self, is_server: bool, lazy: bool = False, pool_size: int = 0, packed_bits: bool = False) -> None:
         """Initialize function_tables."""
+        self.lazy = lazy
+        self.packed_bits = packed_bits
+        self.pool_size = pool_size
+        self.pool: dict[type[base.ModbusPDU], list[base.ModbusPDU]] = {}
         inx = 0 if is_server else 1
         self.lookup: dict[int, type[base.ModbusPDU]] = {cl[inx].function_code: cl[inx] for cl in self._pdu_class_table}
         self.sub_lookup: dict[int, dict[int, type[base.ModbusPDU]]] = {f: {} for f in self.lookup}
         for f in self._pdu_sub_class_table:
             self.sub_lookup[f[inx].function_code][f[inx].sub_function_code] = f[inx]
+        self.rtu_frame_size: list[tuple[int, int] | None] = [None] * 256
+        self.rtu_function_code_mask = bytearray(256)
+        for function_code, pdu_class in self.lookup.items():
+            self._set_rtu_frame_size(function_code, pdu_class)
+
+    def _set_rtu_frame_size(self, function_code: int, pdu_class: type[base.ModbusPDU]) -> None:
+        """Add function code to the RTU frame size table.
+
+        table entries are:
+            None, not a known function code
+            (frame_size, 0), fixed frame size
+            (0, byte_count_pos), frame size calculated from byte count
+            (0, 0), frame size calculated by pdu_class.calculateRtuFrameSize
+
+        rtu_function_code_mask is the table as bytes.translate() mask
+        (1 for known function codes), used to skip garbage when hunting.
+        """
+        entry = (0, 0)
+        if pdu_class.calculateRtuFrameSize.__func__ is base.ModbusPDU.calculateRtuFrameSize.__func__:  # type: ignore[attr-defined]
+            if pdu_class._rtu_frame_size:  # pylint: disable=protected-access
+                entry = (pdu_class._rtu_frame_size, 0)  # pylint: disable=protected-access
+            elif pdu_class._rtu_byte_count_pos:  # pylint: disable=protected-access
+                entry = (0, pdu_class._rtu_byte_count_pos)  # pylint: disable=protected-access
+        self.rtu_frame_size[function_code] = entry
+        self.rtu_function_code_mask[function_code] = 1
+        if function_code < 0x80:
+            self.rtu_frame_size[function_code | 0x80] = (base.ExceptionResponse._rtu_frame_size, 0)  # pylint: disable=protected-access
+            self.rtu_function_code_mask[function_code | 0x80] = 1
 
     def lookupPduClass(self, function_code: int) -> type[base.ModbusPDU]:
         """Use `function_code` to determine the class of the PDU."""
@@ -81,6 +126,7 @@ class DecodePDU:
                 "`pymodbus.pdu.ModbusPDU` "
             )
         self.lookup[custom_class.function_code] = custom_class
+        self._set_rtu_frame_size(custom_class.function_code, custom_class)
         if custom_class.sub_function_code >= 0:
             if custom_class.function_code not in self.sub_lookup:
                 self.sub_lookup[custom_class.function_code] = {}
@@ -88,6 +134,19 @@ class DecodePDU:
                 custom_class.sub_function_code
             ] = custom_class
 
+    def release(self, pdu: base.ModbusPDU) -> None:
+        """Return a decoded pdu to the pool (if pool_size > 0).
+
+        The pdu is reused as is by a later decode() (which overwrites the
+        decoded fields), so it must not be used (or released again) after
+        release. Values (e.g. .registers) fetched before remain valid.
+        """
+        pdu_type = type(pdu)
+        if not self.pool_size or self.lookup.get(pdu.function_code) is not pdu_type:
+            return
+        if len(free := self.pool.setdefault(pdu_type, [])) < self.pool_size:
+            free.append(pdu)
+
     def decode(self, frame: bytes) -> base.ModbusPDU | None:
         """Decode a frame."""
         try:
@@ -98,10 +157,20 @@ class DecodePDU:
             if not (pdu_type := self.lookup.get(function_code, None)):
                 Log.debug("decode PDU failed for function code {}", function_code)
                 raise ModbusException(f"Unknown response {function_code}")
-            pdu = pdu_type()
+            if self.pool_size and (free := self.pool.get(pdu_type)):
+                pdu = free.pop()
+            else:
+                pdu = pdu_type()
             pdu.setData(0, 0, False)
-            Log.debug("decode PDU for {}", function_code)
-            pdu.decode(frame[1:])
+            if isinstance(pdu, bit_r_msg.ReadBitsResponseBase):
+                pdu.packed_bits = self.packed_bits
+            if Log.debug_enabled:
+                Log.debug("decode PDU for {}", function_code)
+            if self.lazy:
+                # view of an immutable copy, the receive buffer is reused
+                pdu.decode_lazy(memoryview(frame if isinstance(frame, bytes) else bytes(frame))[1:])
+            else:
+                pdu.decode(frame[1:])
 
             if pdu.sub_function_code >= 0:
                 lookup = self.sub_lookup.get(pdu.function_code, {})
@@ -23,11 +23,14 @@ _MCB = ModbusControlBlock()
 #  diagnostic 08, 00-18,20
 # ---------------------------------------------------------------------------#
 #  TODO Make sure all the data is decoded from the response # pylint: disable=fixme
+#  No __slots__, decode() stores the received sub function code in the
+#  instance (overriding the class attribute).
 # ---------------------------------------------------------------------------#
 class DiagnosticStatusRequest(ModbusPDU):
     """This is a base class for all of the diagnostic request functions."""
 
     function_code = 0x08
+    inline_safe = True
     function_code_name = "diagnostic_status"
     sub_function_code = 9999
     _rtu_frame_size = 8
@@ -17,6 +17,15 @@ from pymodbus_3p3v.pdu.pdu import ModbusPDU
 class FileRecord:  # pylint: disable=eq-without-hash
     """Represents a file record and its relevant data."""
 
+    __slots__ = (
+        "file_number",
+        "record_data",
+        "record_length",
+        "record_number",
+        "reference_type",
+        "response_length",
+    )
+
     def __init__(self, reference_type=0x06, file_number=0x00, record_number=0x00, record_data=b'', record_length=None, response_length=None):
         """Initialize a new instance.
 
@@ -85,7 +94,10 @@ class ReadFileRecordRequest(ModbusPDU):
     MODBUS PDU: 235 bytes.
     """
 
+    __slots__ = ("records",)
+
     function_code = 0x14
+    inline_safe = True
     function_code_name = "read_file_record"
     _rtu_byte_count_pos = 2
 
@@ -152,6 +164,8 @@ class ReadFileRecordResponse(ModbusPDU):
     contains a field that shows its own byte count.
     """
 
+    __slots__ = ("records",)
+
     function_code = 0x14
     _rtu_byte_count_pos = 2
 
@@ -208,7 +222,10 @@ class WriteFileRecordRequest(ModbusPDU):
     bit words.
     """
 
+    __slots__ = ("records",)
+
     function_code = 0x15
+    inline_safe = True
     function_code_name = "write_file_record"
     _rtu_byte_count_pos = 2
 
@@ -274,6 +291,8 @@ class WriteFileRecordRequest(ModbusPDU):
 class WriteFileRecordResponse(ModbusPDU):
     """The normal response is an echo of the request."""
 
+    __slots__ = ("records",)
+
     function_code = 0x15
     _rtu_byte_count_pos = 2
 
@@ -339,7 +358,10 @@ class ReadFifoQueueRequest(ModbusPDU):
     them.
     """
 
+    __slots__ = ("address", "values")
+
     function_code = 0x18
+    inline_safe = True
     function_code_name = "read_fifo_queue"
     _rtu_frame_size = 6
 
@@ -392,6 +414,8 @@ class ReadFifoQueueResponse(ModbusPDU):
     error code of 03 (Illegal Data Value).
     """
 
+    __slots__ = ("values",)
+
     function_code = 0x18
 
     @classmethod
@@ -34,6 +34,8 @@ class _OutOfSpaceException(Exception):
 
 # ---------------------------------------------------------------------------#
 #  Read Device Information
+#  No __slots__, decode() stores the received sub function code in the
+#  instance (overriding the class attribute).
 # ---------------------------------------------------------------------------#
 class ReadDeviceInformationRequest(ModbusPDU):
     """Read device information.
@@ -48,6 +50,7 @@ class ReadDeviceInformationRequest(ModbusPDU):
     """
 
     function_code = 0x2B
+    inline_safe = True
     sub_function_code = 0x0E
     function_code_name = "read_device_information"
     _rtu_frame_size = 7
@@ -26,7 +26,10 @@ class ReadExceptionStatusRequest(ModbusPDU):
     known (no output reference is needed in the function).
     """
 
+    __slots__ = ()
+
     function_code = 0x07
+    inline_safe = True
     function_code_name = "read_exception_status"
     _rtu_frame_size = 4
 
@@ -67,6 +70,8 @@ class ReadExceptionStatusResponse(ModbusPDU):
     Exception Status outputs are device specific.
     """
 
+    __slots__ = ("status",)
+
     function_code = 0x07
     _rtu_frame_size = 5
 
@@ -127,7 +132,10 @@ class GetCommEventCounterRequest(ModbusPDU):
     (code 00 01) or Clear Counters and Diagnostic Register (code 00 0A).
     """
 
+    __slots__ = ()
+
     function_code = 0x0B
+    inline_safe = True
     function_code_name = "get_event_counter"
     _rtu_frame_size = 4
 
@@ -169,6 +177,8 @@ class GetCommEventCounterResponse(ModbusPDU):
     will be all zeros.
     """
 
+    __slots__ = ("count", "status")
+
     function_code = 0x0B
     _rtu_frame_size = 8
 
@@ -234,7 +244,10 @@ class GetCommEventLogRequest(ModbusPDU):
     flushes the oldest byte from the field.
     """
 
+    __slots__ = ()
+
     function_code = 0x0C
+    inline_safe = True
     function_code_name = "get_event_log"
     _rtu_frame_size = 4
 
@@ -283,6 +296,8 @@ class GetCommEventLogResponse(ModbusPDU):
     field defines the total length of the data in these four field
     """
 
+    __slots__ = ("event_count", "events", "message_count", "status")
+
     function_code = 0x0C
     _rtu_byte_count_pos = 2
 
@@ -357,7 +372,10 @@ class ReportSlaveIdRequest(ModbusPDU):
     The current status, and other information specific to a remote device.
     """
 
+    __slots__ = ()
+
     function_code = 0x11
+    inline_safe = True
     function_code_name = "report_slave_id"
     _rtu_frame_size = 4
 
@@ -418,6 +436,8 @@ class ReportSlaveIdResponse(ModbusPDU):
     The data contents are specific to each type of device.
     """
 
+    __slots__ = ("byte_count", "identifier", "status")
+
     function_code = 0x11
     _rtu_byte_count_pos = 2
 
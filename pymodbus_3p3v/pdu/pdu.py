@@ -10,10 +10,23 @@ from pymodbus_3p3v.logging import Log
 
 
 class ModbusPDU:
-    """Base class for all Modbus messages."""
+    """Base class for all Modbus messages.
+
+    Messages use __slots__ (no instance __dict__), subclasses should
+    declare ``__slots__`` with the attributes they add, otherwise the
+    instances get a __dict__ as usual.
+
+    inline_safe is True for requests whose update_datastore() only awaits
+    the slave context (the library requests), a server with direct_dispatch
+    executes those without a task when the slave context is synchronous.
+    A subclass awaiting anything else in update_datastore() must set it False.
+    """
+
+    __slots__ = ("_payload", "bits", "fut", "registers", "request", "skip_encode", "slave_id", "transaction_id")
 
     function_code: int = 0
     sub_function_code: int = -1
+    inline_safe: bool = False
     _rtu_frame_size: int = 0
     _rtu_byte_count_pos: int = 0
 
@@ -25,6 +38,8 @@ class ModbusPDU:
         self.bits: list[bool]
         self.registers: list[int]
         self.fut: asyncio.Future
+        self.request: ModbusPDU
+        self._payload: memoryview | None = None
 
     def setData(self, slave: int, transaction: int, skip_encode: bool) -> None:
         """Set data common for all PDU."""
@@ -54,6 +69,26 @@ class ModbusPDU:
     def decode(self, data: bytes) -> None:
         """Decode data part of the message."""
 
+    def decode_lazy(self, data: memoryview) -> None:
+        """Decode data part of the message, keeping data as raw_payload.
+
+        Responses with values (registers/bits) only check the header,
+        the values are decoded on first access, other messages are
+        decoded now.
+        """
+        self.decode(data.tobytes())
+        self._payload = data
+
+    @property
+    def raw_payload(self) -> memoryview:
+        """Return data part of the message.
+
+        Zero copy view of the received data if decoded with decode_lazy()
+        (and the values are not replaced), otherwise encoded.
+        """
+        if self._payload is None:
+            return memoryview(self.encode())
+        return self._payload
 
     @classmethod
     def calculateRtuFrameSize(cls, data: bytes) -> int:
@@ -97,6 +132,8 @@ class ModbusExceptions:  # pylint: disable=too-few-public-methods
 class ExceptionResponse(ModbusPDU):
     """Base class for a modbus exception PDU."""
 
+    __slots__ = ("exception_code", "function_code")
+
     _rtu_frame_size = 5
 
     def __init__(
@@ -7,11 +7,14 @@ import struct
 from pymodbus_3p3v.exceptions import ModbusIOException
 from pymodbus_3p3v.pdu.pdu import ExceptionResponse, ModbusPDU
 from pymodbus_3p3v.pdu.pdu import ModbusExceptions as merror
+from pymodbus_3p3v.utilities import pack_registers, unpack_registers
 
 
 class ReadRegistersRequestBase(ModbusPDU):
     """Base class for reading a modbus register."""
 
+    __slots__ = ("address", "count")
+
     _rtu_frame_size = 8
 
     def __init__(self, address, count, slave=1, transaction=0, skip_encode=False):
@@ -61,6 +64,8 @@ class ReadRegistersResponseBase(ModbusPDU):
     The requested registers can be found in the .registers list.
     """
 
+    __slots__ = ("_registers",)
+
     _rtu_byte_count_pos = 2
 
     def __init__(self, values, slave=1, transaction=0, skip_encode=False):
@@ -75,27 +80,50 @@ class ReadRegistersResponseBase(ModbusPDU):
         #: A list of register values
         self.registers = values or []
 
+    @property
+    def registers(self) -> list[int]:
+        """Return register values (decoded on first access after decode_lazy())."""
+        if self._registers is None:
+            self._registers = unpack_registers(self._payload, 1)  # type: ignore[arg-type]
+        return self._registers
+
+    @registers.setter
+    def registers(self, values: list[int]) -> None:
+        """Set register values."""
+        self._registers = values
+        self._payload = None
+
     def encode(self):
         """Encode the response packet.
 
         :returns: The encoded packet
         """
-        result = struct.pack(">B", len(self.registers) * 2)
-        for register in self.registers:
-            result += struct.pack(">H", register)
-        return result
+        if self._registers is None:
+            return bytes(self._payload)  # type: ignore[arg-type]
+        return struct.pack(">B", len(self._registers) * 2) + pack_registers(self._registers)
+
+    def _check_byte_count(self, data) -> int:
+        """Return byte count of data (raise if invalid)."""
+        byte_count = int(data[0])
+        if byte_count < 2 or byte_count > 252 or byte_count % 2 == 1 or byte_count != len(data) - 1:  # pragma: no cover
+            raise ModbusIOException(f"Invalid response {data} has byte count of {byte_count}")  # pragma: no cover
+        return byte_count
 
     def decode(self, data):
         """Decode a register response packet.
 
         :param data: The request to decode
         """
-        byte_count = int(data[0])
-        if byte_count < 2 or byte_count > 252 or byte_count % 2 == 1 or byte_count != len(data) - 1:  # pragma: no cover
-            raise ModbusIOException(f"Invalid response {data} has byte count of {byte_count}")  # pragma: no cover
-        self.registers = []
-        for i in range(1, byte_count + 1, 2):
-            self.registers.append(struct.unpack(">H", data[i : i + 2])[0])
+        self.registers = unpack_registers(data, 1, self._check_byte_count(data) // 2)
+
+    def decode_lazy(self, data):
+        """Check a register response packet, registers are decoded on first access.
+
+        :param data: The request to decode
+        """
+        self._check_byte_count(data)
+        self._registers = None
+        self._payload = data
 
     def getRegister(self, index):
         """Get the requested register.
@@ -123,7 +151,10 @@ class ReadHoldingRegistersRequest(ReadRegistersRequestBase):
     1-16 are addressed as 0-15.
     """
 
+    __slots__ = ()
+
     function_code = 3
+    inline_safe = True
     function_code_name = "read_holding_registers"
 
     def __init__(self, address=None, count=None, slave=1, transaction=0, skip_encode=0):
@@ -165,6 +196,8 @@ class ReadHoldingRegistersResponse(ReadRegistersResponseBase):
     The requested registers can be found in the .registers list.
     """
 
+    __slots__ = ()
+
     function_code = 3
 
     def __init__(self, values=None, slave=None, transaction=0, skip_encode=0):
@@ -185,7 +218,10 @@ class ReadInputRegistersRequest(ReadRegistersRequestBase):
     numbered 1-16 are addressed as 0-15.
     """
 
+    __slots__ = ()
+
     function_code = 4
+    inline_safe = True
     function_code_name = "read_input_registers"
 
     def __init__(self, address=None, count=None, slave=1, transaction=0, skip_encode=0):
@@ -227,6 +263,8 @@ class ReadInputRegistersResponse(ReadRegistersResponseBase):
     The requested registers can be found in the .registers list.
     """
 
+    __slots__ = ()
+
     function_code = 4
 
     def __init__(self, values=None, slave=None, transaction=0, skip_encode=0):
@@ -253,7 +291,17 @@ class ReadWriteMultipleRegistersRequest(ModbusPDU):
     number of bytes to follow in the write data field."
     """
 
+    __slots__ = (
+        "read_address",
+        "read_count",
+        "write_address",
+        "write_byte_count",
+        "write_count",
+        "write_registers",
+    )
+
     function_code = 23
+    inline_safe = True
     function_code_name = "read_write_multiple_registers"
     _rtu_byte_count_pos = 10
 
@@ -281,17 +329,14 @@ class ReadWriteMultipleRegistersRequest(ModbusPDU):
 
         :returns: The encoded packet
         """
-        result = struct.pack(
+        return struct.pack(
             ">HHHHB",
             self.read_address,
             self.read_count,
             self.write_address,
             self.write_count,
             self.write_byte_count,
-        )
-        for register in self.write_registers:
-            result += struct.pack(">H", register)
-        return result
+        ) + pack_registers(self.write_registers)
 
     def decode(self, data):
         """Decode the register request packet.
@@ -305,10 +350,7 @@ class ReadWriteMultipleRegistersRequest(ModbusPDU):
             self.write_count,
             self.write_byte_count,
         ) = struct.unpack(">HHHHB", data[:9])
-        self.write_registers = []
-        for i in range(9, self.write_byte_count + 9, 2):
-            register = struct.unpack(">H", data[i : i + 2])[0]
-            self.write_registers.append(register)
+        self.write_registers = unpack_registers(data, 9, self.write_byte_count // 2)
 
     async def update_datastore(self, context):  # pragma: no cover
         """Run a write single register request against a datastore.
@@ -373,4 +415,6 @@ class ReadWriteMultipleRegistersResponse(ReadHoldingRegistersResponse):
     The requested registers can be found in the .registers list.
     """
 
+    __slots__ = ()
+
     function_code = 23
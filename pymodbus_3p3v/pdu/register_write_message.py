@@ -6,6 +6,7 @@ import struct
 
 from pymodbus_3p3v.pdu.pdu import ModbusExceptions as merror
 from pymodbus_3p3v.pdu.pdu import ModbusPDU
+from pymodbus_3p3v.utilities import pack_registers, unpack_registers
 
 
 class WriteSingleRegisterRequest(ModbusPDU):
@@ -16,7 +17,10 @@ class WriteSingleRegisterRequest(ModbusPDU):
     numbered 1 is addressed as 0.
     """
 
+    __slots__ = ("address", "value")
+
     function_code = 6
+    inline_safe = True
     function_code_name = "write_register"
     _rtu_frame_size = 8
 
@@ -89,6 +93,8 @@ class WriteSingleRegisterResponse(ModbusPDU):
     Returned after the register contents have been written.
     """
 
+    __slots__ = ("address", "value")
+
     function_code = 6
     _rtu_frame_size = 8
 
@@ -149,7 +155,10 @@ class WriteMultipleRegistersRequest(ModbusPDU):
     Data is packed as two bytes per register.
     """
 
+    __slots__ = ("address", "byte_count", "count", "values")
+
     function_code = 16
+    inline_safe = True
     function_code_name = "write_registers"
     _rtu_byte_count_pos = 6
     _pdu_length = 5  # func + adress1 + adress2 + outputQuant1 + outputQuant2
@@ -180,13 +189,13 @@ class WriteMultipleRegistersRequest(ModbusPDU):
         if self.skip_encode:  # pragma: no cover
             return packet + b"".join(self.values)  # pragma: no cover
 
-        for value in self.values:
-            if isinstance(value, bytes):  # pragma: no cover
-                packet += value  # pragma: no cover
-            else:
-                packet += struct.pack(">H", value)
-
-        return packet
+        try:
+            return packet + pack_registers(self.values)
+        except struct.error:  # pragma: no cover
+            # values (partly) encoded as bytes
+            return packet + b"".join(  # pragma: no cover
+                value if isinstance(value, bytes) else struct.pack(">H", value) for value in self.values
+            )
 
     def decode(self, data):
         """Decode a write single register packet packet request.
@@ -194,9 +203,7 @@ class WriteMultipleRegistersRequest(ModbusPDU):
         :param data: The request to decode
         """
         self.address, self.count, self.byte_count = struct.unpack(">HHB", data[:5])
-        self.values = []  # reset
-        for idx in range(5, (self.count * 2) + 5, 2):
-            self.values.append(struct.unpack(">H", data[idx : idx + 2])[0])
+        self.values = unpack_registers(data, 5, self.count)
 
     async def update_datastore(self, context):  # pragma: no cover
         """Run a write single register request against a datastore.
@@ -242,6 +249,8 @@ class WriteMultipleRegistersResponse(ModbusPDU):
     Starting address, and quantity of registers written.
     """
 
+    __slots__ = ("address", "count")
+
     function_code = 16
     _rtu_frame_size = 8
 
@@ -290,7 +299,10 @@ class MaskWriteRegisterRequest(ModbusPDU):
     The function can be used to set or clear individual bits in the register.
     """
 
+    __slots__ = ("address", "and_mask", "or_mask")
+
     function_code = 0x16
+    inline_safe = True
     function_code_name = "mask_write_register"
     _rtu_frame_size = 10
 
@@ -347,6 +359,8 @@ class MaskWriteRegisterResponse(ModbusPDU):
     The response is returned after the register has been written.
     """
 
+    __slots__ = ("address", "and_mask", "or_mask")
+
     function_code = 0x16
     _rtu_frame_size = 10
 
@@ -4,7 +4,11 @@ import external classes, to make them easier to use:
 """
 
 __all__ = [
+    "GatewayLink",
+    "GatewayMetrics",
     "get_simulator_commandline",
+    "ModbusGateway",
+    "ModbusMultiProcessTcpServer",
     "ModbusSerialServer",
     "ModbusSimulatorServer",
     "ModbusTcpServer",
@@ -12,6 +16,7 @@ __all__ = [
     "ModbusUdpServer",
     "ServerAsyncStop",
     "ServerStop",
+    "StartAsyncMultiProcessTcpServer",
     "StartAsyncSerialServer",
     "StartAsyncTcpServer",
     "StartAsyncTlsServer",
@@ -38,5 +43,14 @@ from pymodbus_3p3v.server.async_io import (
     StartTlsServer,
     StartUdpServer,
 )
+from pymodbus_3p3v.server.gateway import (
+    GatewayLink,
+    GatewayMetrics,
+    ModbusGateway,
+)
+from pymodbus_3p3v.server.multiprocess import (
+    ModbusMultiProcessTcpServer,
+    StartAsyncMultiProcessTcpServer,
+)
 from pymodbus_3p3v.server.simulator.http_server import ModbusSimulatorServer
 from pymodbus_3p3v.server.simulator.main import get_commandline as get_simulator_commandline
@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import os
 import traceback
 from contextlib import suppress
 from enum import Enum
 
-from pymodbus_3p3v.datastore import ModbusServerContext
+from pymodbus_3p3v.datastore import ModbusBaseSlaveContext, ModbusServerContext
 from pymodbus_3p3v.device import ModbusControlBlock, ModbusDeviceIdentification
 from pymodbus_3p3v.exceptions import ModbusException, NoSuchSlaveException
 from pymodbus_3p3v.framer import FRAMER_NAME_TO_CLASS, FramerBase, FramerType
@@ -24,6 +25,51 @@ from pymodbus_3p3v.transport import CommParams, CommType, ModbusProtocol
 # --------------------------------------------------------------------------- #
 
 
+@functools.cache
+def _is_sync_context(slave_class: type) -> bool:
+    """Return True if the slave context class has synchronous getValues/setValues."""
+    return (
+        getattr(slave_class, "async_getValues", None) is ModbusBaseSlaveContext.async_getValues
+        and getattr(slave_class, "async_setValues", None) is ModbusBaseSlaveContext.async_setValues
+    )
+
+
+@functools.cache
+def _is_gateway(context_class: type) -> bool:
+    """Return True if the server context is a ModbusGateway."""
+    from pymodbus_3p3v.server.gateway import (  # noqa: PLC0415 # pylint: disable=import-outside-toplevel
+        ModbusGateway,
+    )
+
+    return issubclass(context_class, ModbusGateway)
+
+
+class _Resume:
+    """Awaitable finishing a coroutine that suspended in its first step."""
+
+    def __init__(self, coro, yielded):
+        """Initialize."""
+        self.coro = coro
+        self.yielded = yielded
+
+    def __await__(self):
+        """Pass what the coroutine yields to the task, and the results back."""
+        yielded = self.yielded
+        while True:
+            try:
+                sent = yield yielded
+            except BaseException as exc:  # pylint: disable=broad-except
+                try:
+                    yielded = self.coro.throw(exc)
+                except StopIteration as stop:
+                    return stop.value
+            else:
+                try:
+                    yielded = self.coro.send(sent)
+                except StopIteration as stop:
+                    return stop.value
+
+
 class ModbusServerRequestHandler(ModbusProtocol):
     """Implements modbus slave wire protocol.
 
@@ -32,6 +78,12 @@ class ModbusServerRequestHandler(ModbusProtocol):
     When a connection is established, a callback is called.
     This callback will setup the connection and
     create and schedule an asyncio.Task and assign it to running_task.
+
+    With server.direct_dispatch, received data is decoded (in the receive
+    buffer) and executed directly in callback_data (no queue and no handler
+    task). Only requests to a synchronous datastore are executed inline,
+    requests to an async datastore (e.g. AsyncRemoteSlaveContext) or a
+    gateway are executed in a task, like without direct_dispatch.
     """
 
     def __init__(self, owner):
@@ -50,6 +102,7 @@ class ModbusServerRequestHandler(ModbusProtocol):
         self.running = False
         self.receive_queue: asyncio.Queue = asyncio.Queue()
         self.handler_task = None  # coroutine to be run on asyncio loop
+        self.execute_tasks: set[asyncio.Future] = set()
         self.databuffer = b''
         self.framer: FramerBase
         self.loop = asyncio.get_running_loop()
@@ -76,8 +129,9 @@ class ModbusServerRequestHandler(ModbusProtocol):
             self.framer = self.server.framer(self.server.decoder)
 
             # schedule the connection handler on the event loop
-            self.handler_task = asyncio.create_task(self.handle())
-            self.handler_task.set_name("server connection handler")
+            if not self.server.direct_dispatch:
+                self.handler_task = asyncio.create_task(self.handle())
+                self.handler_task.set_name("server connection handler")
             
             # Call connected callback
             self.server.callback_connected()
@@ -95,6 +149,8 @@ class ModbusServerRequestHandler(ModbusProtocol):
         try:
             if self.handler_task:
                 self.handler_task.cancel()
+            for task in self.execute_tasks:
+                task.cancel()
             if call_exc is None:
                 self._log_exception()
             else:
@@ -120,29 +176,59 @@ class ModbusServerRequestHandler(ModbusProtocol):
         """Handle handler."""
         # this is an asyncio.Queue await, it will never fail
         data = await self._recv_()
+        if data is None:
+            self.process_recv_buffer()
+            return
         if isinstance(data, tuple):
             # addr is populated when talking over UDP
             data, *addr = data
         else:
             addr = [None]
 
+        self.process_data(data, *addr)
+
+    def process_data(self, data, *addr):
+        """Decode and execute received data."""
         # if broadcast is enabled make sure to
         # process requests to address 0
         self.databuffer += data
-        Log.debug("Handling data: {}", self.databuffer, ":hex")
-        try:
-            used_len, pdu = self.framer.processIncomingFrame(self.databuffer)
-        except ModbusException:
-            pdu = ExceptionResponse(
-                40,
-                exception_code=merror.IllegalFunction
-            )
-            self.server_send(pdu, 0)
-            pdu = None
-            used_len = len(self.databuffer)
+        if Log.debug_enabled:
+            Log.debug("Handling data: {}", self.databuffer, ":hex")
+        used_len = self.process_frames(self.databuffer, *addr)
         self.databuffer = self.databuffer[used_len:]
-        if pdu:
-           self.execute(pdu, *addr)
+
+    def process_recv_buffer(self):
+        """Decode and execute the frames waiting in the receive buffer.
+
+        Only the frames are copied, the incomplete rest stays in the buffer.
+        """
+        if Log.debug_enabled:
+            Log.debug("Handling data: {}", self.recv_buffer, ":hex")
+        used_len = self.process_frames(self.recv_buffer, None)
+        del self.recv_buffer[:used_len]
+
+    def process_frames(self, data, *addr) -> int:
+        """Decode and execute the complete frames in data, return length used."""
+        used_len = 0
+        with memoryview(data) as view:
+            while True:
+                # the requests before a bad frame are returned first,
+                # the next pass raises for the bad frame.
+                try:
+                    with view[used_len:] as rest:
+                        data_len, pdus = self.framer.processIncomingFrames(rest)
+                except ModbusException:
+                    pdu = ExceptionResponse(
+                        40,
+                        exception_code=merror.IllegalFunction
+                    )
+                    self.server_send(pdu, 0)
+                    return len(data)
+                used_len += data_len
+                for pdu in pdus:
+                   self.execute(pdu, *addr)
+                if not pdus or used_len == len(data):
+                    return used_len
 
     async def handle(self) -> None:
         """Coroutine which represents a single master <=> slave conversation.
@@ -187,12 +273,57 @@ class ModbusServerRequestHandler(ModbusProtocol):
         if self.server.request_tracer:
             self.server.request_tracer(request, *addr)
 
-        asyncio.run_coroutine_threadsafe(self._async_execute(request, *addr), self.loop)
+        coro = self._async_execute(request, *addr)
+        if not (self.server.direct_dispatch and self._is_inline(request)):
+            self._add_execute_task(coro)
+            return
+
+        # synchronous datastore, normally completes without suspending,
+        # if it suspends anyway it is finished in a task.
+        try:
+            yielded = coro.send(None)
+        except StopIteration:
+            return
+        Log.warning("{} suspended in direct dispatch, continued in a task", type(request).__name__)
+        self._add_execute_task(self._finish(coro, yielded))
+
+    @staticmethod
+    async def _finish(coro, yielded):
+        """Finish coroutine started inline."""
+        await _Resume(coro, yielded)
+
+    def _is_inline(self, request) -> bool:
+        """Return True if request can execute without a task.
+
+        That is an inline_safe request to a synchronous slave context (one not
+        overriding async_getValues/async_setValues), anything that might
+        suspend must run in a task (e.g. asyncio.timeout needs a task).
+        """
+        context = self.server.context
+        if not request.inline_safe or _is_gateway(type(context)):
+            return False
+        try:
+            if self.server.broadcast_enable and not request.slave_id:
+                slaves = [context[slave_id] for slave_id in context.slaves()]
+            else:
+                slaves = [context[request.slave_id]]
+        except NoSuchSlaveException:
+            return True
+        return all(_is_sync_context(type(slave)) for slave in slaves)
+
+    def _add_execute_task(self, awaitable):
+        """Run execute in a task (and keep a reference until done)."""
+        task = asyncio.ensure_future(awaitable)
+        self.execute_tasks.add(task)
+        task.add_done_callback(self.execute_tasks.discard)
 
     async def _async_execute(self, request, *addr):
         broadcast = False
         try:
-            if self.server.broadcast_enable and not request.slave_id:
+            if _is_gateway(type(self.server.context)):
+                broadcast = self.server.broadcast_enable and not request.slave_id
+                response = await self.server.context.forward(request, self, broadcast)
+            elif self.server.broadcast_enable and not request.slave_id:
                 broadcast = True
                 # if broadcasting then execute on all slave contexts,
                 # note response will be ignored
@@ -205,6 +336,7 @@ class ModbusServerRequestHandler(ModbusProtocol):
         except NoSuchSlaveException:
             Log.error("requested slave does not exist: {}", request.slave_id)
             if self.server.ignore_missing_slaves:
+                self._release(request)
                 return  # the client will simply timeout waiting for a response
             response = request.doException(merror.GatewayNoResponse)
         except Exception as exc:  # pylint: disable=broad-except
@@ -222,6 +354,16 @@ class ModbusServerRequestHandler(ModbusProtocol):
             if self.server.response_manipulator:
                 response, skip_encoding = self.server.response_manipulator(response)
             self.server_send(response, *addr, skip_encoding=skip_encoding)
+        self._release(request)
+
+    def _release(self, request):
+        """Hand answered request back to the decoder pool (pool_size > 0).
+
+        Requests forwarded by a gateway, and requests seen by a request_tracer
+        (which may keep them), are not reused.
+        """
+        if not (self.server.request_tracer or _is_gateway(type(self.server.context))):
+            self.server.decoder.release(request)
 
     def server_send(self, message, addr, **kwargs):
         """Send message."""
@@ -243,7 +385,33 @@ class ModbusServerRequestHandler(ModbusProtocol):
         return result
 
     def callback_data(self, data: bytes, addr: tuple | None = ()) -> int:
-        """Handle received data."""
+        """Handle received data.
+
+        With direct_dispatch the frames are decoded in the receive buffer,
+        and the incomplete rest is left in the buffer. Otherwise stream data
+        is also left in the receive buffer and the handler task is woken up
+        to decode it there, datagrams are copied to the handler task with
+        their address.
+        """
+        if self.server.direct_dispatch:
+            if Log.debug_enabled:
+                Log.debug("Handling data: {}", data, ":hex")
+            try:
+                return self.process_frames(data, addr if addr != () else None)
+            except Exception as exc:  # pylint: disable=broad-except
+                Log.error(
+                    'Unknown exception "{}" on stream {} forcing disconnect',
+                    exc,
+                    self.comm_params.comm_name,
+                )
+                self.close()
+                self.callback_disconnected(exc)
+                return len(data)
+        if addr is None:
+            if self.receive_queue.empty():
+                self.receive_queue.put_nowait(None)
+            return 0
+        data = bytes(data)
         if addr != ():
             self.receive_queue.put_nowait((data, addr))
         else:
@@ -269,6 +437,8 @@ class ModbusBaseServer(ModbusProtocol):
         request_tracer,
         identity,
         framer,
+        direct_dispatch=False,
+        pool_size=0,
     ) -> None:
         """Initialize base server."""
         super().__init__(
@@ -276,7 +446,7 @@ class ModbusBaseServer(ModbusProtocol):
             True,
         )
         self.loop = asyncio.get_running_loop()
-        self.decoder = DecodePDU(True)
+        self.decoder = DecodePDU(True, pool_size=pool_size)
         self.context = context or ModbusServerContext()
         self.control = ModbusControlBlock()
         self.ignore_missing_slaves = ignore_missing_slaves
@@ -284,6 +454,7 @@ class ModbusBaseServer(ModbusProtocol):
         self.response_manipulator = response_manipulator
         self.request_tracer = request_tracer
         self.handle_local_echo = False
+        self.direct_dispatch = direct_dispatch
         if isinstance(identity, ModbusDeviceIdentification):
             self.control.Identity.update(identity)
 
@@ -379,6 +550,9 @@ class ModbusTcpServer(ModbusBaseServer):
         broadcast_enable=False,
         response_manipulator=None,
         request_tracer=None,
+        direct_dispatch=False,
+        reuse_port=False,
+        pool_size=0,
     ):
         """Initialize the socket server.
 
@@ -396,6 +570,13 @@ class ModbusTcpServer(ModbusBaseServer):
         :param response_manipulator: Callback method for manipulating the
                                         response
         :param request_tracer: Callback method for tracing
+        :param direct_dispatch: True to decode and execute requests directly
+                        when received (no queue/handler task pr. connection)
+        :param reuse_port: True to set SO_REUSEPORT on the listening socket,
+                        allowing several processes to share the port
+        :param pool_size: Number of free request objects kept pr. request type
+                        for reuse (0 no reuse), requests are not reused while
+                        a request_tracer is set (the tracer may keep them)
         """
         params = getattr(
             self,
@@ -409,6 +590,7 @@ class ModbusTcpServer(ModbusBaseServer):
             ),
         )
         params.source_address = address
+        params.reuse_port = reuse_port
         super().__init__(
             params,
             context,
@@ -418,6 +600,8 @@ class ModbusTcpServer(ModbusBaseServer):
             request_tracer,
             identity,
             framer,
+            direct_dispatch,
+            pool_size,
         )
 
 
@@ -443,6 +627,8 @@ class ModbusTlsServer(ModbusTcpServer):
         broadcast_enable=False,
         response_manipulator=None,
         request_tracer=None,
+        direct_dispatch=False,
+        pool_size=0,
     ):
         """Overloaded initializer for the socket server.
 
@@ -464,6 +650,12 @@ class ModbusTlsServer(ModbusTcpServer):
                         False to treat 0 as any other slave_id
         :param response_manipulator: Callback method for
                         manipulating the response
+        :param request_tracer: Callback method for tracing
+        :param direct_dispatch: True to decode and execute requests directly
+                        when received (no queue/handler task pr. connection)
+        :param pool_size: Number of free request objects kept pr. request type
+                        for reuse (0 no reuse), requests are not reused while
+                        a request_tracer is set (the tracer may keep them)
         """
         self.tls_setup = CommParams(
             comm_type=CommType.TLS,
@@ -484,6 +676,8 @@ class ModbusTlsServer(ModbusTcpServer):
             broadcast_enable=broadcast_enable,
             response_manipulator=response_manipulator,
             request_tracer=request_tracer,
+            direct_dispatch=direct_dispatch,
+            pool_size=pool_size,
         )
 
 
@@ -505,6 +699,8 @@ class ModbusUdpServer(ModbusBaseServer):
         broadcast_enable=False,
         response_manipulator=None,
         request_tracer=None,
+        direct_dispatch=False,
+        pool_size=0,
     ):
         """Overloaded initializer for the socket server.
 
@@ -522,6 +718,11 @@ class ModbusUdpServer(ModbusBaseServer):
         :param response_manipulator: Callback method for
                             manipulating the response
         :param request_tracer: Callback method for tracing
+        :param direct_dispatch: True to decode and execute requests directly
+                            when received (no queue/handler task pr. connection)
+        :param pool_size: Number of free request objects kept pr. request type
+                            for reuse (0 no reuse), requests are not reused while
+                            a request_tracer is set (the tracer may keep them)
         """
         # ----------------
         super().__init__(
@@ -540,6 +741,8 @@ class ModbusUdpServer(ModbusBaseServer):
             request_tracer,
             identity,
             framer,
+            direct_dispatch,
+            pool_size,
         )
 
 
@@ -576,6 +779,11 @@ class ModbusSerialServer(ModbusBaseServer):
         :param response_manipulator: Callback method for
                     manipulating the response
         :param request_tracer: Callback method for tracing
+        :param direct_dispatch: True to decode and execute requests directly
+                    when received (no queue/handler task)
+        :param pool_size: Number of free request objects kept pr. request type
+                    for reuse (0 no reuse), requests are not reused while
+                    a request_tracer is set (the tracer may keep them)
         """
         super().__init__(
             params=CommParams(
@@ -597,6 +805,8 @@ class ModbusSerialServer(ModbusBaseServer):
             request_tracer=kwargs.get("request_tracer", None),
             identity=kwargs.get("identity", None),
             framer=framer,
+            direct_dispatch=kwargs.get("direct_dispatch", False),
+            pool_size=kwargs.get("pool_size", 0),
         )
         self.handle_local_echo = kwargs.get("handle_local_echo", False)
 
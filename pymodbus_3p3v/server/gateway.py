@@ -0,0 +1,312 @@
+"""Modbus gateway (proxy).
+
+A gateway serves upstream clients (any server type), and forwards each
+request to a downstream device, selected by the slave id of the request.
+
+:class:`ModbusGateway` is used instead of a ModbusServerContext, it routes
+slave ids to :class:`GatewayLink` objects. A link is a pool of async
+clients connected to the same device (or serial bus), requests from the
+upstream connections are queued pr. connection and served round robin
+(fair queue), so one busy upstream client cannot starve the others.
+
+Requests are forwarded as decoded PDUs, the upstream and downstream framers
+are independent, e.g. a tcp server (socket framer) in front of a serial
+client (rtu framer) is a TCP to RTU gateway.
+
+A link owns its clients: it connects and closes them, and (unless
+lazy=False) switches the decoder of the clients to lazy mode (DecodePDU
+lazy mode), register/bit values are not decoded, the received payload is
+framed again as is. Use clients dedicated to the link, a client shared with
+application code would return lazily decoded responses to that code too::
+
+    bus = GatewayLink([AsyncModbusSerialClient("/dev/ttyUSB0", framer=FramerType.RTU)])
+    plc = GatewayLink([AsyncModbusTcpClient("plc", max_in_flight=4), AsyncModbusTcpClient("plc")])
+    gateway = ModbusGateway({1: bus, 2: bus, 10: plc})
+    async with gateway:
+        await StartAsyncTcpServer(context=gateway, address=("", 502))
+
+Each link keeps :class:`GatewayMetrics` (queue depth, latency...),
+available with ``gateway.metrics()``.
+
+Downstream errors are returned upstream as exception responses,
+GatewayPathUnavailable when the client is not connected and
+GatewayNoResponse when the device does not respond.
+"""
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import time
+from collections import deque
+from collections.abc import Hashable
+
+from pymodbus_3p3v.client.base import ModbusBaseClient
+from pymodbus_3p3v.exceptions import (
+    ConnectionException,
+    ModbusException,
+    NoSuchSlaveException,
+    ParameterException,
+)
+from pymodbus_3p3v.logging import Log
+from pymodbus_3p3v.pdu import ModbusExceptions as merror
+from pymodbus_3p3v.pdu import ModbusPDU
+
+
+@dataclasses.dataclass
+class GatewayMetrics:  # pylint: disable=too-many-instance-attributes
+    """Metrics of a downstream link.
+
+    :param requests: Number of requests forwarded
+    :param errors: Number of requests answered with a gateway exception
+    :param queue_depth: Number of requests waiting to be forwarded
+    :param max_queue_depth: Highest queue_depth seen
+    :param in_flight: Number of requests waiting for the downstream response
+    :param latency_total: Sum of latencies (queued to answered) in seconds
+    :param latency_max: Highest latency in seconds
+    :param wait_total: Sum of time spent in the queue in seconds
+    """
+
+    requests: int = 0
+    errors: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    in_flight: int = 0
+    latency_total: float = 0.0
+    latency_max: float = 0.0
+    wait_total: float = 0.0
+
+    @property
+    def latency_avg(self) -> float:
+        """Return average latency in seconds."""
+        return self.latency_total / self.requests if self.requests else 0.0
+
+    @property
+    def wait_avg(self) -> float:
+        """Return average time spent in the queue in seconds."""
+        return self.wait_total / self.requests if self.requests else 0.0
+
+
+class GatewayLink:
+    """Downstream link, a pool of async clients connected to the same device/bus.
+
+    :param clients: Async clients, each client forwards up to client.max_in_flight requests at a time
+    :param name: Name used in metrics, default str() of the first client
+    :param lazy: True to switch the decoder of the clients to lazy mode, False to leave the clients unchanged
+    :raises ParameterException: no clients
+
+    The clients must be dedicated to the link, the link connects and closes
+    them, and changes their decoder (lazy=True).
+
+    A serial bus allows only one request at a time, use a single client
+    (max_in_flight=1) for serial links.
+    """
+
+    def __init__(self, clients: list[ModbusBaseClient], name: str | None = None, lazy: bool = True) -> None:
+        """Initialize link."""
+        if not clients:
+            raise ParameterException("GatewayLink needs at least one client")
+        self.clients = clients
+        for client in clients:
+            if lazy and (ctx := getattr(client, "ctx", None)) is not None:
+                ctx.framer.decoder.lazy = True
+        self.name = name or str(clients[0])
+        self.metrics = GatewayMetrics()
+        self._queues: dict[Hashable, deque[tuple[ModbusPDU, bool, asyncio.Future, float]]] = {}
+        self._pending: asyncio.Semaphore | None = None
+        self._workers: list[asyncio.Task] = []
+
+    async def connect(self) -> bool:
+        """Connect all clients.
+
+        :returns: True if all clients are connected
+        """
+        results = [await client.connect() for client in self.clients]
+        return all(results)
+
+    def close(self) -> None:
+        """Stop forwarding, close clients and fail queued requests."""
+        for task in self._workers:
+            task.cancel()
+        self._workers = []
+        self._pending = None
+        for queue in self._queues.values():
+            for _, _, future, _ in queue:
+                if not future.done():
+                    future.set_exception(ConnectionException(f"gateway link {self.name} closed"))
+        self._queues.clear()
+        self.metrics.queue_depth = 0
+        for client in self.clients:
+            client.close()
+
+    def _start_workers(self) -> None:
+        """Start one worker pr. request a client can have in flight."""
+        self._pending = asyncio.Semaphore(0)
+        for client in self.clients:
+            for _ in range(getattr(client, "max_in_flight", 1)):
+                task = asyncio.create_task(self._worker(client))
+                task.set_name(f"gateway worker {self.name}")
+                self._workers.append(task)
+
+    async def forward(self, request: ModbusPDU, upstream: Hashable, no_response_expected: bool = False) -> ModbusPDU | None:
+        """Queue request and wait for the downstream response.
+
+        :param request: Decoded request (transaction_id is preserved)
+        :param upstream: Key of the upstream connection (requests are served round robin pr. key)
+        :param no_response_expected: True to not wait for a response (broadcast)
+        :returns: Response or gateway exception response (None if no_response_expected)
+        """
+        if self._pending is None:
+            self._start_workers()
+        future = asyncio.get_running_loop().create_future()
+        self._queues.setdefault(upstream, deque()).append(
+            (request, no_response_expected, future, time.monotonic())
+        )
+        self.metrics.queue_depth += 1
+        self.metrics.max_queue_depth = max(self.metrics.max_queue_depth, self.metrics.queue_depth)
+        self._pending.release()  # type: ignore[union-attr]
+        return await future
+
+    def _next_request(self) -> tuple[ModbusPDU, bool, asyncio.Future, float]:
+        """Return next request, round robin between the upstream connections."""
+        upstream, queue = next(iter(self._queues.items()))
+        item = queue.popleft()
+        del self._queues[upstream]
+        if queue:
+            self._queues[upstream] = queue  # move to the end
+        self.metrics.queue_depth -= 1
+        return item
+
+    async def _worker(self, client: ModbusBaseClient) -> None:
+        """Forward requests with client."""
+        while True:
+            await self._pending.acquire()  # type: ignore[union-attr]
+            request, no_response_expected, future, queued = self._next_request()
+            if future.done():
+                continue  # upstream connection is gone
+            started = time.monotonic()
+            self.metrics.in_flight += 1
+            transaction_id = request.transaction_id
+            try:
+                response, error = await self._execute(client, request, no_response_expected)
+            except asyncio.CancelledError:
+                if not future.done():
+                    future.set_exception(ConnectionException(f"gateway link {self.name} closed"))
+                raise
+            finally:
+                request.transaction_id = transaction_id
+                self.metrics.in_flight -= 1
+            if error:
+                self.metrics.errors += 1
+                response = request.doException(error)
+            now = time.monotonic()
+            self.metrics.requests += 1
+            self.metrics.wait_total += started - queued
+            self.metrics.latency_total += now - queued
+            self.metrics.latency_max = max(self.metrics.latency_max, now - queued)
+            if not future.done():
+                future.set_result(response)
+
+    async def _execute(
+        self, client: ModbusBaseClient, request: ModbusPDU, no_response_expected: bool
+    ) -> tuple[ModbusPDU | None, int | None]:
+        """Send request downstream, return (response, gateway exception code or None)."""
+        try:
+            response = await client.execute(no_response_expected, request)
+        except ConnectionException as exc:
+            Log.error("gateway link {} not connected: {}", self.name, exc)
+            return None, merror.GatewayPathUnavailable
+        except ModbusException as exc:
+            Log.error("gateway link {} failed: {}", self.name, exc)
+            return None, merror.GatewayNoResponse
+        except Exception as exc:  # pylint: disable=broad-except
+            # keep the worker alive, the link must continue serving.
+            Log.error("gateway link {} unexpected error: {}", self.name, exc)
+            return None, merror.GatewayNoResponse
+        if response is not None and response.isError() and not response.exception_code:
+            return response, merror.GatewayNoResponse  # no response after retries
+        return response, None
+
+
+class ModbusGateway:
+    """Route requests to downstream links by slave id (used as server context).
+
+    :param routes: slave id -> link, several slave ids may share a link (e.g. a serial bus)
+    :param default: Link for slave ids not in routes, None to answer with GatewayNoResponse
+    """
+
+    def __init__(self, routes: dict[int, GatewayLink], default: GatewayLink | None = None) -> None:
+        """Initialize gateway."""
+        self.routes = routes
+        self.default = default
+
+    def __iter__(self):
+        """Iterate over (slave id, link)."""
+        return iter(self.routes.items())
+
+    def __contains__(self, slave):
+        """Check if the slave is routed."""
+        return self.default is not None or slave in self.routes
+
+    def __getitem__(self, slave) -> GatewayLink:
+        """Return link of slave.
+
+        :raises NoSuchSlaveException:
+        """
+        if slave in self.routes:
+            return self.routes[slave]
+        if self.default is not None:
+            return self.default
+        raise NoSuchSlaveException(f"slave - {slave} is not routed")
+
+    def slaves(self):
+        """Return routed slave ids."""
+        return list(self.routes.keys())
+
+    @property
+    def links(self) -> list[GatewayLink]:
+        """Return links (each link once)."""
+        links = list({id(link): link for link in self.routes.values()}.values())
+        if self.default is not None and self.default not in links:
+            links.append(self.default)
+        return links
+
+    def metrics(self) -> dict[str, GatewayMetrics]:
+        """Return metrics pr. link name."""
+        return {link.name: link.metrics for link in self.links}
+
+    async def connect(self) -> bool:
+        """Connect all links.
+
+        :returns: True if all clients are connected
+        """
+        results = [await link.connect() for link in self.links]
+        return all(results)
+
+    def close(self) -> None:
+        """Close all links."""
+        for link in self.links:
+            link.close()
+
+    async def forward(self, request: ModbusPDU, upstream: Hashable, broadcast: bool = False) -> ModbusPDU | None:
+        """Forward request to the link of request.slave_id.
+
+        :param request: Decoded request
+        :param upstream: Key of the upstream connection
+        :param broadcast: True to forward to all links without waiting for responses
+        :returns: Response (None when broadcasting)
+        :raises NoSuchSlaveException: slave id is not routed
+        """
+        if broadcast:
+            for link in self.links:
+                await link.forward(request, upstream, no_response_expected=True)
+            return None
+        return await self[request.slave_id].forward(request, upstream)
+
+    async def __aenter__(self):
+        """Connect links."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, klass, value, traceback):
+        """Close links."""
+        self.close()
@@ -0,0 +1,294 @@
+"""Multi process tcp server.
+
+A server runs on one event loop, and thereby uses only one core.
+:class:`ModbusMultiProcessTcpServer` forks a number of worker processes,
+each running a :class:`~pymodbus.server.ModbusTcpServer` on the same port
+(SO_REUSEPORT), the kernel distributes new connections between the workers.
+
+Each worker has its own copy of the context, unless ``share_datastore`` is
+set, in which case the sequential/compact datablocks are converted to
+:class:`~pymodbus.datastore.ModbusSharedMemoryDataBlock` (before forking),
+and all workers (and the parent) see the same values. Writes from the
+workers are serialized by the writer lock of the shared datablock, a read
+modify write done by one request (e.g. mask_write_register) is however not
+atomic towards other workers.
+
+The workers report statistics to the parent (``server.stats``), and drain
+gracefully when stopped (ServerAsyncStop()/shutdown()): new connections are
+refused while existing connections are allowed to finish (up to drain_timeout).
+
+Example::
+
+    await StartAsyncMultiProcessTcpServer(context, address=("", 5020), workers=4)
+
+*Remark* SO_REUSEPORT and fork are only available on Linux/Unix.
+"""
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import multiprocessing
+import os
+import socket
+import time
+from contextlib import suppress
+from multiprocessing.connection import Connection
+
+from pymodbus_3p3v.datastore import (
+    ModbusCompactDataBlock,
+    ModbusSequentialDataBlock,
+    ModbusServerContext,
+    ModbusSharedMemoryDataBlock,
+    ModbusSlaveContext,
+)
+from pymodbus_3p3v.exceptions import ParameterException
+from pymodbus_3p3v.logging import Log
+from pymodbus_3p3v.server.async_io import ModbusTcpServer, _serverList
+
+
+@dataclasses.dataclass
+class WorkerStats:
+    """Statistics reported by a worker.
+
+    :param pid: Process id of worker
+    :param requests: Number of requests received
+    :param connections: Number of active connections
+    :param running: False when the worker has stopped
+    """
+
+    pid: int
+    requests: int = 0
+    connections: int = 0
+    running: bool = True
+
+
+class ModbusMultiProcessTcpServer:
+    """A modbus tcp server running in several processes.
+
+    :param context: The ModbusServerContext datastore
+    :param workers: Number of worker processes, default os.cpu_count()
+    :param address: (interface, port) to bind to, port 0 selects a free port
+    :param share_datastore: True to convert datablocks to shared memory
+    :param stats_interval: Seconds between statistics reports from the workers
+    :param drain_timeout: Max seconds to wait for connections to close when stopping
+    :param custom_functions: Custom function classes supported by the server
+    :param kwargs: Passed to ModbusTcpServer (framer, identity, direct_dispatch...),
+        pool_size has no effect, the workers trace the requests for the statistics
+    :raises ParameterException: SO_REUSEPORT not supported or illegal workers
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        context: ModbusServerContext,
+        workers: int | None = None,
+        address: tuple[str, int] = ("", 502),
+        share_datastore: bool = False,
+        stats_interval: float = 1.0,
+        drain_timeout: float = 5.0,
+        custom_functions: list | None = None,
+        **kwargs,
+    ) -> None:
+        """Initialize launcher."""
+        if not hasattr(socket, "SO_REUSEPORT") or "fork" not in multiprocessing.get_all_start_methods():
+            raise ParameterException("Multi process server needs SO_REUSEPORT and fork")
+        self.workers = workers or os.cpu_count() or 1
+        if self.workers < 1:
+            raise ParameterException(f"workers must be >= 1, got {self.workers}")
+        self.context = context
+        self.address = address
+        self.stats_interval = stats_interval
+        self.drain_timeout = drain_timeout
+        self.custom_functions = custom_functions or []
+        self.kwargs = kwargs
+        self.stats: dict[int, WorkerStats] = {}
+        self.processes: list[multiprocessing.process.BaseProcess] = []
+        self.pipes: list[Connection] = []
+        self.shared_blocks: list[ModbusSharedMemoryDataBlock] = []
+        self.serving: asyncio.Future = asyncio.Future()
+        self._reserve: socket.socket | None = None
+        if share_datastore:
+            self.share_datastore()
+
+    def share_datastore(self) -> None:
+        """Convert sequential/compact datablocks to shared memory datablocks."""
+        converted: dict[int, ModbusSharedMemoryDataBlock] = {}
+        for _, slave in self.context:
+            if not isinstance(slave, ModbusSlaveContext):
+                continue
+            for key, block in slave.store.items():
+                if isinstance(block, ModbusSharedMemoryDataBlock):
+                    continue
+                if id(block) not in converted:
+                    if not isinstance(block, (ModbusSequentialDataBlock, ModbusCompactDataBlock)):
+                        Log.warning("datablock {} cannot be shared, each worker has a copy", block)
+                        continue
+                    if isinstance(block, ModbusCompactDataBlock):
+                        values, bits = list(block.getValues(block.address, block.count)), block.bits
+                    else:
+                        values, bits = list(block.values), key in ("c", "d")
+                    converted[id(block)] = ModbusSharedMemoryDataBlock(block.address, values, bits=bits)
+                    self.shared_blocks.append(converted[id(block)])
+                slave.store[key] = converted[id(block)]
+
+    def total(self) -> WorkerStats:
+        """Return sum of worker statistics (pid is the parent pid)."""
+        total = WorkerStats(os.getpid(), running=any(stats.running for stats in self.stats.values()))
+        for stats in self.stats.values():
+            total.requests += stats.requests
+            total.connections += stats.connections
+        return total
+
+    def _reserve_port(self) -> None:
+        """Bind (without listening) to resolve port 0 and keep the port."""
+        if self.address[1]:
+            return
+        self._reserve = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._reserve.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._reserve.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        self._reserve.bind(self.address)
+        self.address = (self.address[0], self._reserve.getsockname()[1])
+
+    def _receive_stats(self, index: int, conn: Connection) -> None:
+        """Receive statistics from worker."""
+        try:
+            self.stats[index] = conn.recv()
+        except (EOFError, OSError):
+            asyncio.get_running_loop().remove_reader(conn.fileno())
+            if index in self.stats:
+                self.stats[index].running = False
+
+    async def serve_forever(self) -> None:
+        """Start workers and wait until shutdown."""
+        if self.processes:
+            Log.error("Can't call serve_forever on an already running server object")
+            return
+        self._reserve_port()
+        loop = asyncio.get_running_loop()
+        mp_context = multiprocessing.get_context("fork")
+        for index in range(self.workers):
+            parent_conn, child_conn = mp_context.Pipe()
+            process = mp_context.Process(
+                target=_worker_main,
+                args=(self, child_conn),
+                name=f"modbus worker {index}",
+                daemon=True,
+            )
+            self.pipes.append(parent_conn)
+            process.start()
+            child_conn.close()
+            self.processes.append(process)
+            self.stats[index] = WorkerStats(process.pid or 0)
+            loop.add_reader(parent_conn.fileno(), self._receive_stats, index, parent_conn)
+        Log.info("Server listening on {} with {} workers.", self.address, self.workers)
+        await self.serving
+
+    async def shutdown(self) -> None:
+        """Stop workers gracefully (drain connections) and wait for them to exit."""
+        if not self.serving.done():
+            self.serving.set_result(True)
+        for conn in self.pipes:
+            with suppress(OSError):
+                conn.send("stop")
+        deadline = time.monotonic() + self.drain_timeout + 1.0
+        while any(process.is_alive() for process in self.processes) and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+        loop = asyncio.get_running_loop()
+        for index, (process, conn) in enumerate(zip(self.processes, self.pipes)):
+            if process.is_alive():
+                Log.warning("worker {} did not stop, terminating", process.pid)
+                process.terminate()
+            process.join(1)
+            with suppress(EOFError, OSError):
+                while conn.poll():
+                    self.stats[index] = conn.recv()
+            loop.remove_reader(conn.fileno())
+            conn.close()
+            self.stats[index].running = False
+        self.processes = []
+        self.pipes = []
+        if self._reserve:
+            self._reserve.close()
+            self._reserve = None
+        for block in self.shared_blocks:
+            block.unlink()
+        self.shared_blocks = []
+
+
+def _worker_main(launcher: ModbusMultiProcessTcpServer, conn: Connection) -> None:
+    """Run worker process."""
+    # the parent ends of the pipes are inherited, but only used by the parent,
+    # closing them allows the worker to detect if the parent disappears.
+    for parent_conn in launcher.pipes:
+        parent_conn.close()
+    with suppress(KeyboardInterrupt):
+        asyncio.run(_worker_run(launcher, conn))
+
+
+async def _worker_run(launcher: ModbusMultiProcessTcpServer, conn: Connection) -> None:
+    """Serve until told to stop by the parent (or the parent disappears)."""
+    stats = WorkerStats(os.getpid())
+    user_tracer = launcher.kwargs.get("request_tracer")
+
+    def count_request(request, *addr):
+        """Count requests."""
+        stats.requests += 1
+        if user_tracer:
+            user_tracer(request, *addr)
+
+    kwargs = dict(launcher.kwargs, request_tracer=count_request, reuse_port=True)
+    server = ModbusTcpServer(launcher.context, address=launcher.address, **kwargs)
+    for func in launcher.custom_functions:
+        server.decoder.register(func)
+    serve_task = asyncio.create_task(server.serve_forever())
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    loop.add_reader(conn.fileno(), stop.set)
+    while not stop.is_set():
+        with suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(stop.wait(), launcher.stats_interval)
+        stats.connections = len(server.active_connections)
+        conn.send(stats)
+    loop.remove_reader(conn.fileno())
+
+    # drain: stop listening, let the clients finish.
+    if server.transport:
+        server.transport.close()
+    deadline = time.monotonic() + launcher.drain_timeout
+    while server.active_connections and time.monotonic() < deadline:
+        await asyncio.sleep(0.05)
+    await server.shutdown()
+    await serve_task
+    stats.connections = 0
+    stats.running = False
+    with suppress(OSError):
+        conn.send(stats)
+    conn.close()
+    for block in launcher.shared_blocks:
+        block.close()
+
+
+async def StartAsyncMultiProcessTcpServer(  # pylint: disable=invalid-name
+    context=None,
+    address=None,
+    workers=None,
+    custom_functions=None,
+    **kwargs,
+):
+    """Start and run a multi process tcp modbus server.
+
+    :param context: The ModbusServerContext datastore
+    :param address: An optional (interface, port) to bind to.
+    :param workers: Number of worker processes, default os.cpu_count()
+    :param custom_functions: An optional list of custom function classes
+        supported by server instance.
+    :param kwargs: The rest (see ModbusMultiProcessTcpServer)
+    """
+    kwargs.pop("host", None)
+    server = ModbusMultiProcessTcpServer(
+        context or ModbusServerContext(),
+        workers=workers,
+        address=address or ("", 502),
+        custom_functions=custom_functions,
+        **kwargs,
+    )
+    await _serverList.run(server, [])
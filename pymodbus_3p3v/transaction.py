@@ -27,7 +27,7 @@ from pymodbus_3p3v.framer import (
 from pymodbus_3p3v.logging import Log
 from pymodbus_3p3v.pdu import ModbusPDU
 from pymodbus_3p3v.transport import CommType
-from pymodbus_3p3v.utilities import ModbusTransactionState, hexlify_packets
+from pymodbus_3p3v.utilities import ModbusTransactionState
 
 
 if TYPE_CHECKING:
@@ -64,7 +64,8 @@ class ModbusTransactionManager:
         :param request: The request to hold on to
         """
         tid = request.transaction_id
-        Log.debug("Adding transaction {}", tid)
+        if Log.debug_enabled:
+            Log.debug("Adding transaction {}", tid)
         self.transactions[tid] = request
 
     def getTransaction(self, tid: int):
@@ -75,7 +76,8 @@ class ModbusTransactionManager:
         :param tid: The transaction to retrieve
 
         """
-        Log.debug("Getting transaction {}", tid)
+        if Log.debug_enabled:
+            Log.debug("Getting transaction {}", tid)
         if not tid:
             if self.transactions:
                 ret = self.transactions.popitem()[1]
@@ -89,7 +91,8 @@ class ModbusTransactionManager:
 
         :param tid: The transaction to remove
         """
-        Log.debug("deleting transaction {}", tid)
+        if Log.debug_enabled:
+            Log.debug("deleting transaction {}", tid)
         self.transactions.pop(tid, None)
 
     def getNextTID(self) -> int:
@@ -137,6 +140,7 @@ class SyncModbusTransactionManager(ModbusTransactionManager):
         self.retries = retries
         self._transaction_lock = RLock()
         self._no_response_devices: list[int] = []
+        self._slave_id = 0
         self.databuffer = b''
         if client:
             self._set_adu_size()
@@ -181,20 +185,26 @@ class SyncModbusTransactionManager(ModbusTransactionManager):
         """Start the producer to send the next request to consumer.write(Frame(request))."""
         with self._transaction_lock:
             try:
-                Log.debug(
-                    "Current transaction state - {}",
-                    ModbusTransactionState.to_string(self.client.state),
-                )
+                self.client.policy.allow(request.slave_id)
+            except ModbusIOException as exc:
+                return exc
+            self._slave_id = request.slave_id
+            try:
+                if Log.debug_enabled:
+                    Log.debug(
+                        "Current transaction state - {}",
+                        ModbusTransactionState.to_string(self.client.state),
+                    )
                 retries = self.retries
                 if isinstance(self.client.framer, FramerSocket):
                     request.transaction_id = self.getNextTID()
                 else:
                     request.transaction_id = 0
-                Log.debug("Running transaction {}", request.transaction_id)
-                if _buffer := hexlify_packets(
-                    self.client.framer.databuffer
-                ):
-                    Log.debug("Clearing current Frame: - {}", _buffer)
+                if Log.debug_enabled:
+                    Log.debug("Running transaction {}", request.transaction_id)
+                if self.client.framer.databuffer:
+                    if Log.debug_enabled:
+                        Log.debug("Clearing current Frame: - {}", self.client.framer.databuffer, ":hex")
                     self.client.framer.databuffer = b''
                 expected_response_length = None
                 if not isinstance(self.client.framer, FramerSocket):
@@ -215,6 +225,7 @@ class SyncModbusTransactionManager(ModbusTransactionManager):
                     full = True
                     if not expected_response_length:
                         expected_response_length = 1024
+                sent = time.monotonic()
                 response, last_exception = self._transact(
                     no_response_expected,
                     request,
@@ -223,6 +234,10 @@ class SyncModbusTransactionManager(ModbusTransactionManager):
                 )
                 if no_response_expected:
                     return None
+                if response:
+                    self.client.policy.on_response(request.slave_id, time.monotonic() - sent, 0)
+                else:
+                    self.client.policy.on_failure(request.slave_id)
                 while retries > 0:
                     if self._validate_response(response):
                         if (
@@ -255,11 +270,12 @@ class SyncModbusTransactionManager(ModbusTransactionManager):
                         )
                         self.client.close()
                 if hasattr(self.client, "state"):
-                    Log.debug(
-                        "Changing transaction state from "
-                        '"PROCESSING REPLY" to '
-                        '"TRANSACTION_COMPLETE"'
-                    )
+                    if Log.debug_enabled:
+                        Log.debug(
+                            "Changing transaction state from "
+                            '"PROCESSING REPLY" to '
+                            '"TRANSACTION_COMPLETE"'
+                        )
                     self.client.state = ModbusTransactionState.TRANSACTION_COMPLETE
                 return result
             except ModbusIOException as exc:
@@ -284,13 +300,14 @@ class SyncModbusTransactionManager(ModbusTransactionManager):
                     return result, None
         return self._transact(no_response_expected, packet, response_length, full=full)
 
-    def _transact(self, no_response_expected: bool, request: ModbusPDU, response_length, full=False):
+    def _transact(self, no_response_expected: bool, request: ModbusPDU, response_length, full=False):  # noqa: C901
         """Do a Write and Read transaction."""
         last_exception = None
         try:
             self.client.connect()
             packet = self.client.framer.buildFrame(request)
-            Log.debug("SEND: {}", packet, ":hex")
+            if Log.debug_enabled:
+                Log.debug("SEND: {}", packet, ":hex")
             size = self._send(packet)
             if (
                 isinstance(size, bytes)
@@ -314,14 +331,16 @@ class SyncModbusTransactionManager(ModbusTransactionManager):
                     self.client.state = ModbusTransactionState.TRANSACTION_COMPLETE
                 return b"", None
             if size:
-                Log.debug(
-                    'Changing transaction state from "SENDING" '
-                    'to "WAITING FOR REPLY"'
-                )
+                if Log.debug_enabled:
+                    Log.debug(
+                        'Changing transaction state from "SENDING" '
+                        'to "WAITING FOR REPLY"'
+                    )
                 self.client.state = ModbusTransactionState.WAITING_FOR_REPLY
             result = self._recv(response_length, full)
             # result2 = self._recv(response_length, full)
-            Log.debug("RECV: {}", result, ":hex")
+            if Log.debug_enabled:
+                Log.debug("RECV: {}", result, ":hex")
         except (OSError, ModbusIOException, InvalidMessageReceivedException, ConnectionException) as msg:
             self.client.close()
             Log.debug("Transaction failed. ({}) ", msg)
@@ -392,7 +411,7 @@ class SyncModbusTransactionManager(ModbusTransactionManager):
             result = read_min
             while missing_len and retries < self.retries:
                 if retries:
-                    time.sleep(0.1)
+                    time.sleep(self.client.policy.poll_interval(self._slave_id))
                 data = self.client.recv(expected_response_length)
                 result += data
                 missing_len -= len(data)
@@ -88,6 +88,7 @@ class CommParams:
     port: int = 0
     source_address: tuple[str, int] | None = None
     handle_local_echo: bool = False
+    reuse_port: bool = False  # tcp/tls server, allow several processes to listen on the same port
 
     # tls
     sslctx: ssl.SSLContext | None = None
@@ -150,7 +151,7 @@ class ModbusProtocol(asyncio.BaseProtocol):
 
         self.transport: asyncio.BaseTransport = None  # type: ignore[assignment]
         self.loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
-        self.recv_buffer: bytes = b""
+        self.recv_buffer: bytearray = bytearray()
         self.call_create: Callable[[], Coroutine[Any, Any, Any]] = None  # type: ignore[assignment]
         self.reconnect_task: asyncio.Task | None = None
         self.listener: ModbusProtocol | None = None
@@ -158,6 +159,7 @@ class ModbusProtocol(asyncio.BaseProtocol):
         self.unique_id: str = str(id(self))
         self.reconnect_delay_current = 0.0
         self.sent_buffer: bytes = b""
+        self.flush_recv_on_send = True
         if self.is_server:
             if self.comm_params.source_address is not None:
                 host = self.comm_params.source_address[0]
@@ -220,6 +222,7 @@ class ModbusProtocol(asyncio.BaseProtocol):
                 port,
                 ssl=self.comm_params.sslctx,
                 reuse_address=True,
+                reuse_port=self.comm_params.reuse_port,
                 start_serving=True,
             )
         else:
@@ -320,18 +323,24 @@ class ModbusProtocol(asyncio.BaseProtocol):
                 self.sent_buffer = b""
             if not data:
                 return
-        Log.debug(
-            "recv: {} old_data: {} addr={}",
-            data,
-            ":hex",
-            self.recv_buffer,
-            ":hex",
-            addr,
-        )
+        if Log.debug_enabled:
+            Log.debug(
+                "recv: {} old_data: {} addr={}",
+                data,
+                ":hex",
+                self.recv_buffer,
+                ":hex",
+                addr,
+            )
         self.recv_buffer += data
         cut = self.callback_data(self.recv_buffer, addr=addr)
-        self.recv_buffer = self.recv_buffer[cut:]
-        if self.recv_buffer:
+        try:
+            del self.recv_buffer[:cut]
+        except BufferError:
+            # a view of the buffer is still alive (kept by callback_data),
+            # leave it with the old buffer.
+            self.recv_buffer = self.recv_buffer[cut:]
+        if self.recv_buffer and Log.debug_enabled:
             Log.debug(
                 "recv, unused data waiting for next packet: {}",
                 self.recv_buffer,
@@ -363,7 +372,13 @@ class ModbusProtocol(asyncio.BaseProtocol):
 
     @abstractmethod
     def callback_data(self, data: bytes, addr: tuple | None = None) -> int:
-        """Handle received data."""
+        """Handle received data.
+
+        data is the receive buffer itself (no copy), it is only valid
+        during the call, copy what needs to be kept.
+
+        returns number of bytes consumed
+        """
 
     # ----------------------------------- #
     # Helper methods for external classes #
@@ -377,8 +392,10 @@ class ModbusProtocol(asyncio.BaseProtocol):
         if not self.transport:
             Log.error("Cancel send, because not connected!")
             return
-        Log.debug("send: {}", data, ":hex")
-        self.recv_buffer = b""
+        if Log.debug_enabled:
+            Log.debug("send: {}", data, ":hex")
+        if self.flush_recv_on_send:
+            self.recv_buffer = bytearray()
         if self.comm_params.handle_local_echo:
             self.sent_buffer += data
         if self.comm_params.comm_type == CommType.UDP:
@@ -397,7 +414,7 @@ class ModbusProtocol(asyncio.BaseProtocol):
         if self.transport:
             self.transport.close()
             self.transport = None  # type: ignore[assignment]
-        self.recv_buffer = b""
+        self.recv_buffer = bytearray()
         if self.is_server:
             for _key, value in self.active_connections.items():
                 value.listener = None
@@ -7,13 +7,18 @@ from __future__ import annotations
 
 
 __all__ = [
+    "PackedBits",
     "pack_bitstring",
     "unpack_bitstring",
+    "pack_registers",
+    "unpack_registers",
     "default",
 ]
 
 # pylint: disable=missing-type-doc
+import functools
 import struct
+from collections.abc import Sequence
 
 
 class ModbusTransactionState:  # pylint: disable=too-few-public-methods
@@ -97,7 +102,72 @@ def dict_property(store, index):
 # --------------------------------------------------------------------------- #
 # Bit packing functions
 # --------------------------------------------------------------------------- #
-def pack_bitstring(bits: list[bool]) -> bytes:
+
+
+class PackedBits(Sequence[bool]):
+    """Read only list of bits, packed 8 pr byte in modbus order (first bit is LSB of first byte).
+
+    Returned by compact datablocks, pack_bitstring() returns the packed bytes without unpacking.
+
+    example::
+
+        bits = PackedBits.from_buffer(bytes([5, 255]), 1, 4)  # [False, True, False, False]
+    """
+
+    __slots__ = ("count", "data")
+
+    def __init__(self, data: bytes, count: int) -> None:
+        """Initialize bits.
+
+        :param data: packed bits (unused high bits of last byte must be 0)
+        :param count: number of bits
+        """
+        self.data = data
+        self.count = count
+
+    @classmethod
+    def from_buffer(cls, buffer: bytes | bytearray | memoryview, start: int, count: int) -> PackedBits:
+        """Copy count bits starting at bit start of a packed buffer."""
+        first = start >> 3
+        value = int.from_bytes(buffer[first : (start + count + 7) >> 3], "little")
+        value = (value >> (start & 7)) & ((1 << count) - 1)
+        return cls(value.to_bytes((count + 7) >> 3, "little"), count)
+
+    def __len__(self) -> int:
+        """Return number of bits."""
+        return self.count
+
+    def __getitem__(self, index):
+        """Return bit (or list of bits for a slice)."""
+        if isinstance(index, slice):
+            return [self[inx] for inx in range(*index.indices(self.count))]
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("PackedBits index out of range")
+        return bool(self.data[index >> 3] & (1 << (index & 7)))
+
+    def __eq__(self, other) -> bool:
+        """Compare with PackedBits or list of bits."""
+        if isinstance(other, PackedBits):
+            return self.count == other.count and self.data == other.data
+        if isinstance(other, (list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Return list representation."""
+        return repr(list(self))
+
+
+# bits of each byte value, modbus order (LSB first), and the reverse lookup
+_BYTE_BITS = tuple(tuple(bool(byte >> bit & 1) for bit in range(8)) for byte in range(256))
+_BITS_BYTE = {bits: byte for byte, bits in enumerate(_BYTE_BITS)}
+
+
+def pack_bitstring(bits: list[bool] | PackedBits) -> bytes:
     """Create a bytestring out of a list of bits.
 
     :param bits: A list of bits
@@ -107,21 +177,17 @@ def pack_bitstring(bits: list[bool]) -> bytes:
         bits   = [False, True, False, True]
         result = pack_bitstring(bits)
     """
-    ret = b""
-    i = packed = 0
-    for bit in bits:
-        if bit:
-            packed += 128
-        i += 1
-        if i == 8:
-            ret += struct.pack(">B", packed)
-            i = packed = 0
-        else:
-            packed >>= 1
-    if 0 < i < 8:
-        packed >>= 7 - i
-        ret += struct.pack(">B", packed)
-    return ret
+    if isinstance(bits, PackedBits):
+        return bits.data
+    if rest := len(bits) & 7:
+        bits = list(bits) + [False] * (8 - rest)
+    octets = iter(bits)
+    try:
+        return bytes(map(_BITS_BYTE.__getitem__, zip(octets, octets, octets, octets, octets, octets, octets, octets)))
+    except KeyError:
+        # bits are not bool/0/1, e.g. [2, None]
+        octets = iter([bool(bit) for bit in bits])
+        return bytes(map(_BITS_BYTE.__getitem__, zip(octets, octets, octets, octets, octets, octets, octets, octets)))
 
 
 def unpack_bitstring(data: bytes) -> list[bool]:
@@ -134,14 +200,41 @@ def unpack_bitstring(data: bytes) -> list[bool]:
         bytes  = "bytes to decode"
         result = unpack_bitstring(bytes)
     """
-    byte_count = len(data)
-    bits = []
-    for byte in range(byte_count):
-        value = int(data[byte])
-        for _ in range(8):
-            bits.append((value & 1) == 1)
-            value >>= 1
-    return bits
+    return [bit for byte in data for bit in _BYTE_BITS[byte]]
+
+
+@functools.lru_cache(maxsize=256)
+def _register_struct(count: int) -> struct.Struct:
+    """Return (cached) struct of count big endian registers."""
+    return struct.Struct(f">{count}H")
+
+
+def pack_registers(registers: Sequence[int]) -> bytes:
+    r"""Create a bytestring out of a list of registers (big endian).
+
+    :param registers: A list (or array) of register values
+
+    example::
+
+        result = pack_registers([1, 2])  # b"\x00\x01\x00\x02"
+    """
+    return _register_struct(len(registers)).pack(*registers)
+
+
+def unpack_registers(data: bytes, offset: int = 0, count: int | None = None) -> list[int]:
+    r"""Create register list out of a bytestring (big endian).
+
+    :param data: The modbus data packet to decode (bytes or memoryview)
+    :param offset: Position of the first register in data
+    :param count: Number of registers, default the rest of data
+
+    example::
+
+        result = unpack_registers(b"\x04\x00\x01\x00\x02", offset=1)  # [1, 2]
+    """
+    if count is None:
+        count = (len(data) - offset) // 2
+    return list(_register_struct(count).unpack_from(data, offset))
 
 
 # --------------------------------------------------------------------------- #
@@ -47,6 +47,11 @@ BASE_PORTS = {
     "TestClientServerAsyncExamples": 8400,
     "TestNetwork": 8500,
     "TestSimulator": 8600,
+    "TestDirectDispatch": 8700,
+    "TestGateway": 8750,
+    "TestBusScheduler": 8800,
+    "TestClientPolicy": 8850,
+    "TestPerformanceExamples": 8900,
 }
 
 
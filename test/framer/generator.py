@@ -1,5 +1,13 @@
 #!/usr/bin/env python3
-"""Build framer encode responses."""
+"""Build framer encode responses.
+
+Also contains a benchmark of RTU hunting on a garbled buffer::
+
+    python3 -m test.framer.generator --benchmark
+"""
+import random
+import sys
+import time
 
 from pymodbus_3p3v.framer import (
     FramerAscii,
@@ -43,4 +51,38 @@ def set_calls():
                 print(f"      exception --> {result}")
                 print(f"      exception --> {result.hex()}")
 
-set_calls()
+
+def build_garbled_rtu(size=1024, seed=1, noise=None):
+    """Build a garbled buffer (noise on a multidrop line) ending with a valid request."""
+    rng = random.Random(seed)
+    client = FramerRTU(DecodePDU(False))
+    request = ReadHoldingRegistersRequest(124, 2, 17)
+    frame = client.buildFrame(request)
+    size -= len(frame)
+    if noise:
+        # pad, so the long frames in the noise can be checked.
+        return (noise * size)[: size - 256] + bytes(256) + frame
+    return bytes(rng.randrange(256) for _ in range(size)) + frame
+
+
+def benchmark_rtu_hunting(loops=200):
+    """Measure RTU hunting on a garbled 1 KB buffer."""
+    server = FramerRTU(DecodePDU(True))
+    for name, data in (
+        ("random noise", build_garbled_rtu()),
+        ("long frame headers", build_garbled_rtu(noise=b"\x01\x17\x00\x00\x00\x7d\x00\x00\x00\x79\xf2")),
+    ):
+        start_time = time.perf_counter()
+        for _ in range(loops):
+            used_len, pdus = server.processIncomingFrames(data)
+            assert used_len == len(data)
+            assert len(pdus) == 1
+        run_time = time.perf_counter() - start_time
+        print(f"RTU hunting {len(data)} bytes ({name}): {run_time / loops * 1000:.3f} ms pr buffer")
+
+
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        benchmark_rtu_hunting()
+    else:
+        set_calls()
@@ -3,6 +3,7 @@ from unittest import mock
 
 import pytest
 
+from pymodbus_3p3v.exceptions import ModbusIOException, ParameterException
 from pymodbus_3p3v.framer import (
     FramerAscii,
     FramerBase,
@@ -12,6 +13,7 @@ from pymodbus_3p3v.framer import (
     FramerType,
 )
 from pymodbus_3p3v.pdu import DecodePDU, ModbusPDU
+from pymodbus_3p3v.pdu.register_read_message import ReadHoldingRegistersRequest
 
 from .generator import set_calls
 
@@ -70,6 +72,77 @@ class TestFramer:
         assert FramerRTU.compute_CRC(data) == 0xE2DB
         assert FramerRTU.check_CRC(data, 0xE2DB)
 
+    @pytest.mark.parametrize(("backend"), list(FramerRTU.crc16_backends))
+    def test_CRC_backends(self, backend):
+        """Test all crc16 backends calculate the same CRC."""
+        data = bytes(range(256)) * 2
+        for data_len in (0, 1, 8, 15, 16, 17, 255, 512):
+            expect = FramerRTU.compute_CRC_byte(data[:data_len])
+            assert FramerRTU.crc16_backends[backend](data[:data_len]) == expect
+            assert FramerRTU.crc16_backends[backend](memoryview(data)[:data_len]) == expect
+        old_backend = FramerRTU.crc16_backend
+        try:
+            FramerRTU.set_crc16_backend(backend)
+            assert FramerRTU.crc16_backend == backend
+            assert FramerRTU.compute_CRC(b'\x12\x34\x23\x45\x34\x56\x45\x67') == 0xE2DB
+        finally:
+            FramerRTU.set_crc16_backend(old_backend)
+
+    def test_CRC_backend_select(self):
+        """Test select crc16 backend."""
+        assert FramerRTU.crc16_backend == next(iter(FramerRTU.crc16_backends))
+        with pytest.raises(ParameterException):
+            FramerRTU.set_crc16_backend("no backend")
+        assert FramerRTU.crc16_backend == next(iter(FramerRTU.crc16_backends))
+
+    def test_CRC_prefix(self):
+        """Test check CRC with running CRC."""
+        data = b'\xff\xfe' + b'\x12\x34\x23\x45\x34\x56\x45\x67' + b'\x00'
+        prefix = [0]
+        assert FramerRTU.check_CRC_prefix(data, prefix, 2, 10, 0xE2DB)
+        assert len(prefix) == 11
+        assert not FramerRTU.check_CRC_prefix(data, prefix, 2, 10, 0xDBE2)
+        assert FramerRTU.check_CRC_prefix(data, prefix, 0, 11, FramerRTU.compute_CRC(data))
+        assert FramerRTU.check_CRC_prefix(data, prefix, 3, 4, FramerRTU.compute_CRC(data[3:4]))
+
+    @pytest.mark.parametrize(("is_server"), [True])
+    def test_rtu_hunting(self, test_framer):
+        """Test RTU hunting skips garbage, including long frame headers."""
+        frame = b"\x02\x03\x00\x01\x00}\xd4\x18"
+        garbage = b"\x01\x17\x00\x00\x00\x7d\x00\x00\x00\x79\x10" * 5 + b"\x00\x01\x02"
+        used_len, pdus = test_framer.processIncomingFrames(garbage + frame + b"\x05" + frame)
+        assert used_len == len(garbage) + 2 * len(frame) + 1
+        assert len(pdus) == 2
+
+    @pytest.mark.parametrize(("frame"), [FramerAscii, FramerRTU, FramerSocket, FramerTLS])
+    def test_frame_cache(self, frame):
+        """Test cached frames are equal to encoded frames."""
+        framer = frame(DecodePDU(False), frame_cache_size=2)
+        no_cache = frame(DecodePDU(False))
+        for tid, address in ((1, 10), (2, 10), (3, 20), (4, 10), (5, 30), (6, 20)):
+            request = ReadHoldingRegistersRequest(address, 2, 17)
+            request.transaction_id = tid
+            assert framer.buildFrame(request) == no_cache.buildFrame(request)
+        assert framer.frame_cache_info() == (2, 4, 2, 2)
+        framer.set_frame_cache_size(1)
+        assert framer.frame_cache_info() == (2, 4, 1, 1)
+        framer.frame_cache_clear()
+        assert framer.frame_cache_info() == (0, 0, 1, 0)
+        framer.set_frame_cache_size(0)
+        framer.buildFrame(request)
+        assert framer.frame_cache_info() == (0, 0, 0, 0)
+
+    def test_rtu_frame_size_table(self):
+        """Test the decoder RTU frame size table."""
+        decoder = DecodePDU(False)
+        assert decoder.rtu_frame_size[0x00] is None
+        assert decoder.rtu_frame_size[0x03] == (0, 2)
+        assert decoder.rtu_frame_size[0x06] == (8, 0)
+        assert decoder.rtu_frame_size[0x83] == (5, 0)
+        assert decoder.rtu_frame_size[0x18] == (0, 0)
+        assert decoder.rtu_function_code_mask[0x03] == 1
+        assert not decoder.rtu_function_code_mask[0x00]
+
 
 class TestFramerType:
     """Test classes."""
@@ -337,6 +410,17 @@ class TestFramerType:
             assert used_len == ent[0]
             assert res_data == ent[1]
 
+    @pytest.mark.parametrize(("entry"), [FramerType.ASCII])
+    def test_decode_ascii_view(self, test_framer):
+        """Test ascii frames are located in a memoryview, without copying it."""
+        frame = b':F7031389000A60\r\n'
+        with memoryview(bytearray(b'\x00\xff' + frame + frame[:5])) as view:
+            used_len, dev_id, _, res_data = test_framer.decode(view[1:])
+            assert used_len == 1 + len(frame)
+            assert dev_id == 0xf7
+            assert res_data == b'\x03\x13\x89\x00\x0a'
+            assert test_framer.decode(view[1 + used_len:])[0] == 0
+
     @pytest.mark.parametrize(
         ("entry", "data", "dev_id", "res_msg"),
         [
@@ -393,6 +477,55 @@ class TestFramerType:
         assert pdu
         assert used_len == len(msg)
 
+    @pytest.mark.parametrize(("is_server"), [True])
+    @pytest.mark.parametrize(("entry", "msg"), [
+        (FramerType.SOCKET, b"\x00\x01\x12\x34\x00\x06\xff\x02\x01\x02\x00\x08"),
+        (FramerType.RTU, b"\x00\x01\x00\x00\x00\x01\xfc\x1b"),
+        (FramerType.ASCII, b":F7031389000A60\r\n"),
+    ])
+    def test_processIncomingFrames(self, test_framer, msg):
+        """Test all frames are decoded in one call."""
+        used_len, pdus = test_framer.processIncomingFrames(msg * 5 + msg[:3])
+        assert used_len == 5 * len(msg)
+        assert len(pdus) == 5
+        used_len, pdus = test_framer.processIncomingFrames(msg[:3])
+        assert not used_len
+        assert not pdus
+
+    @pytest.mark.parametrize(("is_server"), [True])
+    @pytest.mark.parametrize(("entry", "msg", "bad"), [
+        (FramerType.SOCKET, b"\x00\x01\x12\x34\x00\x06\xff\x02\x01\x02\x00\x08", b"\x00\x02\x12\x34\x00\x02\xff\x44"),
+    ])
+    def test_processIncomingFrames_bad(self, test_framer, msg, bad):
+        """Test the frames before a bad frame are returned, the bad frame raises in the next call."""
+        used_len, pdus = test_framer.processIncomingFrames(msg + msg + bad + msg)
+        assert used_len == 2 * len(msg)
+        assert len(pdus) == 2
+        with pytest.raises(ModbusIOException):
+            test_framer.processIncomingFrames(bad + msg)
+
+    @pytest.mark.parametrize(("is_server"), [True])
+    @pytest.mark.parametrize(("entry", "msg"), [
+        (FramerType.SOCKET, b"\x00\x01\x12\x34\x00\x06\xff\x02\x01\x02\x00\x08"),
+        (FramerType.RTU, b"\x00\x01\x00\x00\x00\x01\xfc\x1b"),
+        (FramerType.ASCII, b":F7031389000A60\r\n"),
+    ])
+    def test_processIncomingFrames_release(self, test_framer, msg):
+        """Test the views are released, so a bytearray buffer can be resized."""
+        buffer = bytearray(msg * 2 + msg[:3])
+        used_len, pdus = test_framer.processIncomingFrames(buffer)
+        assert len(pdus) == 2
+        del buffer[:used_len]
+        buffer += msg[3:]
+        used_len, pdu = test_framer.processIncomingFrame(buffer)
+        assert pdu
+        del buffer[:used_len]
+        buffer += msg
+        with mock.patch.object(test_framer.decoder, "decode", side_effect=ModbusIOException("test")), \
+                pytest.raises(ModbusIOException):
+            test_framer.processIncomingFrame(buffer)
+        del buffer[:]
+
     @pytest.mark.parametrize(("is_server"), [True])
     @pytest.mark.parametrize(("half"), [False, True])
     @pytest.mark.parametrize(("entry", "msg", "dev_id", "tid"), [
@@ -430,12 +563,12 @@ class TestFramerType:
     ])
     def test_framer_encode(self, test_framer, msg):
         """Test a tcp frame transaction."""
-        with mock.patch.object(ModbusPDU, "encode") as mock_encode:
+        # function_code is a class attribute (ModbusPDU has __slots__)
+        with mock.patch.object(ModbusPDU, "encode") as mock_encode, mock.patch.object(ModbusPDU, "function_code", 0x01):
             message = ModbusPDU()
             message.setData(0, 0, False)
             message.transaction_id = 0x0001
             message.slave_id = 0xFF
-            message.function_code = 0x01
             mock_encode.return_value = b""
 
             actual = test_framer.buildFrame(message)
@@ -8,13 +8,16 @@ bit based request/response messages:
 """
 import struct
 
-from pymodbus_3p3v.pdu import ModbusExceptions
+import pytest
+
+from pymodbus_3p3v.pdu import DecodePDU, ModbusExceptions
 from pymodbus_3p3v.pdu.bit_read_message import (
     ReadBitsRequestBase,
     ReadBitsResponseBase,
     ReadCoilsRequest,
     ReadDiscreteInputsRequest,
 )
+from pymodbus_3p3v.utilities import PackedBits
 
 from ..conftest import MockContext
 
@@ -66,6 +69,34 @@ class TestModbusBitMessage:
             handle.decode(result)
             assert handle.bits[:i] == data
 
+    def test_bit_read_base_response_packed_bits(self):
+        """Test decoding bits as PackedBits."""
+        data = [True, False, True] * 5
+        handle = ReadBitsResponseBase(data, 0, 0, False)
+        result = handle.encode()
+        handle.packed_bits = True
+        handle.decode(memoryview(result))
+        assert isinstance(handle.bits, PackedBits)
+        assert len(handle.bits) == 16
+        assert handle.bits[:15] == data
+        assert handle.getBit(2)
+        assert handle.encode() == result
+        handle.resetBit(2)
+        handle.setBit(1)
+        assert handle.bits[:3] == [True, True, False]
+        assert not isinstance(ReadBitsResponseBase(data, 0, 0, False).bits, PackedBits)
+
+    @pytest.mark.parametrize("packed_bits", [False, True])
+    def test_bit_read_decoder_packed_bits(self, packed_bits):
+        """Test packed bits is a decoder option."""
+        frame = b"\x01\x02\x05\x01"
+        decoder = DecodePDU(False, packed_bits=packed_bits)
+        assert isinstance(decoder.decode(frame).bits, PackedBits) == packed_bits
+        assert not isinstance(DecodePDU(False).decode(frame).bits, PackedBits)
+        lazy = DecodePDU(False, lazy=True, packed_bits=packed_bits).decode(frame)
+        assert isinstance(lazy.bits, PackedBits) == packed_bits
+        assert lazy.bits[:9] == [True, False, True] + [False] * 5 + [True]
+
     def test_bit_read_base_response_helper_methods(self):
         """Test the extra methods on a ReadBitsResponseBase."""
         data = [False] * 8
@@ -115,6 +115,48 @@ class TestModbusPDU:
         pdu = self.server.decode(frame)
         assert pdu.function_code == code
 
+    @pytest.mark.parametrize(("code", "frame"), list(responses) + list(exceptions))
+    def test_client_decode_lazy(self, code, frame):
+        """Test lazy decode gives the same responses."""
+        lazy = DecodePDU(False, lazy=True)
+        pdu = lazy.decode(frame)
+        expected = self.client.decode(frame)
+        assert pdu.function_code == code
+        if code < 0x80:
+            assert bytes(pdu.raw_payload) == frame[1:]
+        assert pdu.__class__ is expected.__class__
+        assert pdu.encode() == expected.encode()
+
+    def test_lazy_values(self):
+        """Test lazy registers/bits are decoded on first access."""
+        lazy = DecodePDU(False, lazy=True)
+        frame = b"\x03\x04\x00\x01\x00\x02"
+        pdu = lazy.decode(bytearray(frame))
+        assert pdu._registers is None  # pylint: disable=protected-access
+        assert pdu.raw_payload.obj == frame
+        assert pdu.encode() == frame[1:]
+        assert pdu.registers == [1, 2]
+        pdu.registers = [3]
+        assert bytes(pdu.raw_payload) == b"\x02\x00\x03"
+        pdu = lazy.decode(b"\x01\x01\x05")
+        assert pdu._bits is None  # pylint: disable=protected-access
+        assert pdu.bits[:3] == [True, False, True]
+        assert pdu.encode() == b"\x01\x05"
+        assert not lazy.decode(b"\x03\x03\x00\x01\x00")
+
+    @pytest.mark.parametrize(("code", "frame"), list(requests))
+    def test_server_decode_pool(self, code, frame):
+        """Test released requests are reused (not re-typed sub function requests)."""
+        decoder = DecodePDU(True, pool_size=1)
+        pdu = decoder.decode(frame)
+        encoded = pdu.encode()
+        decoder.release(pdu)
+        decoder.release(decoder.lookup[code]())
+        again = decoder.decode(frame)
+        assert (again is pdu) == (type(pdu) is decoder.lookup[code])
+        assert again.encode() == encoded
+        assert not DecodePDU(True).release(pdu)
+
     @pytest.mark.parametrize(("frame"), [b'', b'NO FRAME'])
     @pytest.mark.parametrize(("decoder"), [server, client])
     def test_decode_bad_frame(self, decoder, frame):
@@ -3,6 +3,7 @@ import pytest
 
 from pymodbus_3p3v.exceptions import NotImplementedException
 from pymodbus_3p3v.pdu import (
+    DecodePDU,
     ExceptionResponse,
     ModbusExceptions,
     ModbusPDU,
@@ -31,14 +32,25 @@ class TestPdu:
 
     def test_request_exception(self):
         """Test request exception."""
-        request = ModbusPDU()
+        class Request(ModbusPDU):
+            """Request (function_code is a class attribute, instances have __slots__)."""
+
+            function_code = 1
+
+        request = Request()
         request.setData(0, 0, False)
-        request.function_code = 1
         errors = {ModbusExceptions.decode(c): c for c in range(1, 20)}
         for error, code in iter(errors.items()):
             result = request.doException(code)
             assert str(result) == f"Exception Response(129, 1, {error})"
 
+    @pytest.mark.parametrize("is_server", [True, False])
+    def test_slots(self, is_server):
+        """Test pdu have no __dict__ (except diag/mei, which keep the decoded sub function code)."""
+        for pdu_class in DecodePDU(is_server).lookup.values():
+            assert hasattr(pdu_class(), "__dict__") == (pdu_class.sub_function_code >= 0)
+        assert not hasattr(self.exception, "__dict__")
+
     def test_calculate_rtu_frame_size(self):
         """Test the calculation of Modbus frame sizes."""
         with pytest.raises(NotImplementedException):
@@ -20,8 +20,14 @@ from pymodbus_3p3v.client.base import ModbusBaseClient
 from pymodbus_3p3v.client.mixin import ModbusClientMixin
 from pymodbus_3p3v.datastore import ModbusSlaveContext
 from pymodbus_3p3v.datastore.store import ModbusSequentialDataBlock
-from pymodbus_3p3v.exceptions import ConnectionException, ModbusException
-from pymodbus_3p3v.pdu import ExceptionResponse, ModbusPDU
+from pymodbus_3p3v.exceptions import (
+    ConnectionException,
+    ModbusException,
+    ModbusIOException,
+    ParameterException,
+)
+from pymodbus_3p3v.framer import FramerSocket
+from pymodbus_3p3v.pdu import DecodePDU, ExceptionResponse, ModbusPDU
 from pymodbus_3p3v.transport import CommParams, CommType
 
 
@@ -498,6 +504,90 @@ async def test_client_protocol_timeout():
     assert transport.retries == 1
 
 
+class MockPipelineTransport:
+    """Mock transport class, which holds requests and responds in reverse order."""
+
+    def __init__(self, base, window):
+        """Initialize MockPipelineTransport."""
+        self.base = base
+        self.window = window
+        self.framer = FramerSocket(DecodePDU(True))
+        self.pending = []
+        self.max_pending = 0
+
+    def write(self, data, addr=None):
+        """Collect request, respond in reverse order when window is full."""
+        self.pending.append(data)
+        self.max_pending = max(self.max_pending, len(self.pending))
+        if len(self.pending) == self.window:
+            responses = b""
+            for pkt in reversed(self.pending):
+                _, pdu = self.framer.processIncomingFrame(pkt)
+                resp = pdu_reg_read.ReadHoldingRegistersResponse([pdu.address])
+                resp.transaction_id = pdu.transaction_id
+                resp.slave_id = pdu.slave_id
+                responses += self.framer.buildFrame(resp)
+            self.pending = []
+            self.base.ctx.data_received(responses)
+
+    def close(self):
+        """Close the transport."""
+
+
+async def test_client_protocol_pipelined():
+    """Test the client protocol with multiple requests in flight."""
+    base = ModbusBaseClient(
+        FramerType.SOCKET,
+        3,
+        None,
+        comm_params=CommParams(
+            host="127.0.0.1",
+            timeout_connect=3,
+        ),
+        max_in_flight=4,
+    )
+    transport = MockPipelineTransport(base, 4)
+    base.ctx.connection_made(transport=transport)
+    requests = [pdu_reg_read.ReadHoldingRegistersRequest(i, 1) for i in range(8)]
+    calls = [base.async_execute(False, request) for request in requests]
+    responses = await asyncio.gather(*calls)
+    assert transport.max_pending == 4
+    for i, response in enumerate(responses):
+        assert response.registers == [i]
+
+
+async def test_client_protocol_bad_frame():
+    """Test responses received before a bad frame are handled."""
+    base = ModbusBaseClient(
+        FramerType.SOCKET,
+        3,
+        None,
+        comm_params=CommParams(
+            host="127.0.0.1",
+            timeout_connect=3,
+        ),
+        max_in_flight=4,
+    )
+    base.ctx.connection_made(transport=mock.Mock())
+    request = pdu_reg_read.ReadHoldingRegistersRequest(0, 1)
+    request.transaction_id = 1
+    request.fut = asyncio.get_running_loop().create_future()
+    base.ctx.transaction.addTransaction(request)
+    response = b"\x00\x01\x00\x00\x00\x05\x00\x03\x02\x00\x11"
+    bad = b"\x00\x02\x00\x00\x00\x02\x00\x44"
+    with pytest.raises(ModbusIOException):
+        base.ctx.data_received(response + bad)
+    assert request.fut.result().registers == [17]
+
+
+async def test_client_protocol_pipelined_framer():
+    """Test pipelining is refused without transaction id."""
+    with pytest.raises(ParameterException):
+        ModbusBaseClient(FramerType.RTU, 3, None, comm_params=CommParams(), max_in_flight=2)
+    with pytest.raises(ParameterException):
+        ModbusBaseClient(FramerType.SOCKET, 3, None, comm_params=CommParams(), max_in_flight=0)
+
+
 def test_client_udp_connect():
     """Test the Udp client connection method."""
     with mock.patch.object(socket, "socket") as mock_method:
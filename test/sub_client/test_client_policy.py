@@ -0,0 +1,181 @@
+"""Test client timeout/retry policies."""
+import asyncio
+import time
+from unittest import mock
+
+import pytest
+
+from pymodbus_3p3v.client import AsyncModbusTcpClient
+from pymodbus_3p3v.client.policy import AdaptivePolicy, CircuitState, RetryPolicy
+from pymodbus_3p3v.datastore import (
+    ModbusSequentialDataBlock,
+    ModbusServerContext,
+    ModbusSlaveContext,
+)
+from pymodbus_3p3v.exceptions import ModbusIOException, ParameterException
+from pymodbus_3p3v.server import ModbusTcpServer
+from pymodbus_3p3v.transport import NULLMODEM_HOST
+
+
+class TestClientPolicy:
+    """Test policies."""
+
+    @staticmethod
+    @pytest.fixture(name="use_port")
+    def get_port_in_class(base_ports):
+        """Return next port."""
+        base_ports[__class__.__name__] += 1
+        return base_ports[__class__.__name__]
+
+    def test_retry_policy(self):
+        """Test default policy follows the client."""
+        client = mock.Mock(retries=2, comm_params=mock.Mock(timeout_connect=1.5))
+        policy = RetryPolicy().bind(client)
+        assert policy.retries(1) == 2
+        assert policy.timeout(1, 3) == 1.5
+        assert not policy.backoff(1, 1)
+        client.retries = 5
+        assert policy.retries(1) == 5
+        policy = RetryPolicy(timeout=0.5, retries=0).bind(client)
+        assert (policy.timeout(1, 0), policy.retries(1)) == (0.5, 0)
+
+    def test_adaptive_timeout(self):
+        """Test rtt estimation."""
+        policy = AdaptivePolicy(min_timeout=0.01, max_timeout=2.0)
+        assert policy.timeout(1, 0) == 2.0
+        policy.on_response(1, 0.1, 0)
+        state = policy.state(1)
+        assert (state.rtt, state.rtt_var) == (0.1, 0.05)
+        assert policy.timeout(1, 0) == pytest.approx(0.3)
+        assert policy.timeout(1, 1) == pytest.approx(0.6)
+        assert policy.timeout(1, 4) == 2.0
+        for _ in range(50):
+            policy.on_response(1, 0.1, 0)
+        assert policy.timeout(1, 0) == pytest.approx(0.1, abs=0.01)
+        policy.on_response(1, 5.0, 1)  # retries are not sampled
+        assert policy.state(1).rtt == pytest.approx(0.1)
+        for _ in range(50):
+            policy.on_response(1, 0.0001, 0)
+        assert policy.timeout(1, 0) == 0.01
+        assert policy.poll_interval(1) == 0.0025
+        assert policy.state(2).rtt is None
+
+    def test_adaptive_backoff(self):
+        """Test jittered exponential backoff."""
+        policy = AdaptivePolicy(backoff_base=0.1, backoff_max=0.3, jitter=0.5)
+        for attempt, delay in ((1, 0.1), (2, 0.2), (3, 0.3), (10, 0.3)):
+            for _ in range(20):
+                assert delay / 2 <= policy.backoff(1, attempt) <= delay
+        assert AdaptivePolicy(backoff_base=0.1, jitter=0).backoff(1, 2) == 0.2
+
+    def test_circuit_breaker(self):
+        """Test circuit opens, half opens and closes."""
+        policy = AdaptivePolicy(retries=3, failure_threshold=2, reset_timeout=10)
+        policy.allow(1)
+        policy.on_failure(1)
+        assert policy.state(1).circuit == CircuitState.CLOSED
+        policy.on_failure(1)
+        assert policy.state(1).circuit == CircuitState.OPEN
+        with pytest.raises(ModbusIOException, match="circuit open"):
+            policy.allow(1)
+        policy.allow(2)
+        with mock.patch("time.monotonic", return_value=time.monotonic() + 11):
+            policy.allow(1)
+        assert policy.state(1).circuit == CircuitState.HALF_OPEN
+        assert not policy.retries(1)
+        policy.on_failure(1)
+        assert policy.state(1).circuit == CircuitState.OPEN
+        policy.state(1).open_until = 0
+        policy.allow(1)
+        policy.on_response(1, 0.1, 0)
+        assert policy.state(1).circuit == CircuitState.CLOSED
+        assert not policy.state(1).failures
+        assert policy.retries(1) == 3
+
+    def test_half_open_probe(self):
+        """Test one probe is let through a half open circuit."""
+        policy = AdaptivePolicy(failure_threshold=1, reset_timeout=10)
+        policy.on_failure(1)
+        policy.state(1).open_until = 0
+        policy.check(1)
+        policy.allow(1)
+        assert policy.state(1).probe_in_flight
+        for call in (policy.check, policy.allow):
+            with pytest.raises(ModbusIOException, match="probe in flight"):
+                call(1)
+        policy.on_response(1, 0.1, 0)
+        assert not policy.state(1).probe_in_flight
+        policy.allow(1)
+        policy.state(1).circuit = CircuitState.OPEN
+        policy.state(1).open_until = 0
+        policy.allow(1)
+        with mock.patch("time.monotonic", return_value=time.monotonic() + 11):
+            policy.allow(1)  # probe without result is replaced
+        policy.on_failure(1)
+        assert not policy.state(1).probe_in_flight
+        with pytest.raises(ModbusIOException, match="circuit open"):
+            policy.allow(1)
+
+    def test_parameters(self):
+        """Test illegal parameters."""
+        with pytest.raises(ParameterException):
+            AdaptivePolicy(min_timeout=0)
+        with pytest.raises(ParameterException):
+            AdaptivePolicy(min_timeout=1, max_timeout=0.5)
+        with pytest.raises(ParameterException):
+            AdaptivePolicy(jitter=2)
+
+    async def test_client(self, use_port):
+        """Test async client learns timeouts and fails fast on dead slaves."""
+        context = ModbusServerContext(
+            slaves={1: ModbusSlaveContext(hr=ModbusSequentialDataBlock(0, list(range(10))), zero_mode=True)},
+            single=False,
+        )
+        server = ModbusTcpServer(context, address=(NULLMODEM_HOST, use_port), ignore_missing_slaves=True)
+        task = asyncio.create_task(server.serve_forever())
+        await asyncio.sleep(0.1)
+        client = AsyncModbusTcpClient(NULLMODEM_HOST, port=use_port, timeout=0.5, retries=1)
+        client.policy = AdaptivePolicy(min_timeout=0.02, backoff_base=0.01, failure_threshold=1)
+        assert client.policy.client is client
+        assert await client.connect()
+        for _ in range(3):
+            assert (await client.read_holding_registers(1, count=1, slave=1)).registers == [1]
+        assert client.policy.timeout(1, 0) < 0.5
+        start = time.monotonic()
+        assert (await client.read_holding_registers(1, count=1, slave=2)).isError()
+        assert client.policy.state(2).circuit == CircuitState.OPEN
+        with pytest.raises(ModbusIOException):
+            await client.read_holding_registers(1, count=1, slave=2)
+        assert time.monotonic() - start < 1.2
+        client.close()
+        await server.shutdown()
+        await task
+
+    async def test_client_half_open(self, use_port):
+        """Test concurrent requests to a half open circuit, only the probe is sent."""
+        context = ModbusServerContext(
+            slaves={1: ModbusSlaveContext(hr=ModbusSequentialDataBlock(0, list(range(10))), zero_mode=True)},
+            single=False,
+        )
+        server = ModbusTcpServer(context, address=(NULLMODEM_HOST, use_port), ignore_missing_slaves=True)
+        task = asyncio.create_task(server.serve_forever())
+        await asyncio.sleep(0.1)
+        client = AsyncModbusTcpClient(NULLMODEM_HOST, port=use_port, timeout=0.2, retries=1, max_in_flight=4)
+        client.policy = AdaptivePolicy(failure_threshold=1)
+        assert await client.connect()
+        assert (await client.read_holding_registers(1, count=1, slave=2)).isError()
+        assert client.policy.state(2).circuit == CircuitState.OPEN
+        client.policy.state(2).open_until = 0
+        with mock.patch.object(client.ctx, "send", wraps=client.ctx.send) as send:
+            results = await asyncio.gather(
+                *[client.read_holding_registers(1, count=1, slave=2) for _ in range(3)],
+                return_exceptions=True,
+            )
+        send.assert_called_once()
+        assert results[0].isError()
+        assert all(isinstance(result, ModbusIOException) for result in results[1:])
+        assert client.policy.state(2).circuit == CircuitState.OPEN
+        assert not client.policy.state(2).probe_in_flight
+        client.close()
+        await server.shutdown()
+        await task
@@ -0,0 +1,166 @@
+"""Test client poll group."""
+import asyncio
+import math
+
+import pytest
+
+from pymodbus_3p3v.client.mixin import ModbusClientMixin
+from pymodbus_3p3v.client.pollgroup import PollGroup, PollTable, PollTag
+from pymodbus_3p3v.datastore import ModbusSequentialDataBlock, ModbusSlaveContext
+from pymodbus_3p3v.exceptions import ParameterException
+from pymodbus_3p3v.pdu import ExceptionResponse, ModbusPDU
+from pymodbus_3p3v.pdu.register_read_message import ReadInputRegistersResponse
+
+
+DATATYPE = ModbusClientMixin.DATATYPE
+
+
+class AsyncDatastoreClient(ModbusClientMixin):
+    """Client executing requests directly on a datastore."""
+
+    def __init__(self):
+        """Initialize."""
+        super().__init__()
+        self.context = ModbusSlaveContext(
+            di=ModbusSequentialDataBlock(0, [True, False] * 1500),
+            co=ModbusSequentialDataBlock(0, [False, True] * 1500),
+            hr=ModbusSequentialDataBlock(0, list(range(3000))),
+            ir=ModbusSequentialDataBlock(0, list(range(1, 3001))),
+            zero_mode=True,
+        )
+        self.requests: list[ModbusPDU] = []
+
+    async def execute(self, _no_response_expected, request):
+        """Execute request."""
+        self.requests.append(request)
+        if request.slave_id != 1:
+            return ExceptionResponse(request.function_code, 0x0B)
+        return await request.update_datastore(self.context)
+
+
+class SyncClient(ModbusClientMixin):
+    """Client returning prepared responses."""
+
+    def __init__(self, responses):
+        """Initialize."""
+        super().__init__()
+        self.responses = responses
+
+    def execute(self, _no_response_expected, request):
+        """Execute request."""
+        return self.responses.pop(0)
+
+
+class TestPollGroup:
+    """Test poll group."""
+
+    def test_build_blocks(self):
+        """Test coalescing of tags."""
+        tags = [
+            PollTag(1, PollTable.HOLDING_REGISTERS, 10, DATATYPE.UINT16),
+            PollTag(1, PollTable.HOLDING_REGISTERS, 5, DATATYPE.FLOAT32),
+            PollTag(1, PollTable.HOLDING_REGISTERS, 15, DATATYPE.INT64),
+            PollTag(1, PollTable.HOLDING_REGISTERS, 40, DATATYPE.UINT16),
+            PollTag(2, PollTable.HOLDING_REGISTERS, 11, DATATYPE.UINT16),
+            PollTag(1, PollTable.INPUT_REGISTERS, 11, DATATYPE.UINT16),
+            PollTag(1, PollTable.HOLDING_REGISTERS, 11, DATATYPE.UINT16, period=5),
+        ]
+        blocks = PollGroup(tags, gap=5).blocks
+        assert [(b.slave, b.table, b.address, b.count, len(b.tags)) for b in blocks] == [
+            (1, PollTable.HOLDING_REGISTERS, 5, 14, 3),
+            (1, PollTable.HOLDING_REGISTERS, 40, 1, 1),
+            (2, PollTable.HOLDING_REGISTERS, 11, 1, 1),
+            (1, PollTable.INPUT_REGISTERS, 11, 1, 1),
+            (1, PollTable.HOLDING_REGISTERS, 11, 1, 1),
+        ]
+        assert len(PollGroup(tags, gap=0).blocks) == 7
+        assert len(PollGroup(tags, gap=25).blocks) == 4
+
+    @pytest.mark.parametrize(
+        ("table", "limit", "kwargs"),
+        [
+            (PollTable.HOLDING_REGISTERS, 125, {}),
+            (PollTable.INPUT_REGISTERS, 10, {"max_registers": 10}),
+            (PollTable.COILS, 2000, {}),
+            (PollTable.DISCRETE_INPUTS, 100, {"max_bits": 100}),
+        ],
+    )
+    def test_build_blocks_limit(self, table, limit, kwargs):
+        """Test blocks respect the request limits."""
+        tags = [PollTag(1, table, address, DATATYPE.UINT16) for address in range(3000)]
+        blocks = PollGroup(tags, **kwargs).blocks
+        assert max(block.count for block in blocks) == limit
+        assert len(blocks) == -(-3000 // limit)
+
+    def test_build_blocks_error(self):
+        """Test illegal tags/parameters."""
+        with pytest.raises(ParameterException):
+            PollGroup([PollTag(1, PollTable.HOLDING_REGISTERS, 0, DATATYPE.STRING)])
+        with pytest.raises(ParameterException):
+            PollGroup([PollTag(1, PollTable.HOLDING_REGISTERS, 0, DATATYPE.STRING, count=126)])
+        with pytest.raises(ParameterException):
+            PollGroup([], max_registers=126)
+        with pytest.raises(ParameterException):
+            PollGroup([], max_bits=0)
+
+    def test_due_blocks(self):
+        """Test scheduling of blocks."""
+        tags = [
+            PollTag(1, PollTable.COILS, 1, period=1.0),
+            PollTag(1, PollTable.COILS, 1, period=5.0),
+        ]
+        group = PollGroup(tags)
+        assert len(group.due_blocks(100.0)) == 2
+        assert not group.due_blocks(100.5)
+        assert group.next_due() == 101.0
+        assert len(group.due_blocks(101.0)) == 1
+        assert len(group.due_blocks(110.0)) == 2
+        assert group.next_due() == 111.0
+        group = PollGroup([])
+        assert not group.due_blocks(100.0)
+        assert group.next_due() == math.inf
+
+    async def test_async_poll(self):
+        """Test fan out of values."""
+        tags = [
+            PollTag(1, PollTable.HOLDING_REGISTERS, 10, DATATYPE.UINT16),
+            PollTag(1, PollTable.HOLDING_REGISTERS, 12, DATATYPE.UINT32),
+            PollTag(1, PollTable.HOLDING_REGISTERS, 16, DATATYPE.STRING, count=1),
+            PollTag(1, PollTable.HOLDING_REGISTERS, 20),
+            PollTag(1, PollTable.INPUT_REGISTERS, 7, DATATYPE.INT16),
+            PollTag(1, PollTable.COILS, 3),
+            PollTag(1, PollTable.COILS, 4),
+            PollTag(1, PollTable.DISCRETE_INPUTS, 5),
+            PollTag(2, PollTable.HOLDING_REGISTERS, 10, DATATYPE.UINT16),
+        ]
+        client = AsyncDatastoreClient()
+        group = PollGroup(tags, gap=10)
+        assert len(await group.async_poll(client)) == 5
+        assert len(client.requests) == 5
+        assert [tag.value for tag in tags] == [10, 12 * 65536 + 13, "\x00\x10", 20, 8, True, False, False, None]
+        assert tags[-1].error.isError()
+        assert not await group.async_poll(client, 0.0)
+
+    def test_poll(self):
+        """Test sync client."""
+        tags = [
+            PollTag(1, PollTable.INPUT_REGISTERS, 10, DATATYPE.INT16),
+            PollTag(1, PollTable.INPUT_REGISTERS, 11, DATATYPE.INT16),
+        ]
+        registers = ModbusClientMixin.convert_to_registers(-2, DATATYPE.INT16)
+        client = SyncClient([ReadInputRegistersResponse(registers * 2)])
+        group = PollGroup(tags)
+        assert len(group.poll(client)) == 1
+        assert [tag.value for tag in tags] == [-2, -2]
+
+    async def test_run(self):
+        """Test poll forever."""
+        tags = [PollTag(1, PollTable.HOLDING_REGISTERS, 10, DATATYPE.UINT16, period=0.01)]
+        client = AsyncDatastoreClient()
+        task = asyncio.create_task(PollGroup(tags).run(client))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert len(client.requests) > 2
+        assert tags[0].value == 10
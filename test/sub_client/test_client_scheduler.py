@@ -0,0 +1,124 @@
+"""Test client bus scheduler."""
+import asyncio
+from unittest import mock
+
+import pytest
+
+from pymodbus_3p3v.client import AdaptivePolicy, AsyncModbusSerialClient
+from pymodbus_3p3v.client.scheduler import BusScheduler
+from pymodbus_3p3v.datastore import (
+    ModbusSequentialDataBlock,
+    ModbusServerContext,
+    ModbusSlaveContext,
+)
+from pymodbus_3p3v.exceptions import ModbusIOException
+from pymodbus_3p3v.pdu.register_read_message import ReadHoldingRegistersRequest
+from pymodbus_3p3v.server import ModbusSerialServer
+from pymodbus_3p3v.transport import NULLMODEM_HOST
+
+
+class TestBusScheduler:
+    """Test bus scheduler."""
+
+    @staticmethod
+    @pytest.fixture(name="use_port")
+    def get_port_in_class(base_ports):
+        """Return next port."""
+        base_ports[__class__.__name__] += 1
+        return base_ports[__class__.__name__]
+
+    @staticmethod
+    @pytest.fixture(name="server")
+    async def prepare_server(use_port):
+        """Run a serial server with slave 1 (slave 2 does not respond)."""
+        context = ModbusServerContext(
+            slaves={1: ModbusSlaveContext(hr=ModbusSequentialDataBlock(0, list(range(100))), zero_mode=True)},
+            single=False,
+        )
+        server = ModbusSerialServer(context, port=f"{NULLMODEM_HOST}:{use_port}", ignore_missing_slaves=True)
+        task = asyncio.create_task(server.serve_forever())
+        await asyncio.sleep(0.1)
+        yield server
+        await server.shutdown()
+        await task
+
+    @staticmethod
+    @pytest.fixture(name="client")
+    async def prepare_client(server, use_port):
+        """Connect serial client."""
+        assert server
+        client = AsyncModbusSerialClient(f"{NULLMODEM_HOST}:{use_port}", baudrate=19200, timeout=0.2)
+        assert await client.connect()
+        yield client
+        client.close()
+
+    @pytest.mark.parametrize(
+        ("params", "char_time", "gap"),
+        [
+            ((19200, 8, "N", 1), 10 / 19200, 35 / 19200),
+            ((9600, 8, "E", 2), 12 / 9600, 42 / 9600),
+            ((115200, 8, "N", 1), 10 / 115200, 0.00175),
+            ((-1, -1, "", -1), 0.0, 0.0),
+        ],
+    )
+    def test_bus_timing(self, params, char_time, gap):
+        """Test character time and inter frame gap."""
+        assert BusScheduler.bus_timing(*params) == pytest.approx((char_time, gap))
+
+    async def test_requests(self, client):
+        """Test requests are sent with the client policy."""
+        client.policy = AdaptivePolicy(min_timeout=0.01)
+        bus = BusScheduler(client)
+        results = await asyncio.gather(*[bus.read_holding_registers(inx, count=2, slave=1) for inx in range(5)])
+        assert [result.registers for result in results] == [[inx, inx + 1] for inx in range(5)]
+        assert client.policy.state(1).rtt is not None
+        assert bus.stats.requests == bus.stats.responses == 5
+        assert bus.stats.utilisation > 0  # > 1 is possible on the nullmodem (no baudrate)
+        assert await bus.write_register(1, 0, slave=0, no_response_expected=True) is None
+        assert not bus._busy  # pylint: disable=protected-access
+
+    async def test_dead_slave(self, client):
+        """Test dead slave is retried and backed off by the client policy."""
+        client.policy = AdaptivePolicy(max_timeout=0.05, retries=1, backoff_base=0, failure_threshold=1, reset_timeout=0.1)
+        bus = BusScheduler(client)
+        with mock.patch.object(client.policy, "on_timeout", wraps=client.policy.on_timeout) as on_timeout:
+            result = await bus.read_holding_registers(0, count=1, slave=2)
+            assert result.isError()
+            assert not result.exception_code
+            assert on_timeout.call_count == 2
+            assert bus.stats.timeouts == 1
+            with pytest.raises(ModbusIOException, match="circuit open"):
+                await bus.read_holding_registers(0, count=1, slave=2)
+            assert bus.stats.rejected == 1
+            assert (await bus.read_holding_registers(0, count=1, slave=1)).registers == [0]
+            await asyncio.sleep(0.1)
+            assert (await bus.read_holding_registers(0, count=1, slave=2)).isError()
+            assert on_timeout.call_count == 3  # probe is not retried
+        assert bus.stats.timeouts == 2
+        assert not bus._busy  # pylint: disable=protected-access
+
+    async def test_priority_deadline(self, client):
+        """Test requests are sent by priority, deadline and arrival."""
+        bus = BusScheduler(client, priorities={5: -1})
+        order = []
+
+        async def transact(request, _no_response_expected):
+            """Record order."""
+            order.append(request.address)
+            await asyncio.sleep(0.01)
+
+        with mock.patch.object(bus, "_transact", side_effect=transact):
+            tasks = [
+                asyncio.create_task(bus.submit(ReadHoldingRegistersRequest(0, count=1, slave=1))),
+                asyncio.create_task(bus.submit(ReadHoldingRegistersRequest(1, count=1, slave=1), priority=2)),
+                asyncio.create_task(bus.submit(ReadHoldingRegistersRequest(2, count=1, slave=1), deadline=5)),
+                asyncio.create_task(bus.submit(ReadHoldingRegistersRequest(3, count=1, slave=1), deadline=1)),
+                asyncio.create_task(bus.submit(ReadHoldingRegistersRequest(4, count=1, slave=5))),
+                asyncio.create_task(bus.submit(ReadHoldingRegistersRequest(5, count=1, slave=1), deadline=0.001)),
+                asyncio.create_task(bus.submit(ReadHoldingRegistersRequest(6, count=1, slave=1))),
+            ]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert order == [0, 4, 3, 2, 6, 1]
+        assert isinstance(results[5], ModbusIOException)
+        assert bus.stats.expired == 1
+        assert not bus._busy  # pylint: disable=protected-access
@@ -0,0 +1,86 @@
+"""Test client register schema."""
+import math
+from array import array
+
+import pytest
+
+from pymodbus_3p3v.client.mixin import ModbusClientMixin
+from pymodbus_3p3v.client.schema import RegisterSchema
+from pymodbus_3p3v.constants import Endian
+from pymodbus_3p3v.exceptions import ParameterException
+from pymodbus_3p3v.payload import BinaryPayloadDecoder
+
+
+DATATYPE = ModbusClientMixin.DATATYPE
+REGISTERS = [0x4142, 0x0102, 0x8304, 0xF1F2, 0x4049, 0x0FDB, 0x1234, 0x5678, 0x6162, 0x6300]
+
+
+class TestRegisterSchema:
+    """Test register schema."""
+
+    @pytest.mark.parametrize(
+        "datatype",
+        [datatype for datatype in DATATYPE if datatype != DATATYPE.STRING],
+    )
+    def test_decode(self, datatype):
+        """Test decode equals convert_from_registers, including overlapping fields."""
+        size = datatype.value[1]
+        fields = [(offset, datatype) for offset in range(len(REGISTERS) - size + 1)]
+        fields.reverse()
+        values = RegisterSchema(fields).decode(REGISTERS)
+        for (offset, _), value in zip(fields, values):
+            expect = ModbusClientMixin.convert_from_registers(REGISTERS[offset : offset + size], datatype)
+            assert value == expect or (math.isnan(value) and math.isnan(expect))
+
+    def test_decode_mixed(self):
+        """Test decode of mixed fields, with gaps and strings."""
+        schema = RegisterSchema([
+            (8, DATATYPE.STRING, 2),
+            (0, DATATYPE.UINT16),
+            (4, DATATYPE.FLOAT32),
+            (3, DATATYPE.INT16),
+        ])
+        assert schema.size == 10
+        values = schema.decode(REGISTERS)
+        assert values[0] == "abc"
+        assert values[1] == 0x4142
+        assert values[2] == pytest.approx(3.1415927)
+        assert values[3] == -3598
+        assert schema.decode(array("H", REGISTERS)) == values
+
+    @pytest.mark.parametrize("word_order", [Endian.BIG, Endian.LITTLE])
+    @pytest.mark.parametrize("byte_order", [Endian.BIG, Endian.LITTLE])
+    def test_decode_order(self, word_order, byte_order):
+        """Test word/byte order equals BinaryPayloadDecoder."""
+        schema = RegisterSchema(
+            [(0, DATATYPE.UINT32), (2, DATATYPE.INT16), (3, DATATYPE.INT64), (8, DATATYPE.STRING, 2)],
+            word_order=word_order,
+            byte_order=byte_order,
+        )
+        decoder = BinaryPayloadDecoder.fromRegisters(REGISTERS, byteorder=byte_order, wordorder=word_order)
+        expect = [decoder.decode_32bit_uint(), decoder.decode_16bit_int(), decoder.decode_64bit_int(), "abc"]
+        assert schema.decode(REGISTERS) == expect
+        assert schema.decode(array("H", REGISTERS)) == expect
+
+    def test_errors(self):
+        """Test illegal schema/registers."""
+        with pytest.raises(ParameterException):
+            RegisterSchema([(0, DATATYPE.STRING)])
+        with pytest.raises(ParameterException):
+            RegisterSchema([(-1, DATATYPE.UINT16)])
+        with pytest.raises(ParameterException):
+            RegisterSchema([(9, DATATYPE.UINT32)]).decode(REGISTERS)
+        assert not RegisterSchema([]).decode(REGISTERS)
+
+    def test_decode_numpy(self):
+        """Test numpy output."""
+        pytest.importorskip("numpy")
+        schema = RegisterSchema([(0, DATATYPE.UINT16), (3, DATATYPE.INT16), (1, DATATYPE.UINT32), (3, DATATYPE.STRING, 2)])
+        records = schema.decode_numpy(REGISTERS[:5] * 3, names=["a", "b", "c", "d"])
+        assert len(records) == 3
+        assert list(records["a"]) == [0x4142] * 3
+        assert records[2].tolist() == (0x4142, -3598, 0x01028304, b"\xf1\xf2@I")
+        with pytest.raises(ParameterException):
+            schema.decode_numpy(REGISTERS[:6])
+        with pytest.raises(ParameterException):
+            RegisterSchema([(0, DATATYPE.STRING, 1)], word_order=Endian.LITTLE).decode_numpy(REGISTERS[:1])
@@ -1,5 +1,8 @@
 """Test client sync."""
+import os
 import socket
+import threading
+import time
 from itertools import count
 from unittest import mock
 
@@ -436,6 +439,47 @@ class TestSynchronousClient:  # pylint: disable=too-many-public-methods
         assert not reply_ok.isError()
         client.close()
 
+    @pytest.mark.skipif(not hasattr(os, "openpty"), reason="needs a pty")
+    def test_serial_client_recv_select(self):
+        """Test the serial client receives without polling (selectable port)."""
+        master, slave = os.openpty()
+        client = ModbusSerialClient(os.ttyname(slave), baudrate=115200, timeout=1)
+        assert client.connect()
+        assert client._fileno() is not None  # pylint: disable=protected-access
+
+        def respond(gap=0.001, frame=b'\x11\x03\x06\xAE\x41\x56\x52\x43\x40\x49\xAD'):
+            """Respond split in 2 parts."""
+            time.sleep(0.02)
+            os.write(master, frame[:4])
+            time.sleep(gap)
+            os.write(master, frame[4:])
+
+        for _ in range(3):
+            thread = threading.Thread(target=respond)
+            thread.start()
+            start = time.monotonic()
+            assert client.recv(11) == b'\x11\x03\x06\xAE\x41\x56\x52\x43\x40\x49\xAD'
+            assert time.monotonic() - start < 0.08
+            thread.join()
+        # a pause longer than 3.5 characters does not end a frame of known size.
+        for size in (11, None):
+            thread = threading.Thread(target=respond, args=(0.05,))
+            thread.start()
+            assert client.recv(size) == b'\x11\x03\x06\xAE\x41\x56\x52\x43\x40\x49\xAD'
+            thread.join()
+        # unknown function code, the frame ends with silence.
+        thread = threading.Thread(target=respond, args=(0.05, b'\x11\x55\x01\x02\x03'))
+        thread.start()
+        assert client.recv(None) == b'\x11\x55\x01\x02'
+        thread.join()
+        assert client.recv(None) == b'\x03'
+        start = time.monotonic()
+        assert client.recv(1) == b""
+        assert time.monotonic() - start >= 0.9
+        client.close()
+        os.close(slave)
+        os.close(master)
+
 
     def test_serial_client_repr(self):
         """Test serial client."""
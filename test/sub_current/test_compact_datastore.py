@@ -0,0 +1,78 @@
+"""Test compact datastore."""
+from array import array
+
+import pytest
+
+from pymodbus_3p3v.datastore import (
+    ModbusCompactDataBlock,
+    ModbusSequentialDataBlock,
+    ModbusSlaveContext,
+)
+from pymodbus_3p3v.pdu.bit_read_message import ReadCoilsRequest
+from pymodbus_3p3v.pdu.register_read_message import ReadHoldingRegistersRequest
+from pymodbus_3p3v.utilities import PackedBits
+
+
+def test_compact_registers():
+    """Test register datablock."""
+    block = ModbusCompactDataBlock(10, list(range(20)))
+    assert not block.bits
+    assert str(block) == "DataStore(20, 0)"
+    assert block.validate(10, 20)
+    assert not block.validate(9)
+    assert not block.validate(20, 11)
+    values = block.getValues(12, 3)
+    assert isinstance(values, array)
+    assert values == array("H", [2, 3, 4])
+    block.setValues(12, [0xFFFF, 7])
+    block.setValues(15, 8)
+    assert list(block.getValues(12, 4)) == [0xFFFF, 7, 4, 8]
+    assert list(block)[:3] == [(10, 0), (11, 1), (12, 0xFFFF)]
+    block.reset()
+    assert list(block.getValues(10, 20)) == [0] * 20
+    block.default(5, 3)
+    assert list(block.getValues(0, 5)) == [3] * 5
+
+
+def test_compact_empty():
+    """Test empty datablock defaults to registers."""
+    block = ModbusCompactDataBlock(0, [])
+    assert not block.bits
+    assert not block.validate(0)
+    assert ModbusCompactDataBlock(0, [], bits=True).bits
+
+
+def test_compact_bits():
+    """Test bit datablock."""
+    block = ModbusCompactDataBlock(0, [True, False, False] * 10)
+    assert block.bits
+    assert len(block.values) == 4
+    values = block.getValues(1, 5)
+    assert isinstance(values, PackedBits)
+    assert values == [False, False, True, False, False]
+    block.setValues(1, [True, True])
+    block.setValues(0, False)
+    assert block.getValues(0, 4) == [False, True, True, True]
+    block.reset()
+    assert block.getValues(0, 30) == [False] * 30
+    full = ModbusCompactDataBlock.create(bits=True)
+    assert len(full.values) == 8192
+    assert full.validate(0, 65536)
+    assert len(ModbusCompactDataBlock.create().values) == 65536
+
+
+@pytest.mark.parametrize("address", [0, 3, 8, 13])
+async def test_compact_responses(address):
+    """Test responses from a compact datablock are equal to a sequential datablock."""
+    registers = list(range(1000, 1050))
+    bits = [True, False, True, True, False] * 10
+    sequential = ModbusSlaveContext(
+        hr=ModbusSequentialDataBlock(0, registers), co=ModbusSequentialDataBlock(0, bits)
+    )
+    compact = ModbusSlaveContext(
+        hr=ModbusCompactDataBlock(0, registers), co=ModbusCompactDataBlock(0, bits)
+    )
+    for request in (ReadHoldingRegistersRequest(address, 17), ReadCoilsRequest(address, 17)):
+        expect = await request.update_datastore(sequential)
+        response = await request.update_datastore(compact)
+        assert response.encode() == expect.encode()
@@ -21,6 +21,37 @@ class TestLogging:
             Log.debug("test2")
             build_msg_mock.assert_called_once()
 
+    def test_debug_enabled(self):
+        """Verify that debug_enabled follows the level and switches debug off."""
+        with mock.patch.object(Log, "build_msg") as build_msg_mock:
+            Log.setLevel(logging.INFO)
+            assert not Log.debug_enabled
+            Log.setLevel(logging.DEBUG)
+            assert Log.debug_enabled
+            Log.debug_enabled = False
+            Log.debug("test")
+            build_msg_mock.assert_not_called()
+            Log.setLevel(logging.DEBUG)
+            Log.debug("test2")
+            build_msg_mock.assert_called_once()
+
+    def test_debug_enabled_refresh(self):
+        """Verify that debug_enabled is refreshed on request, not by the logging API."""
+        logger = logging.getLogger("pymodbus_3p3v")
+        level = logger.level
+        try:
+            Log.setLevel(logging.NOTSET)
+            logger.setLevel(logging.INFO)
+            Log.update_debug_enabled()
+            assert not Log.debug_enabled
+            logger.setLevel(logging.DEBUG)
+            assert not Log.debug_enabled
+            Log.update_debug_enabled()
+            assert Log.debug_enabled
+        finally:
+            logger.setLevel(level)
+            Log.update_debug_enabled()
+
     def test_log_simple(self):
         """Test simple string."""
         txt = "simple string"
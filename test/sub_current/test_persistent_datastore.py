@@ -0,0 +1,125 @@
+"""Test persistent datastore."""
+import os
+import time
+from unittest import mock
+
+import pytest
+
+from pymodbus_3p3v.datastore import ModbusPersistentDataBlock
+from pymodbus_3p3v.exceptions import ParameterException
+
+
+def test_persistent_restart(tmp_path):
+    """Test values survive close/open."""
+    path = str(tmp_path / "hr.dat")
+    with pytest.raises(ParameterException):
+        ModbusPersistentDataBlock(path)
+    block = ModbusPersistentDataBlock(path, 10, list(range(20)))
+    block.setValues(12, [0xFFFF, 7])
+    block.close()
+    block = ModbusPersistentDataBlock(path, 0, [1, 2])
+    assert (block.address, block.count, block.bits) == (10, 20, False)
+    assert list(block.getValues(11, 3)) == [1, 0xFFFF, 7]
+    other = ModbusPersistentDataBlock(path)
+    other.setValues(10, [5])
+    assert block.getValues(10, 1)[0] == 5
+    other.close()
+    block.unlink()
+    assert not os.path.exists(path)
+
+
+def test_persistent_bits(tmp_path):
+    """Test bit datablock."""
+    path = str(tmp_path / "co.dat")
+    block = ModbusPersistentDataBlock(path, 0, [False] * 20, flush_interval=0)
+    block.setValues(3, [True, True])
+    block.close()
+    block = ModbusPersistentDataBlock(path)
+    assert block.bits
+    assert list(block.getValues(2, 4)) == [False, True, True, False]
+    block.unlink()
+
+
+def wait_for(check, timeout=2.0):
+    """Wait for timer thread."""
+    deadline = time.monotonic() + timeout
+    while not check() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return check()
+
+
+def damage(path, offset=ModbusPersistentDataBlock.HEADER.size):
+    """Flip a value byte in the file."""
+    with open(path, "r+b") as file:
+        file.seek(offset)
+        value = file.read(1)[0]
+        file.seek(offset)
+        file.write(bytes([value ^ 0xFF]))
+
+
+def test_persistent_snapshot(tmp_path):
+    """Test snapshot and restore of damaged file."""
+    path = str(tmp_path / "hr.dat")
+    block = ModbusPersistentDataBlock(path, 0, [1] * 10, snapshot_interval=0)
+    block.setValues(0, [2])
+    assert wait_for(lambda: os.path.exists(block.snapshot_path))
+    block.snapshot_interval = None
+    block.setValues(0, [3])
+    block._sequence[0] += 1  # pylint: disable=protected-access
+    block.close()
+    block = ModbusPersistentDataBlock(path)
+    assert list(block.getValues(0, 2)) == [2, 1]
+    block.close()
+    damage(path)
+    block = ModbusPersistentDataBlock(path)
+    assert list(block.getValues(0, 2)) == [2, 1]
+    block.close()
+    with open(path, "wb") as file:
+        file.write(b"garbage")
+    block = ModbusPersistentDataBlock(path)
+    assert list(block.getValues(0, 2)) == [2, 1]
+    block.unlink()
+    assert not os.path.exists(block.snapshot_path)
+    with open(path, "wb") as file:
+        file.write(b"garbage")
+    with pytest.raises(ParameterException):
+        ModbusPersistentDataBlock(path)
+
+
+def test_persistent_timer(tmp_path):
+    """Test flush/snapshot run in a timer, not in setValues."""
+    path = str(tmp_path / "hr.dat")
+    block = ModbusPersistentDataBlock(path, 0, [1] * 10, flush_interval=0.1, snapshot_interval=0.1)
+    with mock.patch.object(block.shm, "flush") as flush, mock.patch("os.fsync") as fsync:
+        for value in range(5):
+            block.setValues(0, [value])
+        flush.assert_not_called()
+        fsync.assert_not_called()
+        assert wait_for(lambda: flush.called and fsync.called)
+        time.sleep(0.2)
+        flush.assert_called_once()
+        fsync.assert_called_once()
+    block.unlink()
+
+
+def test_persistent_crc(tmp_path):
+    """Test damaged values (crc) without snapshot."""
+    path = str(tmp_path / "hr.dat")
+    block = ModbusPersistentDataBlock(path, 0, [1] * 10)
+    block.setValues(0, [2])
+    block.close()
+    damage(path)
+    block = ModbusPersistentDataBlock(path, 0, [7] * 4)
+    assert (block.count, list(block.getValues(0, 2))) == (4, [7, 7])
+    block.close()
+    damage(path)
+    block = ModbusPersistentDataBlock(path)
+    assert list(block.getValues(0, 2)) == [0xF8, 7]
+    block.close()
+    block = ModbusPersistentDataBlock(path)
+    assert list(block.getValues(0, 2)) == [0xF8, 7]
+    block.setValues(0, [8])
+    other = ModbusPersistentDataBlock(path)  # open before close, as after a crash
+    assert list(other.getValues(0, 2)) == [8, 7]
+    other.close()
+    block.unlink()
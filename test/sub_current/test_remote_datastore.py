@@ -1,11 +1,16 @@
 """Test remote datastore."""
-
+import asyncio
 from unittest import mock
 
 import pytest
 
-from pymodbus_3p3v.datastore.remote import RemoteSlaveContext
-from pymodbus_3p3v.exceptions import NotImplementedException
+from pymodbus_3p3v.client.mixin import ModbusClientMixin
+from pymodbus_3p3v.datastore import ModbusSequentialDataBlock, ModbusSlaveContext
+from pymodbus_3p3v.datastore.remote import AsyncRemoteSlaveContext, RemoteSlaveContext
+from pymodbus_3p3v.exceptions import (
+    ModbusIOException,
+    NotImplementedException,
+)
 from pymodbus_3p3v.pdu import ExceptionResponse
 from pymodbus_3p3v.pdu.bit_read_message import ReadCoilsResponse
 from pymodbus_3p3v.pdu.bit_write_message import WriteMultipleCoilsResponse
@@ -107,3 +112,148 @@ class TestRemoteDataStore:
 
         result = context.validate(3, 0, 10)
         assert result
+
+
+class AsyncDatastoreClient(ModbusClientMixin):
+    """Client executing requests on a datastore (after a loop iteration)."""
+
+    def __init__(self):
+        """Initialize."""
+        super().__init__()
+        self.context = ModbusSlaveContext(
+            co=ModbusSequentialDataBlock(0, [False] * 300),
+            hr=ModbusSequentialDataBlock(0, list(range(300))),
+            zero_mode=True,
+        )
+        self.requests: list = []
+
+    async def execute(self, _no_response_expected, request):
+        """Execute request."""
+        self.requests.append(request)
+        await asyncio.sleep(0)
+        if request.slave_id != 1:
+            return ExceptionResponse(request.function_code, 0x0B)
+        return await request.update_datastore(self.context)
+
+
+class SlowReadClient(AsyncDatastoreClient):
+    """Client delaying read responses until released."""
+
+    def __init__(self):
+        """Initialize."""
+        super().__init__()
+        self.release = asyncio.Event()
+
+    async def execute(self, _no_response_expected, request):
+        """Execute request, hold read response."""
+        response = await super().execute(_no_response_expected, request)
+        if request.function_code == 3:
+            await self.release.wait()
+        return response
+
+
+class TestAsyncRemoteDataStore:
+    """Unittest for AsyncRemoteSlaveContext."""
+
+    async def test_async_remote_coalesce(self):
+        """Test concurrent identical reads are sent once."""
+        client = AsyncDatastoreClient()
+        context = AsyncRemoteSlaveContext(client)
+        results = await asyncio.gather(*[context.async_getValues(3, 10, 3) for _ in range(5)])
+        assert results == [[10, 11, 12]] * 5
+        assert len(client.requests) == 1
+        assert await context.async_getValues(1, 0, 3) == [False] * 3
+        assert await context.async_getValues(3, 10, 3) == [10, 11, 12]
+        assert len(client.requests) == 3
+        with pytest.raises(NotImplementedException):
+            context.getValues(3, 10, 3)
+
+    async def test_async_remote_cache(self):
+        """Test read cache."""
+        client = AsyncDatastoreClient()
+        context = AsyncRemoteSlaveContext(client, cache_ttl=10)
+        assert await context.async_getValues(3, 10, 3) == [10, 11, 12]
+        assert await context.async_getValues(3, 10, 3) == [10, 11, 12]
+        assert len(client.requests) == 1
+        await context.async_setValues(16, 11, [99])
+        assert await context.async_getValues(3, 10, 3) == [10, 99, 12]
+        assert len(client.requests) == 3
+        context.reset()
+        assert await context.async_getValues(3, 10, 3) == [10, 99, 12]
+        assert len(client.requests) == 4
+
+    async def test_async_remote_stale_read(self):
+        """Test read sent before a write is neither cached nor shared."""
+        client = SlowReadClient()
+        context = AsyncRemoteSlaveContext(client, cache_ttl=10)
+        before = asyncio.create_task(context.async_getValues(3, 10, 3))
+        await asyncio.sleep(0.01)
+        await context.async_setValues(16, 11, [99])
+        after = asyncio.create_task(context.async_getValues(3, 10, 3))
+        await asyncio.sleep(0.01)
+        client.release.set()
+        assert await before == [10, 11, 12]
+        assert await after == [10, 99, 12]
+        assert await context.async_getValues(3, 10, 3) == [10, 99, 12]
+        assert [req.function_code for req in client.requests] == [3, 16, 3]
+
+    async def test_async_remote_batch_writes(self):
+        """Test adjacent writes are batched."""
+        client = AsyncDatastoreClient()
+        context = AsyncRemoteSlaveContext(client)
+        await asyncio.gather(
+            context.async_setValues(16, 10, [1, 2]),
+            context.async_setValues(16, 12, [3]),
+            context.async_setValues(16, 11, [4, 5]),
+            context.async_setValues(16, 20, [6]),
+            context.async_setValues(15, 5, [True, True]),
+        )
+        assert sorted((req.function_code, req.address) for req in client.requests) == [(15, 5), (16, 10), (16, 20)]
+        assert list(client.context.getValues(3, 10, 4)) == [1, 4, 5, 13]
+        await context.async_setValues(6, 7, [70])
+        assert await context.async_getValues(6, 7, 1) == [70]
+        assert client.requests[-1].function_code == 6
+        values = list(range(200))
+        await asyncio.gather(context.async_setValues(16, 0, values[:100]), context.async_setValues(16, 100, values[100:]))
+        assert [req.count for req in client.requests[-2:]] == [123, 77]
+        assert list(client.context.getValues(3, 0, 200)) == values
+
+    @pytest.mark.parametrize("sending", [False, True])
+    async def test_async_remote_flush_cancel(self, sending):
+        """Test writes fail when the flush is cancelled (while delayed or sending)."""
+        client = SlowWriteClient()
+        context = AsyncRemoteSlaveContext(client, write_delay=0 if sending else 10)
+        first = asyncio.create_task(context.async_setValues(16, 10, [1]))
+        await asyncio.sleep(0.01)
+        second = asyncio.create_task(context.async_setValues(16, 20, [2]))
+        await asyncio.sleep(0.01)
+        assert len(client.requests) == sending
+        context._flush_tasks["h"].cancel()  # pylint: disable=protected-access
+        results = await asyncio.gather(first, second, return_exceptions=True)
+        assert all(isinstance(result, ModbusIOException) for result in results)
+        assert not context._flush_tasks  # pylint: disable=protected-access
+        assert not context._writes  # pylint: disable=protected-access
+
+    async def test_async_remote_errors(self):
+        """Test error responses."""
+        client = AsyncDatastoreClient()
+        context = AsyncRemoteSlaveContext(client, slave=2)
+        results = await asyncio.gather(
+            *[context.async_getValues(3, 10, 3) for _ in range(2)], return_exceptions=True
+        )
+        assert all(isinstance(result, ModbusIOException) for result in results)
+        with pytest.raises(ModbusIOException):
+            await context.async_setValues(16, 10, [1])
+        with pytest.raises(ValueError, match="non-write"):
+            await context.async_setValues(3, 10, [1])
+
+
+class SlowWriteClient(AsyncDatastoreClient):
+    """Client never answering writes."""
+
+    async def execute(self, _no_response_expected, request):
+        """Execute request, hold write response."""
+        if request.function_code == 16:
+            self.requests.append(request)
+            await asyncio.Event().wait()
+        return await super().execute(_no_response_expected, request)
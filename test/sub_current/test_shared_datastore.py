@@ -0,0 +1,114 @@
+"""Test shared memory datastore."""
+import multiprocessing
+import pickle
+from array import array
+from multiprocessing import shared_memory
+
+import pytest
+
+from pymodbus_3p3v.datastore import ModbusSharedMemoryDataBlock
+from pymodbus_3p3v.exceptions import ModbusIOException, ParameterException
+
+
+def test_shared_registers():
+    """Test register datablock."""
+    block = ModbusSharedMemoryDataBlock(10, list(range(20)))
+    other = ModbusSharedMemoryDataBlock.attach(block.name)
+    assert not other.owner
+    assert (other.address, other.count, other.bits) == (10, 20, False)
+    values = block.getValues(12, 3)
+    assert isinstance(values, array)
+    assert values == array("H", [2, 3, 4])
+    other.setValues(12, [0xFFFF, 7])
+    assert list(block.getValues(12, 3)) == [0xFFFF, 7, 4]
+    values[0] = 99
+    assert block.getValues(12, 1)[0] == 0xFFFF
+    block.reset()
+    assert list(other.getValues(10, 20)) == [0] * 20
+    with pytest.raises(ParameterException):
+        block.default(30)
+    other.close()
+    block.unlink()
+
+
+def test_shared_bits():
+    """Test bit datablock."""
+    block = ModbusSharedMemoryDataBlock(0, [True, False] * 10)
+    assert block.bits
+    other = pickle.loads(pickle.dumps(block))  # noqa: S301
+    other.setValues(1, [True, True])
+    assert list(block.getValues(0, 4)) == [True, True, True, False]
+    other.close()
+    block.unlink()
+
+
+def test_shared_attach_error():
+    """Test attach to a segment that is not a datastore."""
+    shm = shared_memory.SharedMemory(create=True, size=100)
+    with pytest.raises(ParameterException):
+        ModbusSharedMemoryDataBlock.attach(shm.name)
+    shm.close()
+    shm.unlink()
+
+
+def test_shared_seqlock():
+    """Test sequence is updated by writes, and reads wait for writes to finish."""
+    block = ModbusSharedMemoryDataBlock(0, [0] * 10)
+    sequence = block.sequence
+    assert not sequence & 1
+    block.setValues(0, [1])
+    assert block.sequence == sequence + 2
+    block._sequence[0] += 1  # pylint: disable=protected-access
+    block.READ_RETRIES = 10
+    with pytest.raises(ModbusIOException):
+        block.getValues(0, 1)
+    block._sequence[0] += 1  # pylint: disable=protected-access
+    assert list(block.getValues(0, 1)) == [1]
+    block.unlink()
+
+
+def _writer(name, loops):
+    """Write equal values to the full block."""
+    block = ModbusSharedMemoryDataBlock.attach(name)
+    for value in range(loops):
+        block.setValues(0, [value] * block.count)
+    block.close()
+
+
+def test_shared_external_writer():
+    """Test reads are consistent while another process writes."""
+    block = ModbusSharedMemoryDataBlock(0, [0] * 100)
+    process = multiprocessing.get_context("spawn").Process(target=_writer, args=(block.name, 20000))
+    process.start()
+    while process.is_alive():
+        values = block.getValues(0, 100)
+        assert values.count(values[0]) == 100
+    process.join()
+    assert block.getValues(0, 1)[0] == 19999
+    block.unlink()
+
+
+def _counter(name, address, loops):
+    """Write a counter to one address."""
+    block = ModbusSharedMemoryDataBlock.attach(name)
+    for value in range(1, loops + 1):
+        block.setValues(address, [value])
+    block.close()
+
+
+def test_shared_concurrent_writers():
+    """Test concurrent writers in several processes do not lose sequence updates."""
+    writers, loops = 4, 20000
+    block = ModbusSharedMemoryDataBlock(0, [0] * writers)
+    sequence = block.sequence
+    processes = [
+        multiprocessing.get_context("spawn").Process(target=_counter, args=(block.name, address, loops))
+        for address in range(writers)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    assert block.sequence == sequence + 2 * writers * loops
+    assert list(block.getValues(0, writers)) == [loops] * writers
+    block.unlink()
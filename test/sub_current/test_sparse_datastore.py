@@ -1,4 +1,5 @@
 """Test framers."""
+from unittest import mock
 
 import pytest
 
@@ -46,3 +47,33 @@ def test_check_sparsedatastore():
             assert datablock.validate(key, 1)
             assert datablock.getValues(key, 1) == [value]
             key += 1
+
+
+def test_sparsedatastore_index():
+    """Test address runs index."""
+    datablock = ModbusSparseDataBlock({10: [1, 2, 3], 13: 4, 20: [5, 6]}, mutable=True)
+    assert datablock._starts == [10, 20]  # pylint: disable=protected-access
+    assert datablock._ends == [14, 22]  # pylint: disable=protected-access
+    assert datablock.validate(10, 4)
+    assert not datablock.validate(10, 5)
+    assert not datablock.validate(9, 1)
+    assert not datablock.validate(14, 1)
+    assert datablock.validate(21, 1)
+    assert not datablock.validate(21, 2)
+    assert not datablock.validate(10, 0)
+    datablock.setValues(14, [7] * 6)
+    assert datablock.validate(10, 12)
+    assert datablock.getValues(13, 3) == [4, 7, 7]
+    datablock.setValues(30, [8])
+    datablock.setValues(5, [9, 9])
+    assert datablock._starts == [5, 10, 30]  # pylint: disable=protected-access
+    assert datablock._ends == [7, 22, 31]  # pylint: disable=protected-access
+    with mock.patch.object(datablock, "_build_index") as build_index:
+        datablock.setValues(0, {40: [1, 2], 31: 3, 8: [], 7: 4, 22: [5]})
+    build_index.assert_not_called()
+    assert datablock._starts == [5, 10, 30, 40]  # pylint: disable=protected-access
+    assert datablock._ends == [8, 23, 32, 42]  # pylint: disable=protected-access
+    datablock.reset()
+    assert not datablock.validate(14, 1)
+    assert not datablock.validate(30, 1)
+    assert datablock.validate(20, 2)
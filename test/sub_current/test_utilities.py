@@ -1,11 +1,17 @@
 """Test utilities."""
 import struct
+from array import array
+
+import pytest
 
 from pymodbus_3p3v.utilities import (
+    PackedBits,
     default,
     dict_property,
     pack_bitstring,
+    pack_registers,
     unpack_bitstring,
+    unpack_registers,
 )
 
 
@@ -90,3 +96,43 @@ class TestUtility:
         """Test all string <=> bit packing functions."""
         assert unpack_bitstring(b"\x55") == self.bits
         assert pack_bitstring(self.bits) == b"\x55"
+
+    def test_bit_packing_table(self):
+        """Test bit packing of all byte values and partial bytes."""
+        for value in range(256):
+            bits = [bool(value >> bit & 1) for bit in range(8)]
+            assert unpack_bitstring(bytes([value])) == bits
+            assert pack_bitstring(bits) == bytes([value])
+        assert pack_bitstring([1, 0, 1]) == b"\x05"
+        assert pack_bitstring([True] * 9) == b"\xff\x01"
+        assert pack_bitstring([2, None, "x"]) == b"\x05"
+        assert pack_bitstring([]) == b""
+        assert unpack_bitstring(memoryview(b"\x01\x80")) == [True] + [False] * 14 + [True]
+
+    def test_packed_bits(self):
+        """Test packed bits."""
+        bits = PackedBits.from_buffer(b"\x55\xaa", 1, 10)
+        assert len(bits) == 10
+        assert bits == [False, True, False, True, False, True, False, False, True, False]
+        assert bits[-1] is False
+        assert bits[1:4] == [True, False, True]
+        assert pack_bitstring(bits) == b"\x2a\x01"
+        assert bits == PackedBits(b"\x2a\x01", 10)
+        assert bits != PackedBits(b"\x2a\x00", 10)
+        assert str(bits) == str(list(bits))
+        with pytest.raises(IndexError):
+            bits[10]  # pylint: disable=pointless-statement
+
+    def test_register_packing(self):
+        """Test register <=> bytes packing functions."""
+        registers = list(range(0, 65536, 529))
+        data = b"".join(struct.pack(">H", register) for register in registers)
+        assert pack_registers(registers) == data
+        assert pack_registers(array("H", registers)) == data
+        assert pack_registers([]) == b""
+        assert unpack_registers(data) == registers
+        assert unpack_registers(memoryview(b"\x07" + data), 1, 3) == registers[:3]
+        with pytest.raises(struct.error):
+            pack_registers([65536])
+        with pytest.raises(struct.error):
+            unpack_registers(data, 1, len(registers))
@@ -4,6 +4,7 @@ This is a thorough test of the clientexamples.
 
 """
 import asyncio
+import json
 from threading import Thread
 from time import sleep
 from unittest import mock
@@ -19,6 +20,7 @@ from examples.client_custom_msg import main as main_custom_client
 from examples.client_payload import main as main_payload_calls
 from examples.datastore_simulator_share import main as main_datastore_simulator_share
 from examples.message_parser import main as main_parse_messages
+from examples.performance_client import main as main_performance_client
 from examples.server_async import setup_server
 from examples.server_callback import run_callback_server
 from examples.server_payload import main as main_payload_server
@@ -100,6 +102,38 @@ class TestExamples:
         print("waiting for fix")
 
 
+class TestPerformanceExamples:
+    """Test performance examples."""
+
+    @staticmethod
+    @pytest.fixture(name="use_port")
+    def get_port_in_class(base_ports):
+        """Return next port (the benchmark uses 6 ports)."""
+        base_ports[__class__.__name__] += 6
+        return base_ports[__class__.__name__]
+
+    def test_performance_client(self, use_port, tmp_path):
+        """Test client benchmark suite."""
+        output = tmp_path / "result.json"
+        baseline = main_performance_client([
+            "--requests", "8", "--registers", "10", "--concurrency", "1", "2",
+            "--in_flight", "1", "2", "--port", str(use_port), "--output", str(output),
+        ])
+        with open(output, encoding="utf-8") as file:
+            assert json.load(file) == baseline
+        names = [result["name"] for result in baseline["results"]]
+        assert "sync/tcp/socket/r10/c2/p1" in names
+        assert "async/nullmodem/socket/r10/c2/p2" in names
+        assert "sync/nullmodem/socket/r10/c1/p1" not in names
+        assert "async/udp/socket/r10/c1/p2" not in names
+        assert all(result["requests"] == 8 and not result["errors"] for result in baseline["results"])
+        report = main_performance_client([
+            "--requests", "4", "--clients", "async", "--transports", "nullmodem", "--registers", "1",
+            "--concurrency", "1", "--in_flight", "1", "--port", str(use_port), "--baseline", str(output),
+        ])
+        assert [result["name"] for result in report["results"]] == ["async/nullmodem/socket/r1/c1/p1"]
+
+
 @pytest.mark.parametrize(
     ("use_comm", "use_framer"),
     [
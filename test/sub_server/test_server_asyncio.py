@@ -9,14 +9,25 @@ from unittest import mock
 import pytest
 
 from pymodbus_3p3v import FramerType
+from pymodbus_3p3v.client import AsyncModbusTcpClient
 from pymodbus_3p3v.datastore import (
     ModbusSequentialDataBlock,
     ModbusServerContext,
     ModbusSlaveContext,
 )
+from pymodbus_3p3v.datastore.remote import AsyncRemoteSlaveContext
 from pymodbus_3p3v.device import ModbusDeviceIdentification
 from pymodbus_3p3v.exceptions import NoSuchSlaveException
-from pymodbus_3p3v.server import ModbusTcpServer, ModbusTlsServer, ModbusUdpServer
+from pymodbus_3p3v.pdu.register_read_message import ReadHoldingRegistersRequest
+from pymodbus_3p3v.server import (
+    GatewayLink,
+    ModbusGateway,
+    ModbusTcpServer,
+    ModbusTlsServer,
+    ModbusUdpServer,
+)
+from pymodbus_3p3v.server.async_io import ModbusServerRequestHandler
+from pymodbus_3p3v.transport import NULLMODEM_HOST
 
 
 _logger = logging.getLogger()
@@ -215,7 +226,7 @@ class TestAsyncioServer:
         BasicClient.data = b"\x01\x00\x00\x00\x00\x06\x01\x03\x00\x00\x00\x19"
         await self.start_server()
         with mock.patch(
-            "pymodbus.framer.FramerSocket.processIncomingFrame",
+            "pymodbus.framer.FramerSocket.processIncomingFrames",
             new_callable=mock.Mock,
         ) as process:
             await self.connect_server()
@@ -261,6 +272,19 @@ class TestAsyncioServer:
         await self.server.shutdown()
         self.server = None
 
+    async def test_async_tcp_server_bad_frame(self):
+        """Test a request before a bad frame is answered, the bad frame is rejected."""
+        await self.start_server()
+        handler = mock.Mock()
+        handler.framer = self.server.framer(self.server.decoder)
+        bad = b"\x02\x00\x00\x00\x00\x02\x01\x44"
+        data = TEST_DATA + bad + TEST_DATA[:3]
+        assert ModbusServerRequestHandler.process_frames(handler, data, None) == len(data)
+        handler.execute.assert_called_once()
+        assert handler.execute.call_args[0][0].transaction_id == 0x0100
+        handler.server_send.assert_called_once()
+        assert handler.server_send.call_args[0][0].isError()
+
     async def test_async_tcp_server_modbus_error(self):
         """Test sending garbage data on a TCP socket should drop the connection."""
         BasicClient.data = TEST_DATA
@@ -345,7 +369,7 @@ class TestAsyncioServer:
         BasicClient.done = asyncio.Future()
         await self.start_server(do_udp=True)
         with mock.patch(
-            "pymodbus.framer.FramerSocket.processIncomingFrame",
+            "pymodbus.framer.FramerSocket.processIncomingFrames",
             new_callable=lambda: mock.Mock(side_effect=Exception),
         ):
             # get the random server port pylint: disable=protected-access
@@ -361,9 +385,195 @@ class TestAsyncioServer:
         BasicClient.data = b"\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF"
         await self.start_server()
         with mock.patch(
-            "pymodbus.framer.FramerSocket.processIncomingFrame",
+            "pymodbus.framer.FramerSocket.processIncomingFrames",
             new_callable=lambda: mock.Mock(side_effect=Exception),
         ):
             await self.connect_server()
             await asyncio.wait_for(BasicClient.eof, timeout=0.1)
             # neither of these should timeout if the test is successful
+
+
+class AsyncSlaveContext(ModbusSlaveContext):
+    """Slave context suspending on every read."""
+
+    async def async_getValues(self, fc_as_hex, address, count=1):
+        """Get values after yielding to the loop."""
+        await asyncio.sleep(0)
+        return self.getValues(fc_as_hex, address, count)
+
+
+class TimeoutSlaveContext(ModbusSlaveContext):
+    """Slave context reading with a timeout (needs a task)."""
+
+    async def async_getValues(self, fc_as_hex, address, count=1):
+        """Get values with a timeout."""
+        async with asyncio.timeout(1):
+            await asyncio.sleep(0)
+        return self.getValues(fc_as_hex, address, count)
+
+
+class SuspendingRequest(ReadHoldingRegistersRequest):
+    """Request claiming to be inline safe, but suspending."""
+
+    async def update_datastore(self, context):
+        """Yield to the loop, then read."""
+        await asyncio.sleep(0)
+        return await super().update_datastore(context)
+
+
+class TestDirectDispatch:
+    """Test server with direct_dispatch."""
+
+    @staticmethod
+    @pytest.fixture(name="use_port")
+    def get_port_in_class(base_ports):
+        """Return next port."""
+        base_ports[__class__.__name__] += 2
+        return base_ports[__class__.__name__]
+
+    @pytest.mark.parametrize("slave_class", [ModbusSlaveContext, AsyncSlaveContext])
+    async def test_direct_dispatch(self, use_port, slave_class):
+        """Test requests are executed without handler task."""
+        context = ModbusServerContext(
+            slaves=slave_class(hr=ModbusSequentialDataBlock(0, list(range(100))), zero_mode=True),
+            single=True,
+        )
+        server = ModbusTcpServer(context, address=(NULLMODEM_HOST, use_port), direct_dispatch=True)
+        task = asyncio.create_task(server.serve_forever())
+        await asyncio.sleep(0.1)
+        client = AsyncModbusTcpClient(NULLMODEM_HOST, port=use_port, max_in_flight=4)
+        assert await client.connect()
+        handler = next(iter(server.active_connections.values()))
+        assert not handler.handler_task
+        results = await asyncio.gather(*[client.read_holding_registers(addr, count=2) for addr in range(4)])
+        assert [result.registers for result in results] == [[0, 1], [1, 2], [2, 3], [3, 4]]
+        assert not handler.execute_tasks
+        assert not handler.databuffer
+        result = await client.read_holding_registers(99, count=2)
+        assert result.isError()
+        client.close()
+        await server.shutdown()
+        await task
+
+    @pytest.mark.parametrize("inline_safe", [True, False])
+    async def test_direct_dispatch_suspend(self, use_port, inline_safe):
+        """Test a request suspending in direct dispatch is finished in a task."""
+        context = ModbusServerContext(
+            slaves=ModbusSlaveContext(hr=ModbusSequentialDataBlock(0, list(range(100))), zero_mode=True),
+            single=True,
+        )
+        server = ModbusTcpServer(context, address=(NULLMODEM_HOST, use_port), direct_dispatch=True)
+        server.decoder.register(SuspendingRequest)
+        task = asyncio.create_task(server.serve_forever())
+        await asyncio.sleep(0.1)
+        client = AsyncModbusTcpClient(NULLMODEM_HOST, port=use_port, max_in_flight=4)
+        assert await client.connect()
+        with mock.patch.object(SuspendingRequest, "inline_safe", inline_safe), mock.patch(
+            "pymodbus_3p3v.server.async_io.Log.warning"
+        ) as warning:
+            results = await asyncio.gather(*[client.read_holding_registers(addr, count=2) for addr in range(4)])
+        connected = client.connected
+        client.close()
+        assert [result.registers for result in results] == [[0, 1], [1, 2], [2, 3], [3, 4]]
+        assert connected
+        assert warning.called == inline_safe
+        await server.shutdown()
+        await task
+
+    async def test_queued_dispatch(self, use_port):
+        """Test without direct_dispatch stream data is decoded in the receive buffer."""
+        context = ModbusServerContext(
+            slaves=ModbusSlaveContext(hr=ModbusSequentialDataBlock(0, list(range(100))), zero_mode=True),
+            single=True,
+        )
+        server = ModbusTcpServer(context, address=(NULLMODEM_HOST, use_port))
+        task = asyncio.create_task(server.serve_forever())
+        await asyncio.sleep(0.1)
+        client = AsyncModbusTcpClient(NULLMODEM_HOST, port=use_port, max_in_flight=4)
+        assert await client.connect()
+        handler = next(iter(server.active_connections.values()))
+        results = await asyncio.gather(*[client.read_holding_registers(addr, count=2) for addr in range(4)])
+        assert [result.registers for result in results] == [[0, 1], [1, 2], [2, 3], [3, 4]]
+        assert not handler.recv_buffer
+        with mock.patch.object(handler, "execute") as execute:
+            handler.data_received(TEST_DATA + TEST_DATA[:3])
+            await asyncio.sleep(0.1)
+            execute.assert_called_once()
+            assert handler.recv_buffer == TEST_DATA[:3]
+            handler.data_received(TEST_DATA[3:])
+            await asyncio.sleep(0.1)
+            assert execute.call_count == 2
+            assert not handler.recv_buffer
+        assert not handler.databuffer
+        client.close()
+        await server.shutdown()
+        await task
+
+    @pytest.mark.parametrize("front", ["remote", "gateway", "timeout"])
+    async def test_direct_dispatch_async(self, use_port, front):
+        """Test requests to an async datastore/gateway are executed in a task.
+
+        The front server is reached over a socket, so data is received
+        outside any task (asyncio.timeout/wait_for need a task).
+        """
+        context = ModbusServerContext(
+            slaves=ModbusSlaveContext(hr=ModbusSequentialDataBlock(0, list(range(100))), zero_mode=True),
+            single=True,
+        )
+        device = ModbusTcpServer(context, address=(NULLMODEM_HOST, use_port))
+        device_task = asyncio.create_task(device.serve_forever())
+        downstream = AsyncModbusTcpClient(NULLMODEM_HOST, port=use_port)
+        front_context = {
+            "remote": lambda: ModbusServerContext(slaves=AsyncRemoteSlaveContext(downstream), single=True),
+            "gateway": lambda: ModbusGateway({1: GatewayLink([downstream])}),
+            "timeout": lambda: ModbusServerContext(
+                slaves=TimeoutSlaveContext(hr=ModbusSequentialDataBlock(0, list(range(100))), zero_mode=True),
+                single=True,
+            ),
+        }[front]()
+        server = ModbusTcpServer(front_context, address=(SERV_IP, use_port + 1), direct_dispatch=True)
+        server_task = asyncio.create_task(server.serve_forever())
+        await asyncio.sleep(0.1)
+        assert await downstream.connect()
+        client = AsyncModbusTcpClient(SERV_IP, port=use_port + 1, max_in_flight=4)
+        assert await client.connect()
+        assert not (await client.write_register(5, 555, slave=1)).isError()
+        results = await asyncio.gather(*[client.read_holding_registers(addr, count=2, slave=1) for addr in range(4, 6)])
+        assert [result.registers for result in results] == [[4, 555], [555, 6]]
+        client.close()
+        downstream.close()
+        await server.shutdown()
+        await device.shutdown()
+        await server_task
+        await device_task
+
+    @pytest.mark.parametrize("trace", [False, True])
+    async def test_request_pool(self, use_port, trace):
+        """Test answered requests are reused (not when traced)."""
+        context = ModbusServerContext(
+            slaves=ModbusSlaveContext(hr=ModbusSequentialDataBlock(0, list(range(100))), zero_mode=True),
+            single=True,
+        )
+        traced: list = []
+        server = ModbusTcpServer(
+            context,
+            address=(NULLMODEM_HOST, use_port),
+            direct_dispatch=True,
+            pool_size=2,
+            request_tracer=(lambda request, *_addr: traced.append(request)) if trace else None,
+        )
+        task = asyncio.create_task(server.serve_forever())
+        await asyncio.sleep(0.1)
+        client = AsyncModbusTcpClient(NULLMODEM_HOST, port=use_port, max_in_flight=4)
+        assert await client.connect()
+        results = await asyncio.gather(*[client.read_holding_registers(addr, count=2) for addr in range(4)])
+        assert [result.registers for result in results] == [[0, 1], [1, 2], [2, 3], [3, 4]]
+        assert (await client.read_holding_registers(5, count=1)).registers == [5]
+        if trace:
+            assert not server.decoder.pool.get(ReadHoldingRegistersRequest)
+            assert sorted(request.address for request in traced) == [0, 1, 2, 3, 5]
+        else:
+            assert 1 <= len(server.decoder.pool[ReadHoldingRegistersRequest]) <= 2
+        client.close()
+        await server.shutdown()
+        await task
@@ -0,0 +1,176 @@
+"""Test gateway server."""
+import asyncio
+
+import pytest
+
+from pymodbus_3p3v import FramerType
+from pymodbus_3p3v.client import AsyncModbusTcpClient
+from pymodbus_3p3v.client.mixin import ModbusClientMixin
+from pymodbus_3p3v.datastore import (
+    ModbusSequentialDataBlock,
+    ModbusServerContext,
+    ModbusSlaveContext,
+)
+from pymodbus_3p3v.exceptions import (
+    ConnectionException,
+    NoSuchSlaveException,
+    ParameterException,
+)
+from pymodbus_3p3v.pdu import ExceptionResponse
+from pymodbus_3p3v.pdu import ModbusExceptions as merror
+from pymodbus_3p3v.pdu.register_read_message import ReadHoldingRegistersRequest
+from pymodbus_3p3v.server import GatewayLink, ModbusGateway, ModbusTcpServer
+from pymodbus_3p3v.transport import NULLMODEM_HOST
+
+
+class FakeClient(ModbusClientMixin):
+    """Client recording the forwarded requests."""
+
+    def __init__(self, response=None, exc=None):
+        """Initialize."""
+        super().__init__()
+        self.max_in_flight = 1
+        self.response = response
+        self.exc = exc
+        self.requests: list = []
+        self.closed = False
+
+    async def connect(self):
+        """Connect."""
+        return True
+
+    def close(self):
+        """Close."""
+        self.closed = True
+
+    async def execute(self, no_response_expected, request):
+        """Execute request."""
+        self.requests.append(request)
+        request.transaction_id = 999
+        await asyncio.sleep(0)
+        if self.exc:
+            raise self.exc
+        if no_response_expected:
+            return None
+        return self.response or ExceptionResponse(request.function_code, merror.IllegalAddress)
+
+
+def build_request(slave, address, transaction_id=1):
+    """Build request."""
+    return ReadHoldingRegistersRequest(address, count=1, slave=slave, transaction=transaction_id)
+
+
+class TestGateway:
+    """Test gateway."""
+
+    @staticmethod
+    @pytest.fixture(name="use_port")
+    def get_port_in_class(base_ports):
+        """Return next port."""
+        base_ports[__class__.__name__] += 2
+        return base_ports[__class__.__name__]
+
+    async def test_fair_queue(self):
+        """Test requests are served round robin pr. upstream connection."""
+        client = FakeClient()
+        link = GatewayLink([client], name="bus")
+        gateway = ModbusGateway({1: link, 2: link})
+        requests = [("a", build_request(1, 1)), ("a", build_request(1, 2)), ("a", build_request(2, 3)), ("b", build_request(1, 4))]
+        responses = await asyncio.gather(*[gateway.forward(request, upstream) for upstream, request in requests])
+        assert [request.address for request in client.requests] == [1, 4, 2, 3]
+        assert [request.transaction_id for _, request in requests] == [1] * 4
+        assert all(response.exception_code == merror.IllegalAddress for response in responses)
+        metrics = gateway.metrics()["bus"]
+        assert metrics.requests == 4
+        assert not metrics.errors
+        assert metrics.max_queue_depth == 4
+        assert not metrics.queue_depth
+        assert metrics.latency_max >= metrics.latency_avg > 0
+        with pytest.raises(NoSuchSlaveException):
+            await gateway.forward(build_request(3, 1), "a")
+        assert await gateway.forward(build_request(0, 1), "a", broadcast=True) is None
+        assert len(client.requests) == 5
+        gateway.close()
+        assert client.closed
+
+    async def test_routes(self):
+        """Test routing and pool."""
+        clients = [FakeClient(), FakeClient()]
+        pool = GatewayLink(clients)
+        default = GatewayLink([FakeClient()], name="default")
+        gateway = ModbusGateway({1: pool}, default=default)
+        assert gateway[1] is pool
+        assert gateway[7] is default
+        assert 7 in gateway
+        assert gateway.slaves() == [1]
+        assert gateway.links == [pool, default]
+        async with gateway:
+            await asyncio.gather(*[gateway.forward(build_request(1, inx), inx) for inx in range(4)])
+            assert len(clients[0].requests) == 2
+            assert len(clients[1].requests) == 2
+        with pytest.raises(ParameterException):
+            GatewayLink([])
+
+    @pytest.mark.parametrize(
+        ("client", "code"),
+        [
+            (FakeClient(exc=ConnectionException("down")), merror.GatewayPathUnavailable),
+            (FakeClient(response=ExceptionResponse(3)), merror.GatewayNoResponse),
+            (FakeClient(exc=ValueError("bug")), merror.GatewayNoResponse),
+        ],
+    )
+    async def test_errors(self, client, code):
+        """Test downstream errors."""
+        link = GatewayLink([client])
+        response = await link.forward(build_request(1, 1), "a")
+        assert response.exception_code == code
+        assert link.metrics.errors == 1
+        client.exc = client.response = None
+        response = await link.forward(build_request(1, 2), "a")
+        assert response.exception_code == merror.IllegalAddress  # worker still running
+        link.close()
+
+    async def test_close(self):
+        """Test close fails waiting requests."""
+        link = GatewayLink([FakeClient()])
+        tasks = [asyncio.create_task(link.forward(build_request(1, inx), "a")) for inx in range(3)]
+        await asyncio.sleep(0)
+        link.close()
+        for task in tasks:
+            with pytest.raises(ConnectionException):
+                await task
+
+    async def test_gateway_server(self, use_port):
+        """Test tcp (socket framer) to rtu framer gateway."""
+        context = ModbusServerContext(
+            slaves=ModbusSlaveContext(hr=ModbusSequentialDataBlock(0, list(range(100))), zero_mode=True),
+            single=True,
+        )
+        device = ModbusTcpServer(context, framer=FramerType.RTU, address=(NULLMODEM_HOST, use_port))
+        device_task = asyncio.create_task(device.serve_forever())
+        gateway = ModbusGateway({
+            1: GatewayLink([AsyncModbusTcpClient(NULLMODEM_HOST, port=use_port, framer=FramerType.RTU)], name="rtu"),
+        })
+        server = ModbusTcpServer(gateway, address=(NULLMODEM_HOST, use_port + 1))
+        server_task = asyncio.create_task(server.serve_forever())
+        await asyncio.sleep(0.1)
+        assert await gateway.connect()
+        clients = [AsyncModbusTcpClient(NULLMODEM_HOST, port=use_port + 1, max_in_flight=4) for _ in range(2)]
+        for client in clients:
+            assert await client.connect()
+        await clients[0].write_register(5, 555, slave=1)
+        results = await asyncio.gather(*[client.read_holding_registers(4, count=3, slave=1) for client in clients])
+        assert [result.registers for result in results] == [[4, 555, 6]] * 2
+        result = await clients[1].read_holding_registers(4, count=3, slave=2)
+        assert result.exception_code == merror.GatewayNoResponse
+        assert gateway.metrics()["rtu"].requests == 3
+        assert gateway[1].clients[0].ctx.framer.decoder.lazy
+        client = AsyncModbusTcpClient(NULLMODEM_HOST, port=use_port)
+        assert not GatewayLink([client], lazy=False).clients[0].ctx.framer.decoder.lazy
+        for client in clients:
+            client.close()
+        gateway.close()
+        await server.shutdown()
+        await device.shutdown()
+        await server_task
+        await device_task
@@ -0,0 +1,115 @@
+"""Test multi process server."""
+import asyncio
+
+import pytest
+
+from pymodbus_3p3v.client import AsyncModbusTcpClient
+from pymodbus_3p3v.datastore import (
+    ModbusCompactDataBlock,
+    ModbusSequentialDataBlock,
+    ModbusServerContext,
+    ModbusSharedMemoryDataBlock,
+    ModbusSlaveContext,
+    ModbusSparseDataBlock,
+)
+from pymodbus_3p3v.exceptions import ParameterException
+from pymodbus_3p3v.server import ModbusMultiProcessTcpServer, ServerAsyncStop
+from pymodbus_3p3v.server.async_io import _serverList
+
+
+class TestMultiProcessServer:
+    """Test multi process server."""
+
+    @staticmethod
+    def build_context():
+        """Build context."""
+        return ModbusServerContext(
+            slaves=ModbusSlaveContext(
+                co=ModbusSequentialDataBlock(0, [False] * 16),
+                di=ModbusSparseDataBlock({0: [True] * 16}),
+                hr=ModbusSequentialDataBlock(0, list(range(100))),
+                ir=ModbusCompactDataBlock(0, list(range(10))),
+                zero_mode=True,
+            ),
+            single=True,
+        )
+
+    async def test_share_datastore(self):
+        """Test conversion to shared datablocks."""
+        context = self.build_context()
+        server = ModbusMultiProcessTcpServer(context, workers=2, share_datastore=True)
+        store = context[0].store
+        assert isinstance(store["c"], ModbusSharedMemoryDataBlock)
+        assert store["c"].bits
+        assert isinstance(store["d"], ModbusSparseDataBlock)
+        assert list(store["h"].getValues(0, 100)) == list(range(100))
+        assert list(store["i"].getValues(0, 10)) == list(range(10))
+        assert len(server.shared_blocks) == 3
+        await server.shutdown()
+        assert not server.shared_blocks
+
+    async def test_parameters(self):
+        """Test illegal parameters."""
+        with pytest.raises(ParameterException):
+            ModbusMultiProcessTcpServer(self.build_context(), workers=-1)
+
+    async def test_serve(self):
+        """Test workers serve requests, report stats and drain."""
+        context = self.build_context()
+        server = ModbusMultiProcessTcpServer(
+            context, workers=2, address=("127.0.0.1", 0), share_datastore=True, stats_interval=0.05
+        )
+        task = asyncio.create_task(_serverList.run(server, []))
+        await asyncio.sleep(0.5)
+        assert server.address[1]
+        assert len(server.processes) == 2
+        clients = [AsyncModbusTcpClient("127.0.0.1", port=server.address[1]) for _ in range(4)]
+        for client in clients:
+            assert await client.connect()
+        await clients[0].write_register(5, 555)
+        for client in clients:
+            assert (await client.read_holding_registers(5, count=1)).registers == [555]
+        assert list(context[0].getValues(3, 5, 1)) == [555]
+        await asyncio.sleep(0.2)
+        total = server.total()
+        assert total.requests == 5
+        assert total.connections == 4
+        assert total.running
+
+        stop_task = asyncio.create_task(ServerAsyncStop())
+        await asyncio.sleep(0.2)
+        assert not stop_task.done()
+        for client in clients:
+            client.close()
+        await stop_task
+        await task
+        assert not server.processes
+        assert not server.total().running
+        assert server.total().requests == 5
+
+    async def test_concurrent_writes(self):
+        """Test workers writing to the shared datastore concurrently."""
+        context = self.build_context()
+        server = ModbusMultiProcessTcpServer(context, workers=2, address=("127.0.0.1", 0), share_datastore=True)
+        block = context[0].store["h"]
+        sequence = block.sequence
+        task = asyncio.create_task(_serverList.run(server, []))
+        await asyncio.sleep(0.5)
+        clients = [AsyncModbusTcpClient("127.0.0.1", port=server.address[1]) for _ in range(4)]
+        for client in clients:
+            assert await client.connect()
+
+        async def write(client, address, loops):
+            """Write counter."""
+            for value in range(loops):
+                assert not (await client.write_register(address, value)).isError()
+
+        await asyncio.gather(*[write(client, address, 200) for address, client in enumerate(clients)])
+        assert block.sequence == sequence + 2 * 4 * 200
+        assert list(block.getValues(0, 4)) == [199] * 4
+        for client in clients:
+            assert (await client.read_holding_registers(0, count=4)).registers == [199] * 4
+        for client in clients:
+            client.close()
+        await ServerAsyncStop()
+        await task
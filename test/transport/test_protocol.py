@@ -128,6 +128,22 @@ class TestTransportProtocol1:
         client.data_received(test_data)
         assert not client.recv_buffer
 
+    async def test_data_received_retained_view(self, client):
+        """Test data_received, with callback_data keeping a view of the buffer."""
+        views = []
+
+        def callback_data(data, addr=None):  # pylint: disable=unused-argument
+            views.append(memoryview(data))
+            return 2
+
+        client.callback_data = callback_data
+        client.data_received(b"123456")
+        assert client.recv_buffer == b"3456"
+        client.data_received(b"789")
+        assert client.recv_buffer == b"56789"
+        assert bytes(views[0]) == b"123456"
+        assert bytes(views[1]) == b"3456789"
+
     async def test_datagram(self, client):
         """Test datagram_received()."""
         client.callback_data = mock.MagicMock()